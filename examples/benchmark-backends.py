@@ -0,0 +1,66 @@
+"""Comparison of the arithmetic backends on key generation, encryption, decryption and homomorphic operations.
+
+Usage:
+    python examples/benchmark-backends.py [--bits 1024 2048] [--count 50]
+"""
+
+import argparse
+import random
+import time
+
+from py_paillier import backend
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as KeyGen
+
+
+def measure(function, *args):
+    """Function for measuring the execution time of one call.
+
+    :return: (float) time in milliseconds
+    """
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark_backend(bit_key_length: int, count: int):
+    """Function for measuring the operations with the current backend.
+
+    :param bit_key_length: (int) key length in bits
+    :param count: (int) number of numbers per operation
+    :return: (dict) operation name -> average time of one operation in milliseconds
+    """
+    start = time.perf_counter()
+    public_key, private_key = KeyGen().paillier_key_pair_generation(bit_key_length)
+    results = {"keygen": (time.perf_counter() - start) * 1000}
+
+    homomorphic = Homomorphic(public_key.n, public_key.g)
+    plaintext = [random.randrange(public_key.n) for _ in range(count)]
+    encrypt_text = public_key.encryption(plaintext)
+
+    results["encrypt"] = measure(public_key.encryption, plaintext) / count
+    results["decrypt"] = measure(private_key.decryption, encrypt_text) / count
+    results["add"] = measure(homomorphic.addition_of_two_ciphertexts, encrypt_text, encrypt_text) / count
+    results["add plain"] = measure(homomorphic.addition_of_cipher_and_plaintext_via_g, encrypt_text, plaintext) / count
+    results["mul plain"] = measure(
+        homomorphic.raising_of_ciphertext_to_the_power_of_plaintext, encrypt_text, plaintext
+    ) / count
+    results["mul k"] = measure(homomorphic.raising_the_ciphertext_to_the_k_power, encrypt_text, 12345) / count
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=[1024, 2048])
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    for bits in args.bits:
+        print(f"\n{bits} bits, ms per operation")
+        table = {}
+        for name in sorted(backend.BACKENDS):
+            backend.set_backend(name)
+            table[name] = benchmark_backend(bits, args.count)
+        names = sorted(table)
+        print(f"{'operation':>10} " + " ".join(f"{name:>10}" for name in names))
+        for operation in table[names[0]]:
+            print(f"{operation:>10} " + " ".join(f"{table[name][operation]:>10.3f}" for name in names))
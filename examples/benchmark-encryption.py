@@ -0,0 +1,44 @@
+"""Per-ciphertext encryption latency for several key lengths.
+
+Usage:
+    python examples/benchmark-encryption.py [--bits 1024 2048 3072] [--count 50]
+"""
+
+import argparse
+import random
+import time
+
+from py_paillier.py_paillier import PaillierKeyPairGenerator as KeyGen
+
+
+def benchmark_encryption(bit_key_length: int, count: int):
+    """Function for measuring the average latency of one encryption.
+
+    :param bit_key_length: (int) key length in bits
+    :param count: (int) number of encrypted numbers
+    :return: (float, float) average latency in milliseconds with and without r
+    """
+    public_key, _ = KeyGen().paillier_key_pair_generation(bit_key_length)
+    plaintext = [random.randrange(public_key.n) for _ in range(count)]
+
+    start = time.perf_counter()
+    public_key.encryption(plaintext)
+    randomized = (time.perf_counter() - start) * 1000 / count
+
+    start = time.perf_counter()
+    public_key.encryption(plaintext, True)
+    deterministic = (time.perf_counter() - start) * 1000 / count
+
+    return randomized, deterministic
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=[1024, 2048, 3072])
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'bits':>6} {'encryption, ms':>16} {'without r, ms':>16}")
+    for bits in args.bits:
+        with_r, without_r = benchmark_encryption(bits, args.count)
+        print(f"{bits:>6} {with_r:>16.3f} {without_r:>16.3f}")
@@ -0,0 +1,39 @@
+"""Load time of serialized private keys compared with constructing them from p and q.
+
+Usage:
+    python examples/benchmark-serialization.py [--bits 1024 2048 3072] [--repeat 20]
+"""
+
+import argparse
+import time
+
+from py_paillier import serialization
+from py_paillier.py_paillier import PaillierPrivateKey, PaillierPublicKey
+from py_paillier.py_paillier import PaillierKeyPairGenerator as KeyGen
+
+
+def measure(function, repeat: int, *args):
+    """Function for measuring the average execution time of a call.
+
+    :return: (float) time in milliseconds
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=[1024, 2048, 3072])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'bits':>6} {'from p, q':>10} {'json':>10} {'json+pre':>10} {'binary':>10} {'binary+pre':>10}  (ms)")
+    for bits in args.bits:
+        public_key, private_key, p, q = KeyGen().paillier_key_pair_generation(bits, True)
+        columns = [measure(lambda: PaillierPrivateKey(PaillierPublicKey(p * q), p, q), args.repeat)]
+        for load, dump in [(serialization.loads, serialization.dumps), (serialization.from_bytes, serialization.to_bytes)]:
+            for include_precomputed in [False, True]:
+                columns.append(measure(load, args.repeat, dump(private_key, include_precomputed)))
+        print(f"{bits:>6} " + " ".join(f"{column:>10.3f}" for column in columns))
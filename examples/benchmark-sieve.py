@@ -0,0 +1,37 @@
+"""Benchmark of the segmented sieve of PrimeDigit: counting and listing primes up to large limits.
+
+Usage:
+    python examples/benchmark-sieve.py [--limits 1000000 100000000 1000000000] [--workers 1]
+"""
+
+import argparse
+import time
+
+from py_paillier.util import PrimeDigit
+
+
+def measure(function, *args):
+    """Function for measuring the execution time of one call.
+
+    :return: (object, float) result and time in seconds
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limits", type=int, nargs="+", default=[10 ** 6, 10 ** 7, 10 ** 8, 10 ** 9])
+    parser.add_argument("--workers", type=int, default=None, help="processes, by default the number of CPUs")
+    args = parser.parse_args()
+
+    print(f"{'limit':>12} {'primes':>12} {'count, s':>10} {'list, s':>10}")
+    for limit in args.limits:
+        count, count_seconds = measure(PrimeDigit.count_primes, limit, args.workers)
+        if limit <= 10 ** 8:
+            # listing keeps every prime as a Python int
+            _, list_seconds = measure(PrimeDigit.primes_in_range, 2, limit, args.workers)
+            print(f"{limit:>12} {count:>12} {count_seconds:>10.3f} {list_seconds:>10.3f}")
+        else:
+            print(f"{limit:>12} {count:>12} {count_seconds:>10.3f} {'-':>10}")
@@ -0,0 +1,256 @@
+"""asyncio interface of py_paillier.
+
+Large requests are split into chunks which run in an executor (the default executor of the loop unless
+another one is given), so the event loop stays responsive; cancelling the awaiting task cancels the chunks
+that have not started yet. RequestCoalescer joins concurrent small requests into shared batches.
+"""
+
+import asyncio
+import os
+from collections import deque
+
+from py_paillier.multiexp import tree_product
+from py_paillier.parallel import DEFAULT_CHUNK_SIZE, decrypt_chunk, dot_product_chunk, encrypt_chunk
+from py_paillier.parallel import split_into_chunks, summation_chunk
+from py_paillier.streaming import checked_chunks, iterate_chunks
+from py_paillier.util import check_plaintext
+from py_paillier.vector import obfuscate_reduction
+
+# default time in seconds a small request waits for others to share a batch
+DEFAULT_COALESCING_DELAY = 0.002
+
+
+async def map_chunks(key, function, chunks, executor=None, function_args: tuple = (), max_pending: int = None):
+    """Coroutine applying a chunk function to chunks in an executor.
+    The chunks are taken one by one between switches to the event loop, at most max_pending of them
+    are in the executor at once, so a lazy iterable of chunks is not read ahead of the executor.
+
+    :param key: PaillierPublicKey, PaillierPrivateKey or Homomorphic
+    :param function: module-level chunk function, e.g. encrypt_chunk
+    :param chunks: iterable of (list) input chunks
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param function_args: (tuple) optional, extra arguments of the chunk function
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * number of CPUs)
+    :return: (list) results of all chunks in input order
+    """
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1)
+    if max_pending < 1:
+        raise ValueError(f"The number of chunks in flight must be positive, got {max_pending}")
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    results = []
+    try:
+        for chunk in chunks:
+            pending.append(loop.run_in_executor(executor, function, key, chunk, *function_args))
+            if len(pending) >= max_pending:
+                results.extend(await pending.popleft())
+            else:
+                await asyncio.sleep(0)
+        while pending:
+            results.extend(await pending.popleft())
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    return results
+
+
+async def encrypt_async(public_key, plaintext_as_digits_list: [int], executor=None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, don_t_use_r: bool = False, validate: bool = True):
+    """Coroutine encrypting a list of unencrypted numbers in an executor chunk by chunk.
+
+    :param public_key: PaillierPublicKey
+    :param plaintext_as_digits_list: (list[int]) unencrypted numbers
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+    :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+    :return: (list[int]) encrypted numbers
+    :raises PlaintextError: if validate and some numbers do not belong to Z_n
+    """
+    if validate:
+        chunks = checked_chunks(plaintext_as_digits_list, public_key.n, chunk_size)
+    else:
+        chunks = iterate_chunks(plaintext_as_digits_list, chunk_size)
+    return await map_chunks(public_key, encrypt_chunk, chunks, executor, (don_t_use_r,))
+
+
+async def decrypt_async(private_key, encryption_digits_list: [int], executor=None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Coroutine decrypting a list of encrypted numbers in an executor chunk by chunk.
+
+    :param private_key: PaillierPrivateKey
+    :param encryption_digits_list: list [int] or EncryptedVector of encrypted numbers
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :return: (list[int]) decrypted numbers
+    """
+    return await map_chunks(private_key, decrypt_chunk, iterate_chunks(encryption_digits_list, chunk_size), executor)
+
+
+async def summation_async(homomorphic, encrypt_text, executor=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Coroutine for the encrypted sum of an encrypted text: partial sums of chunks in an executor,
+    then the sum of the partial sums.
+
+    :param homomorphic: Homomorphic
+    :param encrypt_text: (list [int] or EncryptedVector)
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :return: (int) encrypted sum, obfuscated once for an unobfuscated EncryptedVector
+    """
+    partial_sums = await map_chunks(homomorphic, summation_chunk, iterate_chunks(encrypt_text, chunk_size), executor)
+    return obfuscate_reduction(encrypt_text, tree_product(partial_sums, homomorphic.n_square))
+
+
+async def dot_product_async(homomorphic, encrypt_text, plaintext: [int], executor=None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Coroutine for the encrypted plaintext-weighted sum of an encrypted text by chunks in an executor.
+
+    :param homomorphic: Homomorphic
+    :param encrypt_text: (list [int] or EncryptedVector)
+    :param plaintext: (list [int]) unencrypted weights
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param chunk_size: (int) optional, number of pairs per chunk
+    :return: (int) encrypted sum of plaintext[i] * decrypted encrypt_text[i], obfuscated once
+             for an unobfuscated EncryptedVector
+    :raises ValueError: if the lengths are different
+    """
+    if len(encrypt_text) != len(plaintext):
+        raise ValueError(f"Got {len(encrypt_text)} encrypted numbers and {len(plaintext)} weights")
+    chunks = iterate_chunks(zip(encrypt_text, plaintext), chunk_size)
+    partial_sums = await map_chunks(homomorphic, dot_product_chunk, chunks, executor)
+    return obfuscate_reduction(encrypt_text, tree_product(partial_sums, homomorphic.n_square))
+
+
+class RequestCoalescer(object):
+    """Joiner of concurrent small requests of one event loop into shared batches.
+
+    A request waits at most max_delay seconds for others; a batch is sent to the executor as soon as
+    it has max_batch numbers. Requests of at least max_batch numbers are processed by chunks on their own.
+
+    Args:
+        :arg key: PaillierPublicKey or PaillierPrivateKey \n
+        :arg function: module-level chunk function, e.g. encrypt_chunk \n
+        :arg statistics (dict): numbers of requests, batches and items \n
+    """
+
+    def __init__(self, key, function, executor=None, max_batch: int = DEFAULT_CHUNK_SIZE,
+                 max_delay: float = DEFAULT_COALESCING_DELAY, function_args: tuple = (), limit: int = None):
+        """
+        :param key: PaillierPublicKey or PaillierPrivateKey
+        :param function: module-level chunk function, e.g. encrypt_chunk or decrypt_chunk
+        :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+        :param max_batch: (int) optional, number of numbers which sends a batch at once
+        :param max_delay: (float) optional, the longest wait of a request for others in seconds
+        :param function_args: (tuple) optional, extra arguments of the chunk function
+        :param limit: (int) optional, requests are checked to belong to Z_limit, e.g. n for encryption
+        """
+        if max_batch < 1:
+            raise ValueError(f"The batch size must be positive, got {max_batch}")
+        self.key = key
+        self.function = function
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.function_args = function_args
+        self.limit = limit
+        self.statistics = {"requests": 0, "batches": 0, "items": 0}
+        self.__requests = []
+        self.__count = 0
+        self.__timer = None
+
+    async def submit(self, digits_list: [int]):
+        """Coroutine processing one request, possibly in a batch with other requests.
+
+        :param digits_list: (list[int]) input numbers
+        :return: (list[int]) results in input order
+        :raises PlaintextError: if limit is set and some numbers do not belong to Z_limit
+        """
+        digits_list = list(digits_list)
+        if self.limit is not None:
+            check_plaintext(digits_list, self.limit)
+        self.statistics["requests"] += 1
+        self.statistics["items"] += len(digits_list)
+        if len(digits_list) >= self.max_batch:
+            self.statistics["batches"] += 1
+            chunks = split_into_chunks(digits_list, self.max_batch)
+            return await map_chunks(self.key, self.function, chunks, self.executor, self.function_args)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__requests.append((digits_list, future))
+        self.__count += len(digits_list)
+        if self.__count >= self.max_batch:
+            self.flush()
+        elif self.__timer is None:
+            self.__timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self):
+        """Function for sending the waiting requests to the executor at once.
+
+        :return: None
+        """
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        requests = [(digits_list, future) for digits_list, future in self.__requests if not future.done()]
+        self.__requests = []
+        self.__count = 0
+        if not requests:
+            return
+
+        self.statistics["batches"] += 1
+        batch = [digit for digits_list, _ in requests for digit in digits_list]
+        loop = asyncio.get_running_loop()
+        batch_future = loop.run_in_executor(self.executor, self.function, self.key, batch, *self.function_args)
+        batch_future.add_done_callback(lambda done: self.__distribute(done, requests))
+
+    @staticmethod
+    def __distribute(batch_future, requests: list):
+        """Helper function for splitting the result of a batch between its requests.
+
+        :param batch_future: (asyncio.Future) finished batch
+        :param requests: (list[tuple]) pairs of input numbers and the future of a request
+        :return: None
+        """
+        if batch_future.cancelled() or batch_future.exception() is not None:
+            error = asyncio.CancelledError() if batch_future.cancelled() else batch_future.exception()
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        results = batch_future.result()
+        start = 0
+        for digits_list, future in requests:
+            if not future.done():
+                future.set_result(results[start:start + len(digits_list)])
+            start += len(digits_list)
+
+
+def encryption_coalescer(public_key, executor=None, max_batch: int = DEFAULT_CHUNK_SIZE,
+                         max_delay: float = DEFAULT_COALESCING_DELAY, don_t_use_r: bool = False):
+    """Function for making a coalescer of encryption requests checked to belong to Z_n.
+
+    :param public_key: PaillierPublicKey
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param max_batch: (int) optional, number of numbers which sends a batch at once
+    :param max_delay: (float) optional, the longest wait of a request for others in seconds
+    :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+    :return: (RequestCoalescer)
+    """
+    return RequestCoalescer(public_key, encrypt_chunk, executor, max_batch, max_delay, (don_t_use_r,), public_key.n)
+
+
+def decryption_coalescer(private_key, executor=None, max_batch: int = DEFAULT_CHUNK_SIZE,
+                         max_delay: float = DEFAULT_COALESCING_DELAY):
+    """Function for making a coalescer of decryption requests.
+
+    :param private_key: PaillierPrivateKey
+    :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+    :param max_batch: (int) optional, number of numbers which sends a batch at once
+    :param max_delay: (float) optional, the longest wait of a request for others in seconds
+    :return: (RequestCoalescer)
+    """
+    return RequestCoalescer(private_key, decrypt_chunk, executor, max_batch, max_delay)
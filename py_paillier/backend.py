@@ -0,0 +1,192 @@
+"""Arithmetic backends for py_paillier.
+
+The backend is selected at import time: gmpy2 if it can be imported, pure Python otherwise.
+The choice can be forced by the environment variable PY_PAILLIER_BACKEND ("gmpy2" or "python")
+or at runtime by set_backend. All functions accept and return Python int, except to_number.
+"""
+
+import math
+import os
+
+from py_paillier.util import DEFAULT_MILLER_RABIN_ROUNDS, Euclid, PrimeDigit
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+BACKEND_ENVIRONMENT_VARIABLE = "PY_PAILLIER_BACKEND"
+
+
+class PythonBackend(object):
+    """Pure Python arithmetic based on the standard library and the helper functions of py_paillier.util"""
+
+    name = "python"
+
+    @staticmethod
+    def powmod(base: int, exponent: int, modulo: int):
+        """Function for calculating base ** exponent modulo modulo.
+
+        :param base: (int)
+        :param exponent: (int) non-negative power
+        :param modulo: (int) as modulo
+        :return: (int)
+        """
+        return pow(base, exponent, modulo)
+
+    @staticmethod
+    def invert(a: int, n: int):
+        """Function for calculating the reverse digit of a modulo n.
+
+        :param a: (int)
+        :param n: (int) as modulo
+        :return: (int) reverse digit from [0, n)
+        :raises ZeroDivisionError: if a is not coprime with n
+        """
+        return Euclid().reverse_digit(a, n)
+
+    @staticmethod
+    def gcd(a: int, b: int):
+        """Function for calculating the greatest common divisor.
+
+        :param a: (int)
+        :param b: (int)
+        :return: (int) greatest common divisor
+        """
+        # not Euclid.greatest_common_divisor, which dispatches to the current backend
+        return math.gcd(a, b)
+
+    @staticmethod
+    def is_prime(n: int, rounds: int = DEFAULT_MILLER_RABIN_ROUNDS):
+        """Function for checking simplicity by trial division and the Miller-Rabin test.
+
+        :param n: (int) digit for test
+        :param rounds: (int) optional, number of Miller-Rabin rounds
+        :return: (bool) probably prime (True) or composite (False)
+        """
+        return PrimeDigit().is_probable_prime(n, rounds)
+
+    @staticmethod
+    def to_number(n: int):
+        """Function for converting an integer to the fastest number type of the backend
+        for repeated arithmetic, e.g. in precomputed tables.
+
+        :param n: (int)
+        :return: int
+        """
+        return int(n)
+
+    @staticmethod
+    def next_prime(n: int):
+        """Function for finding the smallest prime greater than n.
+
+        :param n: (int)
+        :return: (int) prime
+        """
+        if n < 2:
+            return 2
+        digit = n + 1 if n % 2 == 0 else n + 2
+        while not PythonBackend.is_prime(digit):
+            digit += 2
+        return digit
+
+
+class Gmpy2Backend(object):
+    """GMP arithmetic through gmpy2"""
+
+    name = "gmpy2"
+
+    @staticmethod
+    def powmod(base: int, exponent: int, modulo: int):
+        """See PythonBackend.powmod"""
+        return int(gmpy2.powmod(base, exponent, modulo))
+
+    @staticmethod
+    def invert(a: int, n: int):
+        """See PythonBackend.invert"""
+        return int(gmpy2.invert(a, n))
+
+    @staticmethod
+    def gcd(a: int, b: int):
+        """See PythonBackend.gcd"""
+        return int(gmpy2.gcd(a, b))
+
+    @staticmethod
+    def is_prime(n: int, rounds: int = DEFAULT_MILLER_RABIN_ROUNDS):
+        """See PythonBackend.is_prime"""
+        return bool(gmpy2.is_prime(n, rounds))
+
+    @staticmethod
+    def to_number(n: int):
+        """See PythonBackend.to_number, returns gmpy2.mpz"""
+        return gmpy2.mpz(n)
+
+    @staticmethod
+    def next_prime(n: int):
+        """See PythonBackend.next_prime"""
+        return int(gmpy2.next_prime(n))
+
+
+BACKENDS = {PythonBackend.name: PythonBackend}
+if gmpy2 is not None:
+    BACKENDS[Gmpy2Backend.name] = Gmpy2Backend
+
+
+def select_backend(name: str = None):
+    """Function for choosing a backend by name.
+
+    :param name: (str) optional, "gmpy2" or "python" (by default the fastest available)
+    :return: backend class
+    :raises ValueError: if the backend is unknown or gmpy2 is not installed
+    """
+    if not name:
+        return Gmpy2Backend if gmpy2 is not None else PythonBackend
+    if name not in BACKENDS:
+        raise ValueError(f"Backend {name!r} is not available, choose one of {sorted(BACKENDS)}")
+    return BACKENDS[name]
+
+
+_backend = select_backend(os.environ.get(BACKEND_ENVIRONMENT_VARIABLE))
+
+
+def get_backend():
+    """Function for getting the current backend.
+
+    :return: backend class
+    """
+    return _backend
+
+
+def set_backend(name: str = None):
+    """Function for replacing the current backend.
+
+    :param name: (str) optional, "gmpy2" or "python" (by default the fastest available)
+    :return: previous backend class
+    """
+    global _backend
+    previous, _backend = _backend, select_backend(name)
+    return previous
+
+
+def powmod(base: int, exponent: int, modulo: int):
+    return _backend.powmod(base, exponent, modulo)
+
+
+def invert(a: int, n: int):
+    return _backend.invert(a, n)
+
+
+def gcd(a: int, b: int):
+    return _backend.gcd(a, b)
+
+
+def is_prime(n: int, rounds: int = DEFAULT_MILLER_RABIN_ROUNDS):
+    return _backend.is_prime(n, rounds)
+
+
+def next_prime(n: int):
+    return _backend.next_prime(n)
+
+
+def to_number(n: int):
+    return _backend.to_number(n)
@@ -0,0 +1,282 @@
+"""Benchmark suite of py_paillier: key generation, encryption, decryption and homomorphic operations.
+
+Every case is run several times; the report gives numbers per second, latency percentiles of one call
+and the peak memory of one call (measured by tracemalloc in a separate call).
+
+Usage:
+    python -m py_paillier.bench [--bits 1024 2048] [--batch 1 100] [--repeats 5] [--output result.json]
+    python -m py_paillier.bench --compare baseline.json result.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from py_paillier import backend
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as KeyGen
+
+BENCHMARK_FORMAT_VERSION = 1
+DEFAULT_BITS = (1024, 2048)
+DEFAULT_BATCHES = (1, 100)
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.1
+PERCENTILES = (50, 90, 99)
+# number of columns of the matrix in the vector_matrix_product case
+MATRIX_COLUMNS = 4
+
+
+def percentile(samples: [float], rank: int):
+    """Function for the nearest-rank percentile.
+
+    :param samples: (list[float]) measurements
+    :param rank: (int) percentile from [0, 100]
+    :return: (float)
+    """
+    ordered = sorted(samples)
+    index = max(0, -(-rank * len(ordered) // 100) - 1)
+    return ordered[index]
+
+
+def measure(function, repeats: int):
+    """Function for measuring the latency of repeated calls and the peak memory of one more call.
+
+    :param function: function without arguments
+    :param repeats: (int) number of measured calls
+    :return: (list[float], int) latencies in seconds and peak memory in bytes
+    """
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return latencies, peak_memory
+
+
+def make_result(name: str, bits: int, batch: int, latencies: [float], peak_memory: int):
+    """Function for summarizing the measurements of one case.
+
+    :param name: (str) operation
+    :param bits: (int) key length in bits
+    :param batch: (int) number of numbers per call
+    :param latencies: (list[float]) latencies of calls in seconds
+    :param peak_memory: (int) peak memory of one call in bytes
+    :return: (dict)
+    """
+    mean = sum(latencies) / len(latencies)
+    latency = {"mean": mean * 1000}
+    latency.update({f"p{rank}": percentile(latencies, rank) * 1000 for rank in PERCENTILES})
+    return {
+        "name": name,
+        "bits": bits,
+        "batch": batch,
+        "repeats": len(latencies),
+        "ops_per_second": batch / mean if mean > 0 else float("inf"),
+        "latency_ms": latency,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def operation_cases(public_key, private_key, batch: int):
+    """Function for making the measured calls for one key and batch size.
+
+    :param public_key: PaillierPublicKey
+    :param private_key: PaillierPrivateKey
+    :param batch: (int) number of numbers per call
+    :return: (dict) name -> function without arguments
+    """
+    homomorphic = Homomorphic(public_key.n, public_key.g)
+    plaintext = [random.randrange(public_key.n) for _ in range(batch)]
+    weights = [random.randrange(2 ** 32) for _ in range(batch)]
+    matrix = [[random.randrange(2 ** 32) for _ in range(MATRIX_COLUMNS)] for _ in range(batch)]
+    encrypt_text = public_key.encryption(plaintext)
+    return {
+        "encryption": lambda: public_key.encryption(plaintext),
+        "decryption": lambda: private_key.decryption(encrypt_text),
+        "addition_of_two_ciphertexts": lambda: homomorphic.addition_of_two_ciphertexts(encrypt_text, encrypt_text),
+        "addition_of_cipher_and_plaintext_via_g":
+            lambda: homomorphic.addition_of_cipher_and_plaintext_via_g(encrypt_text, plaintext),
+        "raising_of_ciphertext_to_the_power_of_plaintext":
+            lambda: homomorphic.raising_of_ciphertext_to_the_power_of_plaintext(encrypt_text, weights),
+        "raising_the_ciphertext_to_the_k_power":
+            lambda: homomorphic.raising_the_ciphertext_to_the_k_power(encrypt_text, 12345),
+        "addition": lambda: homomorphic.addition(encrypt_text, encrypt_text),
+        "subtraction": lambda: homomorphic.subtraction(encrypt_text, encrypt_text),
+        "negation": lambda: homomorphic.negation(encrypt_text),
+        "addition_of_plaintext": lambda: homomorphic.addition_of_plaintext(encrypt_text, plaintext),
+        "multiplication_by_plaintext": lambda: homomorphic.multiplication_by_plaintext(encrypt_text, weights),
+        "summation": lambda: homomorphic.summation(encrypt_text),
+        "dot_product": lambda: homomorphic.dot_product(encrypt_text, weights),
+        "vector_matrix_product": lambda: homomorphic.vector_matrix_product(encrypt_text, matrix),
+    }
+
+
+def run_benchmarks(bits_list=DEFAULT_BITS, batches=DEFAULT_BATCHES, repeats: int = DEFAULT_REPEATS,
+                   keygen_repeats: int = None, operations: [str] = None, log=None):
+    """Function for running the benchmark suite.
+
+    :param bits_list: (list[int]) key lengths in bits
+    :param batches: (list[int]) numbers of numbers per call
+    :param repeats: (int) number of measured calls of every operation
+    :param keygen_repeats: (int) optional, number of generated keys (by default repeats)
+    :param operations: (list[str]) optional, names of the measured operations ("keygen" included), all by default
+    :param log: optional, function printing a finished result, e.g. print_result
+    :return: (dict) report with "metadata" and "results"
+    """
+    results = []
+
+    def record(result):
+        results.append(result)
+        if log is not None:
+            log(result)
+
+    for bits in bits_list:
+        if operations is None or "keygen" in operations:
+            latencies, peak_memory = measure(
+                lambda: KeyGen().paillier_key_pair_generation(bits), keygen_repeats or repeats
+            )
+            record(make_result("keygen", bits, 1, latencies, peak_memory))
+
+        public_key, private_key = KeyGen().paillier_key_pair_generation(bits)
+        for batch in batches:
+            for name, function in operation_cases(public_key, private_key, batch).items():
+                if operations is None or name in operations:
+                    record(make_result(name, bits, batch, *measure(function, repeats)))
+
+    return {
+        "metadata": {
+            "version": BENCHMARK_FORMAT_VERSION,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "backend": backend.get_backend().name,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def print_result(result: dict, file=sys.stdout):
+    """Function for printing one result as a table row.
+
+    :param result: (dict) result of make_result
+    :param file: optional, text file-like object
+    :return: None
+    """
+    latency = result["latency_ms"]
+    print(
+        f"{result['name']:>48} {result['bits']:>6} {result['batch']:>6} {result['ops_per_second']:>12.1f} "
+        + " ".join(f"{latency[f'p{rank}']:>10.3f}" for rank in PERCENTILES)
+        + f" {result['peak_memory_bytes'] / 1024:>10.1f}",
+        file=file
+    )
+
+
+def print_header(file=sys.stdout):
+    """Function for printing the header of the result table.
+
+    :param file: optional, text file-like object
+    :return: None
+    """
+    print(
+        f"{'operation':>48} {'bits':>6} {'batch':>6} {'ops/s':>12} "
+        + " ".join(f"{f'p{rank} ms':>10}" for rank in PERCENTILES)
+        + f" {'peak KiB':>10}",
+        file=file
+    )
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD):
+    """Function for comparing two reports by the numbers per second of the common cases.
+
+    :param baseline: (dict) earlier report
+    :param current: (dict) new report
+    :param threshold: (float) optional, relative slowdown considered a regression, e.g. 0.1 for 10%
+    :return: (list[dict]) comparisons with name, bits, batch, baseline, current, ratio and regression
+    """
+    baseline_results = {(result["name"], result["bits"], result["batch"]): result for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        case = (result["name"], result["bits"], result["batch"])
+        if case not in baseline_results:
+            continue
+        before = baseline_results[case]["ops_per_second"]
+        after = result["ops_per_second"]
+        ratio = after / before if before else float("inf")
+        comparisons.append({
+            "name": case[0],
+            "bits": case[1],
+            "batch": case[2],
+            "baseline": before,
+            "current": after,
+            "ratio": ratio,
+            "regression": ratio < 1 - threshold,
+        })
+    return comparisons
+
+
+def print_comparisons(comparisons: [dict], file=sys.stdout):
+    """Function for printing comparisons as a table.
+
+    :param comparisons: (list[dict]) result of compare_reports
+    :param file: optional, text file-like object
+    :return: None
+    """
+    print(f"{'operation':>48} {'bits':>6} {'batch':>6} {'baseline':>12} {'current':>12} {'ratio':>7}", file=file)
+    for comparison in comparisons:
+        print(
+            f"{comparison['name']:>48} {comparison['bits']:>6} {comparison['batch']:>6} "
+            f"{comparison['baseline']:>12.1f} {comparison['current']:>12.1f} {comparison['ratio']:>7.3f}"
+            + ("  REGRESSION" if comparison["regression"] else ""),
+            file=file
+        )
+
+
+def main(arguments: [str] = None):
+    """Entry point of the command line interface.
+
+    :param arguments: (list[str]) optional, command line arguments (by default sys.argv)
+    :return: (int) exit code, 1 if compare mode found a regression
+    """
+    parser = argparse.ArgumentParser(prog="python -m py_paillier.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+", default=list(DEFAULT_BITS), help="key lengths in bits")
+    parser.add_argument("--batch", type=int, nargs="+", default=list(DEFAULT_BATCHES), help="numbers per call")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="measured calls per case")
+    parser.add_argument("--keygen-repeats", type=int, default=None, help="generated keys per key length")
+    parser.add_argument("--operations", nargs="+", default=None, help="measured operations, all by default")
+    parser.add_argument("--output", default=None, help="JSON file for the report")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), default=None,
+                        help="compare two JSON reports instead of running")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown considered a regression")
+    args = parser.parse_args(arguments)
+
+    if args.compare is not None:
+        reports = []
+        for path in args.compare:
+            with open(path) as file:
+                reports.append(json.load(file))
+        comparisons = compare_reports(*reports, args.threshold)
+        print_comparisons(comparisons)
+        return 1 if any(comparison["regression"] for comparison in comparisons) else 0
+
+    print_header()
+    report = run_benchmarks(args.bits, args.batch, args.repeats, args.keygen_repeats, args.operations, print_result)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
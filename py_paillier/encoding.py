@@ -0,0 +1,192 @@
+"""Encoding of signed integers and floating-point numbers into Z_n for py_paillier.
+
+A number x is stored as a pair (encoding, exponent) with x = mantissa * BASE ** exponent, where
+mantissa is a signed integer and encoding = mantissa mod n. Mantissas from [0, max_int] are positive,
+from [n - max_int, n) negative; the middle third of Z_n is left free to detect overflow after
+homomorphic operations - see [1].
+
+Links:
+    [1] - https://en.wikipedia.org/wiki/Two%27s_complement
+"""
+
+import math
+import sys
+from fractions import Fraction
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BASE = 16
+LOG2_BASE = 4
+FLOAT_MANTISSA_BITS = sys.float_info.mant_dig
+
+
+def max_int(n: int):
+    """Function for calculating the largest absolute value of an encodable mantissa.
+
+    :param n: (int) as modulo
+    :return: (int) n // 3
+    """
+    return n // 3
+
+
+def exponent_for(scalar, precision: float = None):
+    """Function for choosing the exponent which keeps a number exactly (integers, floats) or with a precision.
+
+    :param scalar: (int or float)
+    :param precision: (float) optional, the smallest difference to keep, e.g. 1e-6
+    :return: (int) exponent
+    """
+    if precision is not None:
+        return math.floor(math.log(precision, BASE))
+    if isinstance(scalar, int):
+        return 0
+    if scalar == 0:
+        return 0
+    # the lowest bit of the float mantissa
+    bin_lsb_exponent = math.frexp(scalar)[1] - FLOAT_MANTISSA_BITS
+    return min(0, math.floor(bin_lsb_exponent / LOG2_BASE))
+
+
+def decode_mantissa(n: int, encoding: int):
+    """Function for converting an encoding from Z_n back to a signed mantissa.
+
+    :param n: (int) as modulo
+    :param encoding: (int) number from Z_n
+    :return: (int) signed mantissa
+    :raises OverflowError: if the encoding is in the overflow zone
+    """
+    if encoding <= max_int(n):
+        return encoding
+    if encoding >= n - max_int(n):
+        return encoding - n
+    raise OverflowError("The encoded number overflowed the range of the key")
+
+
+class EncodedNumber(object):
+    """Signed integer or floating-point number encoded into Z_n.
+
+    Args:
+        :arg n (int): as modulo, part of public key \n
+        :arg encoding (int): mantissa modulo n \n
+        :arg exponent (int): power of BASE \n
+    """
+
+    def __init__(self, n: int, encoding: int, exponent: int):
+        self.n = n
+        self.encoding = encoding
+        self.exponent = exponent
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.encoding} * {BASE} ** {self.exponent}>"
+
+    @classmethod
+    def encode(cls, n: int, scalar, precision: float = None, max_exponent: int = None):
+        """Function for encoding a number.
+
+        :param n: (int) as modulo, part of public key
+        :param scalar: (int or float)
+        :param precision: (float) optional, the smallest difference to keep
+        :param max_exponent: (int) optional, upper bound of the exponent, e.g. to match another number
+        :return: (EncodedNumber)
+        :raises OverflowError: if the mantissa does not fit into the key
+        """
+        exponent = exponent_for(scalar, precision)
+        if max_exponent is not None:
+            exponent = min(exponent, max_exponent)
+        if isinstance(scalar, int) and exponent <= 0:
+            mantissa = scalar * BASE ** -exponent
+        else:
+            mantissa = round(Fraction(scalar) / Fraction(BASE) ** exponent)
+        if abs(mantissa) > max_int(n):
+            raise OverflowError(f"The number {scalar} does not fit into the key, |mantissa| > n // 3")
+        return cls(n, mantissa % n, exponent)
+
+    def mantissa(self):
+        """Function for getting the signed mantissa.
+
+        :return: (int)
+        :raises OverflowError: if the encoding is in the overflow zone
+        """
+        return decode_mantissa(self.n, self.encoding)
+
+    def decode(self):
+        """Function for decoding the number.
+
+        :return: (int) if the exponent is not negative, otherwise (float)
+        :raises OverflowError: if the encoding is in the overflow zone
+        """
+        mantissa = self.mantissa()
+        if self.exponent >= 0:
+            return mantissa * BASE ** self.exponent
+        return mantissa / BASE ** -self.exponent
+
+    def decrease_exponent_to(self, new_exponent: int):
+        """Function for representing the same number with a smaller exponent.
+
+        :param new_exponent: (int) exponent not greater than the current one
+        :return: (EncodedNumber)
+        :raises ValueError: if new_exponent is greater than the current exponent
+        """
+        if new_exponent > self.exponent:
+            raise ValueError(f"New exponent {new_exponent} should be not greater than {self.exponent}")
+        factor = BASE ** (self.exponent - new_exponent)
+        return EncodedNumber(self.n, (self.encoding * factor) % self.n, new_exponent)
+
+
+def encode_array(n: int, values, precision: float = None, exponent: int = None):
+    """Function for encoding many numbers with one common (fixed-point) exponent.
+    NumPy arrays of floats or integers are scaled and converted without a Python loop
+    while the mantissas fit into 62 bits.
+
+    :param n: (int) as modulo, part of public key
+    :param values: (numpy.ndarray or list) numbers
+    :param precision: (float) optional, the smallest difference to keep
+    :param exponent: (int) optional, common exponent (by default chosen from precision or from
+                     the largest absolute value keeping its full float precision)
+    :return: (list[int], int) encodings and the common exponent
+    :raises OverflowError: if a mantissa does not fit into the key
+    """
+    if numpy is None:
+        values = list(values)
+        max_abs = max((abs(value) for value in values), default=0)
+        if not all(isinstance(value, int) for value in values):
+            # like numpy.asarray, a mixed list is encoded as floats
+            max_abs = float(max_abs)
+    else:
+        values = numpy.asarray(values)
+        max_abs = numpy.abs(values).max().item() if values.size else 0
+    if exponent is None:
+        exponent = exponent_for(max_abs, precision)
+    if max_abs / float(BASE) ** exponent > max_int(n):
+        raise OverflowError(f"The number {max_abs} does not fit into the key with exponent {exponent}")
+
+    if numpy is not None:
+        if values.dtype.kind == "f" and max_abs * 2.0 ** (-LOG2_BASE * exponent) < 2 ** 62:
+            mantissas = numpy.rint(numpy.ldexp(values, -LOG2_BASE * exponent)).astype(numpy.int64)
+            return (mantissas.astype(object) % n).tolist(), exponent
+        if values.dtype.kind in "iu" and exponent <= 0:
+            return (values.astype(object) * BASE ** -exponent % n).tolist(), exponent
+        values = values.tolist()
+    return [round(Fraction(value) / Fraction(BASE) ** exponent) % n for value in values], exponent
+
+
+def decode_array(n: int, encodings: [int], exponent: int):
+    """Function for decoding many numbers with one common exponent.
+
+    :param n: (int) as modulo, part of public key
+    :param encodings: (list[int]) numbers from Z_n, e.g. decrypted text
+    :param exponent: (int) common exponent
+    :return: (numpy.ndarray of float64) or (list[float]) without NumPy
+    :raises OverflowError: if an encoding is in the overflow zone
+    """
+    if numpy is None:
+        return [EncodedNumber(n, encoding, exponent).decode() * 1.0 for encoding in encodings]
+    limit = max_int(n)
+    encodings = numpy.array(encodings, dtype=object)
+    if encodings.size and ((encodings > limit) & (encodings < n - limit)).any():
+        raise OverflowError("An encoded number overflowed the range of the key")
+    mantissas = numpy.where(encodings > limit, encodings - n, encodings)
+    return numpy.ldexp(mantissas.astype(numpy.float64), LOG2_BASE * exponent)
@@ -0,0 +1,306 @@
+"""Opt-in instrumentation of py_paillier: counters and timing histograms per phase.
+
+Instrumented code calls measure(name, items) around a phase and count(name, value) for events.
+Both report to the registered callbacks - functions (name, seconds, items) such as a Profile;
+while no callback is registered they return at once, so the disabled overhead is one check per call.
+
+Phases:
+    keygen, keygen.prime, keygen.candidates (count), keygen.primality_tests (count) \n
+    encryption, encryption.validation, encryption.randomness, encryption.modexp \n
+    decryption \n
+    homomorphic.<method>, e.g. homomorphic.addition, homomorphic.summation \n
+    keyring.hits, keyring.misses, keyring.evictions (count) \n
+    printing
+"""
+
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# upper bounds of histogram buckets in seconds: 1 microsecond * 2 ** i
+HISTOGRAM_BUCKETS = tuple(1e-6 * 2 ** i for i in range(27))
+
+_callbacks = []
+_callbacks_lock = threading.Lock()
+
+
+class Histogram(object):
+    """Histogram of durations with power-of-two buckets.
+
+    Args:
+        :arg counts (list[int]): number of durations per bucket of HISTOGRAM_BUCKETS, the last one is unbounded \n
+        :arg count (int): number of durations \n
+        :arg total (float): sum of durations in seconds \n
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def add(self, seconds: float):
+        """Function for adding a duration.
+
+        :param seconds: (float)
+        :return: None
+        """
+        index = 0 if seconds <= HISTOGRAM_BUCKETS[0] else min(
+            len(HISTOGRAM_BUCKETS), math.ceil(math.log2(seconds / HISTOGRAM_BUCKETS[0]))
+        )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def percentile(self, rank: float):
+        """Function for estimating a percentile by the upper bound of its bucket.
+
+        :param rank: (float) percentile from [0, 100]
+        :return: (float) duration in seconds, 0 for an empty histogram
+        """
+        if not self.count:
+            return 0.0
+        needed = max(1, math.ceil(rank * self.count / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= needed:
+                bound = HISTOGRAM_BUCKETS[index] if index < len(HISTOGRAM_BUCKETS) else self.maximum
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def summary(self):
+        """Function for summarizing the histogram.
+
+        :return: (dict) count, total, mean, min, p50, p90, p99, max in seconds
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.minimum if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.maximum,
+        }
+
+
+class Profile(object):
+    """Collector of counters and timing histograms per phase, usable as a callback.
+
+    Args:
+        :arg counters (dict): phase -> number of processed items or counted events \n
+        :arg histograms (dict): phase -> Histogram of durations of measured calls \n
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.__lock = threading.Lock()
+
+    def __call__(self, name: str, seconds: float, items: int):
+        """Callback function recording one measured call (seconds is None for counted events).
+
+        :param name: (str) phase
+        :param seconds: (float or None) duration
+        :param items: (int) number of processed items
+        :return: None
+        """
+        with self.__lock:
+            self.counters[name] = self.counters.get(name, 0) + items
+            if seconds is not None:
+                if name not in self.histograms:
+                    self.histograms[name] = Histogram()
+                self.histograms[name].add(seconds)
+
+    def reset(self):
+        """Function for removing all records.
+
+        :return: None
+        """
+        with self.__lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def summary(self):
+        """Function for summarizing the profile.
+
+        :return: (dict) phase -> {"items": counter, and the summary of its histogram if it was timed}
+        """
+        with self.__lock:
+            result = {}
+            for name, items in sorted(self.counters.items()):
+                result[name] = {"items": items}
+                if name in self.histograms:
+                    result[name].update(self.histograms[name].summary())
+            return result
+
+    def report(self):
+        """Function for formatting the profile as a table, times in milliseconds.
+
+        :return: (str)
+        """
+        lines = [f"{'phase':>40} {'items':>10} {'calls':>8} {'total':>10} {'p50':>9} {'p99':>9} {'max':>9}"]
+        for name, values in self.summary().items():
+            if "count" in values:
+                lines.append(
+                    f"{name:>40} {values['items']:>10} {values['count']:>8} {values['total'] * 1000:>10.3f} "
+                    f"{values['p50'] * 1000:>9.3f} {values['p99'] * 1000:>9.3f} {values['max'] * 1000:>9.3f}"
+                )
+            else:
+                lines.append(f"{name:>40} {values['items']:>10}")
+        return "\n".join(lines)
+
+
+def add_callback(callback):
+    """Function for registering a callback (name, seconds, items) -> None, e.g. a Profile or an exporter.
+
+    :param callback: function
+    :return: the callback
+    """
+    global _callbacks
+    with _callbacks_lock:
+        _callbacks = _callbacks + [callback]
+    return callback
+
+
+def remove_callback(callback):
+    """Function for unregistering a callback.
+
+    :param callback: function registered by add_callback
+    :return: None
+    """
+    global _callbacks
+    with _callbacks_lock:
+        callbacks = list(_callbacks)
+        callbacks.remove(callback)
+        _callbacks = callbacks
+
+
+def is_enabled():
+    """Function for checking if any callback is registered.
+
+    :return: (bool)
+    """
+    return bool(_callbacks)
+
+
+class _Measurement(object):
+    """Context manager timing one call of a phase."""
+
+    __slots__ = ("name", "items", "start")
+
+    def __init__(self, name: str, items: int):
+        self.name = name
+        self.items = items
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for callback in _callbacks:
+            callback(self.name, seconds, self.items)
+        return False
+
+
+class _NoMeasurement(object):
+    """Context manager doing nothing while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+def measure(name: str, items: int = 1):
+    """Function for timing a phase: with measure("encryption", len(plaintext)): ...
+
+    :param name: (str) phase
+    :param items: (int) optional, number of processed items
+    :return: context manager
+    """
+    if not _callbacks:
+        return _NO_MEASUREMENT
+    return _Measurement(name, items)
+
+
+def count(name: str, value: int = 1):
+    """Function for counting events of a phase without timing.
+
+    :param name: (str) phase
+    :param value: (int) optional, number of events
+    :return: None
+    """
+    for callback in _callbacks:
+        callback(name, None, value)
+
+
+def instrumented(name: str, sized_argument: str = None):
+    """Decorator measuring every call of a function as a phase.
+
+    :param name: (str) phase
+    :param sized_argument: (str) optional, name of the argument whose length is the number of items
+    :return: decorator
+    """
+    def decorator(function):
+        position = None
+        if sized_argument is not None:
+            position = function.__code__.co_varnames[:function.__code__.co_argcount].index(sized_argument)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _callbacks:
+                return function(*args, **kwargs)
+            items = 1
+            if position is not None:
+                sized = args[position] if position < len(args) else kwargs.get(sized_argument)
+                items = len(sized) if hasattr(sized, "__len__") else 1
+            with _Measurement(name, items):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile():
+    """Context manager capturing a profile of a block of work: with profile() as result: ...
+
+    :return: (Profile) filled while the block runs (also by other threads)
+    """
+    result = add_callback(Profile())
+    try:
+        yield result
+    finally:
+        remove_callback(result)
+
+
+def logging_callback(logger, level: int = 10):
+    """Function for making an exporter writing every measured call to a logger.
+
+    :param logger: logging.Logger
+    :param level: (int) optional, logging level (DEBUG by default)
+    :return: callback function
+    """
+    def callback(name: str, seconds: float, items: int):
+        if seconds is None:
+            logger.log(level, "%s: %d", name, items)
+        else:
+            logger.log(level, "%s: %d items in %.6f s", name, items, seconds)
+
+    return callback
@@ -0,0 +1,260 @@
+"""Keyring of py_paillier: a thread-safe LRU cache of public keys by the fingerprint of n.
+
+A service working with many public keys takes them from the keyring instead of constructing
+Homomorphic(n, g) for every request, so the derived values (n_square, g) and the precomputed
+tables of a key (g_table, obfuscator_pool) are kept between requests. The least recently used
+keys are evicted when the number of keys or their estimated memory exceeds the limits.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+from py_paillier.instrumentation import count
+from py_paillier.py_paillier import Homomorphic, PaillierPublicKey
+
+DEFAULT_KEYRING_SIZE = 1024
+# default memory limit of all cached keys in bytes
+DEFAULT_KEYRING_MEMORY = 256 * 2 ** 20
+
+
+def key_fingerprint(n: int):
+    """Function for calculating the fingerprint of a public key: SHA-256 of n as big-endian bytes.
+
+    :param n: (int) part of public key
+    :return: (str) hexadecimal fingerprint
+    """
+    return hashlib.sha256(n.to_bytes((n.bit_length() + 7) // 8, "big")).hexdigest()
+
+
+def key_memory(public_key: PaillierPublicKey):
+    """Function for estimating the memory of a public key with its precomputed values.
+
+    :param public_key: object of class PaillierPublicKey
+    :return: (int) size in bytes
+    """
+    memory = sys.getsizeof(public_key.n) + sys.getsizeof(public_key.g) + sys.getsizeof(public_key.n_square)
+    if public_key.g_table is not None:
+        memory += public_key.g_table.nbytes
+    pool = public_key.obfuscator_pool
+    if pool is not None:
+        memory += pool.capacity * public_key.ciphertext_width
+    return memory
+
+
+class Keyring(object):
+    """Thread-safe cache of public keys (as Homomorphic objects) with LRU eviction.
+
+    Evicted and removed keys have their obfuscator pools stopped and detached, so the producer threads
+    do not outlive the cache. Threads still holding such a key keep encrypting with it correctly,
+    but generate obfuscators inline unless a pool is started again (start_obfuscator_pool).
+
+    Args:
+        :arg max_keys (int): maximum number of cached keys \n
+        :arg max_memory (int): maximum estimated memory of cached keys in bytes, see key_memory \n
+        :arg precompute (bool): build the fixed-base table of g for every new key \n
+        :arg hits (int): number of lookups served from the cache \n
+        :arg misses (int): number of lookups which constructed a key \n
+        :arg evictions (int): number of evicted keys \n
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_KEYRING_SIZE, max_memory: int = DEFAULT_KEYRING_MEMORY,
+                 precompute: bool = False):
+        """
+        :param max_keys: (int) optional, maximum number of cached keys
+        :param max_memory: (int) optional, maximum estimated memory of cached keys in bytes
+        :param precompute: (bool) optional, build the fixed-base table of g for every new key
+        :raises ValueError: if a limit is not positive
+        """
+        if max_keys < 1 or max_memory < 1:
+            raise ValueError(f"The limits of the keyring must be positive, got {max_keys} keys, {max_memory} bytes")
+        self.max_keys = max_keys
+        self.max_memory = max_memory
+        self.precompute = precompute
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # fingerprint -> [key, estimated memory], from the least to the most recently used
+        self.__entries = OrderedDict()
+        self.__memory = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, n: int):
+        return key_fingerprint(n) in self.__entries
+
+    @property
+    def memory(self):
+        """Estimated memory of the cached keys.
+
+        :return: (int) size in bytes
+        """
+        return self.__memory
+
+    def get(self, n: int, g: int = None):
+        """Function for getting the key (n, g) from the keyring, it is constructed and cached on a miss.
+        A cached key with the same n and another g is replaced.
+
+        :param n: (int) part of public key
+        :param g: (int) optional, part of public key (n + 1 by default)
+        :return: object of class Homomorphic (a PaillierPublicKey)
+        """
+        g = Homomorphic.generation_g(n) if g is None else g
+        fingerprint = key_fingerprint(n)
+        with self.__lock:
+            entry = self.__entries.get(fingerprint)
+            evicted = []
+            if entry is not None and entry[0].n == n and entry[0].g == g:
+                self.hits += 1
+                evicted = self.__touch(fingerprint, entry)
+                key = entry[0]
+            else:
+                self.misses += 1
+                key = None
+        self.__release(evicted)
+        count("keyring.hits" if key is not None else "keyring.misses")
+        if key is not None:
+            return key
+
+        # constructed outside the lock, a concurrent miss of the same key keeps the first stored object
+        key = Homomorphic(n, g)
+        if self.precompute:
+            key.precompute_g_table()
+        return self.add(key, fingerprint)
+
+    def add(self, public_key: PaillierPublicKey, fingerprint: str = None):
+        """Function for putting a key, e.g. a loaded one with precomputed values, into the keyring.
+        If an equal key is already cached, the cached object is kept.
+
+        :param public_key: object of class PaillierPublicKey (Homomorphic for get)
+        :param fingerprint: (str) optional, key_fingerprint of n
+        :return: cached key object
+        """
+        fingerprint = fingerprint or key_fingerprint(public_key.n)
+        with self.__lock:
+            entry = self.__entries.get(fingerprint)
+            if entry is not None and entry[0].n == public_key.n and entry[0].g == public_key.g:
+                evicted = self.__touch(fingerprint, entry)
+                key = entry[0]
+            else:
+                replaced = self.__discard(fingerprint)
+                memory = key_memory(public_key)
+                self.__entries[fingerprint] = [public_key, memory]
+                self.__memory += memory
+                evicted = self.__evict()
+                if replaced is not None and replaced[0] is not public_key:
+                    evicted.append(replaced)
+                key = public_key
+        self.__release(evicted)
+        return key
+
+    def find(self, fingerprint: str):
+        """Function for getting a cached key by its fingerprint without constructing it.
+
+        :param fingerprint: (str) key_fingerprint of n
+        :return: cached key object or None
+        """
+        with self.__lock:
+            entry = self.__entries.get(fingerprint)
+            if entry is None:
+                return None
+            evicted = self.__touch(fingerprint, entry)
+        self.__release(evicted)
+        return entry[0]
+
+    def remove(self, n: int):
+        """Function for removing a key from the keyring, its obfuscator pool is stopped.
+
+        :param n: (int) part of public key
+        :return: (bool) True if the key was cached
+        """
+        with self.__lock:
+            entry = self.__discard(key_fingerprint(n))
+        self.__release([entry] if entry is not None else [])
+        return entry is not None
+
+    def clear(self):
+        """Function for removing all keys, their obfuscator pools are stopped.
+
+        :return: None
+        """
+        with self.__lock:
+            entries = list(self.__entries.values())
+            self.__entries.clear()
+            self.__memory = 0
+        self.__release(entries)
+
+    def statistics(self):
+        """Function for getting the counters of the keyring.
+
+        :return: (dict) hits, misses, evictions, hit_rate, keys and memory in bytes
+        """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "keys": len(self.__entries),
+                "memory": self.__memory,
+            }
+
+    def __touch(self, fingerprint: str, entry: list):
+        """Helper function for marking an entry as the most recently used, called under the lock.
+        Its memory is estimated again, because tables and pools are attached to keys lazily.
+
+        :param fingerprint: (str)
+        :param entry: (list) [key, estimated memory]
+        :return: (list) evicted entries
+        """
+        self.__entries.move_to_end(fingerprint)
+        memory = key_memory(entry[0])
+        if memory == entry[1]:
+            return []
+        self.__memory += memory - entry[1]
+        entry[1] = memory
+        return self.__evict()
+
+    def __discard(self, fingerprint: str):
+        """Helper function for removing an entry, called under the lock.
+
+        :param fingerprint: (str)
+        :return: (list) removed entry or None
+        """
+        entry = self.__entries.pop(fingerprint, None)
+        if entry is not None:
+            self.__memory -= entry[1]
+        return entry
+
+    def __evict(self):
+        """Helper function for removing the least recently used entries over the limits, called under the lock.
+        The most recently used entry is kept even if it alone exceeds the memory limit.
+
+        :return: (list) evicted entries
+        """
+        evicted = []
+        while len(self.__entries) > 1 and (
+                len(self.__entries) > self.max_keys or self.__memory > self.max_memory
+        ):
+            _, entry = self.__entries.popitem(last=False)
+            self.__memory -= entry[1]
+            evicted.append(entry)
+        if evicted:
+            self.evictions += len(evicted)
+            count("keyring.evictions", len(evicted))
+        return evicted
+
+    @staticmethod
+    def __release(entries: [list]):
+        """Helper function for stopping the obfuscator pools of removed keys, called without the lock.
+
+        :param entries: (list) removed entries
+        :return: None
+        """
+        for key, _ in entries:
+            key.stop_obfuscator_pool()
@@ -0,0 +1,153 @@
+"""Products and multi-exponentiation modulo a number for py_paillier.
+
+A product of powers b_1 ** e_1 * ... * b_k ** e_k is calculated with one shared chain of
+squarings instead of k separate exponentiations - see [1].
+
+Links:
+    [1] - https://en.wikipedia.org/wiki/Exponentiation_by_squaring#Multi-exponentiation
+"""
+
+from py_paillier.backend import invert, to_number
+
+# below this number of bases the Straus method is used, above it the Pippenger method
+PIPPENGER_THRESHOLD = 64
+
+
+def tree_product(digits: [int], modulo: int):
+    """Function for multiplying numbers modulo by pairwise (tree) reduction.
+
+    :param digits: (list[int]) numbers from [0, modulo)
+    :param modulo: (int) as modulo
+    :return: (int) product modulo, 1 for an empty list
+    """
+    level = list(digits)
+    if not level:
+        return 1 % modulo
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(1)
+        level = [(level[i] * level[i + 1]) % modulo for i in range(0, len(level), 2)]
+    return level[0] % modulo
+
+
+def batch_inversion(digits: [int], modulo: int):
+    """Function for inverting several numbers modulo with one modular inversion by Montgomery's trick - see [1]:
+    prefix products are inverted once and unwound backwards, about 3 multiplications per number.
+
+    :param digits: (list[int]) numbers coprime with modulo
+    :param modulo: (int) as modulo
+    :return: (list[int]) inverse numbers from [0, modulo)
+    :raises ZeroDivisionError: if any number is not invertible modulo
+
+    Links:
+        [1] - https://en.wikipedia.org/wiki/Modular_multiplicative_inverse#Multiple_inverses
+    """
+    # the prefix products are calculated with the number type of the backend (gmpy2.mpz is much faster)
+    digits = [to_number(digit) for digit in digits]
+    if not digits:
+        return []
+    modulo = to_number(modulo)
+    prefixes = [digits[0] % modulo]
+    for digit in digits[1:]:
+        prefixes.append((prefixes[-1] * digit) % modulo)
+    try:
+        inverse = to_number(invert(prefixes[-1], modulo))
+    except ZeroDivisionError:
+        raise ZeroDivisionError(f"Some of {len(digits)} numbers are not invertible modulo {modulo}") from None
+
+    result = [0] * len(digits)
+    for i in range(len(digits) - 1, 0, -1):
+        result[i] = int((inverse * prefixes[i - 1]) % modulo)
+        inverse = (inverse * digits[i]) % modulo
+    result[0] = int(inverse)
+    return result
+
+
+def straus_tables(bases: [int], modulo: int, window: int):
+    """Function for precomputing the powers b ** 0 .. b ** (2 ** window - 1) of every base.
+    The tables can be reused for several lists of exponents with the same bases.
+
+    :param bases: (list[int]) bases
+    :param modulo: (int) as modulo
+    :param window: (int) window width in bits
+    :return: (list[list[int]]) tables of powers
+    """
+    tables = []
+    for base in bases:
+        table = [1, base % modulo]
+        for _ in range(2 ** window - 2):
+            table.append((table[-1] * base) % modulo)
+        tables.append(table)
+    return tables
+
+
+def straus(bases: [int], exponents: [int], modulo: int, window: int = 4, tables: [[int]] = None):
+    """Straus (interleaved windows) multi-exponentiation, efficient for a small number of bases.
+
+    :param bases: (list[int]) bases
+    :param exponents: (list[int]) non-negative exponents
+    :param modulo: (int) as modulo
+    :param window: (int) optional, window width in bits
+    :param tables: (list[list[int]]) optional, result of straus_tables for the bases and window
+    :return: (int) product of bases[i] ** exponents[i] modulo
+    """
+    if tables is None:
+        tables = straus_tables(bases, modulo, window)
+    max_bits = max((exponent.bit_length() for exponent in exponents), default=0)
+    mask = 2 ** window - 1
+    result = 1 % modulo
+    for shift in range(((max_bits + window - 1) // window - 1) * window, -1, -window):
+        for _ in range(window):
+            result = (result * result) % modulo
+        for table, exponent in zip(tables, exponents):
+            digit = (exponent >> shift) & mask
+            if digit:
+                result = (result * table[digit]) % modulo
+    return result
+
+
+def pippenger(bases: [int], exponents: [int], modulo: int, window: int = None):
+    """Pippenger (bucket) multi-exponentiation, efficient for a large number of bases.
+
+    :param bases: (list[int]) bases
+    :param exponents: (list[int]) non-negative exponents
+    :param modulo: (int) as modulo
+    :param window: (int) optional, window width in bits (by default chosen from the number of bases)
+    :return: (int) product of bases[i] ** exponents[i] modulo
+    """
+    if window is None:
+        window = max(1, len(bases).bit_length() - 3)
+    max_bits = max((exponent.bit_length() for exponent in exponents), default=0)
+    mask = 2 ** window - 1
+    result = 1 % modulo
+    for shift in range(((max_bits + window - 1) // window - 1) * window, -1, -window):
+        for _ in range(window):
+            result = (result * result) % modulo
+        buckets = [1] * (mask + 1)
+        for base, exponent in zip(bases, exponents):
+            digit = (exponent >> shift) & mask
+            if digit:
+                buckets[digit] = (buckets[digit] * base) % modulo
+        # product of buckets[k] ** k by running products
+        running = 1
+        window_result = 1
+        for digit in range(mask, 0, -1):
+            running = (running * buckets[digit]) % modulo
+            window_result = (window_result * running) % modulo
+        result = (result * window_result) % modulo
+    return result
+
+
+def multi_exponentiation(bases: [int], exponents: [int], modulo: int):
+    """Function for calculating a product of powers choosing the method by the number of bases.
+
+    :param bases: (list[int]) bases
+    :param exponents: (list[int]) non-negative exponents
+    :param modulo: (int) as modulo
+    :return: (int) product of bases[i] ** exponents[i] modulo
+    """
+    if len(bases) != len(exponents):
+        raise ValueError(f"Got {len(bases)} bases and {len(exponents)} exponents")
+    if len(bases) < PIPPENGER_THRESHOLD:
+        return straus(bases, exponents, modulo)
+    return pippenger(bases, exponents, modulo)
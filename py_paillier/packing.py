@@ -0,0 +1,144 @@
+"""Packing of several bounded numbers into one plaintext (slots) for py_paillier.
+
+Values v_0, ..., v_{k-1} from [0, 2 ** value_bits) are stored as v_0 + v_1 * 2 ** s + ... with slot width s.
+Encrypted packed numbers are added and multiplied by a scalar slot-wise with the usual Homomorphic
+operations as long as no slot exceeds 2 ** s - 1, so s includes headroom for the expected number of
+additions and the largest scalar - see [1].
+
+Links:
+    [1] - https://en.wikipedia.org/wiki/SIMD
+"""
+
+
+def slot_bit_length(value_bits: int, additions: int = 0, max_scalar: int = 1):
+    """Function for calculating the width of a slot with headroom.
+
+    :param value_bits: (int) bound of the values, every value is less than 2 ** value_bits
+    :param additions: (int) optional, number of homomorphic additions of packed numbers
+    :param max_scalar: (int) optional, largest scalar the packed numbers are multiplied by
+    :return: (int) slot width in bits
+    """
+    if value_bits < 1 or additions < 0 or max_scalar < 1:
+        raise ValueError("value_bits and max_scalar should be positive and additions non-negative")
+    return ((additions + 1) * (2 ** value_bits - 1) * max_scalar).bit_length()
+
+
+def packing_capacity(key_bit_length: int, value_bits: int, additions: int = 0, max_scalar: int = 1):
+    """Function for calculating the number of slots in one plaintext.
+    A key of key_bit_length bits has n >= 2 ** (key_bit_length - 1), so that many bits are usable.
+
+    :param key_bit_length: (int) length of n in bits
+    :param value_bits: (int) bound of the values, every value is less than 2 ** value_bits
+    :param additions: (int) optional, number of homomorphic additions of packed numbers
+    :param max_scalar: (int) optional, largest scalar the packed numbers are multiplied by
+    :return: (int) number of slots, 0 if even one slot does not fit
+    """
+    return (key_bit_length - 1) // slot_bit_length(value_bits, additions, max_scalar)
+
+
+class SlotPacking(object):
+    """Layout of bounded numbers packed into plaintexts of one key.
+
+    Args:
+        :arg n (int): as modulo, part of public key \n
+        :arg value_bits (int): bound of the values, every value is less than 2 ** value_bits \n
+        :arg slot_bits (int): slot width in bits with headroom \n
+        :arg slots (int): number of slots in one plaintext \n
+    """
+
+    def __init__(self, n: int, value_bits: int, additions: int = 0, max_scalar: int = 1):
+        """
+        :param n: (int) as modulo, part of public key
+        :param value_bits: (int) bound of the values, every value is less than 2 ** value_bits
+        :param additions: (int) optional, number of homomorphic additions of packed numbers
+        :param max_scalar: (int) optional, largest scalar the packed numbers are multiplied by
+        :raises ValueError: if not even one slot fits into the key
+        """
+        self.n = n
+        self.value_bits = value_bits
+        self.slot_bits = slot_bit_length(value_bits, additions, max_scalar)
+        self.slots = packing_capacity(n.bit_length(), value_bits, additions, max_scalar)
+        if self.slots < 1:
+            raise ValueError(f"A slot of {self.slot_bits} bits does not fit into a {n.bit_length()}-bit key")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.slots} slots of {self.slot_bits} bits>"
+
+    def packed_length(self, count: int):
+        """Function for calculating the number of plaintexts for count values.
+
+        :param count: (int) number of values
+        :return: (int) number of plaintexts
+        """
+        return -(-count // self.slots)
+
+    def pack(self, values: [int]):
+        """Function for packing values into plaintexts, slot 0 in the lowest bits.
+
+        :param values: (list[int]) numbers from [0, 2 ** value_bits)
+        :return: (list[int]) plaintexts from Z_n, the last one may be partially filled
+        :raises ValueError: if some values are out of the bound
+        """
+        bound = 2 ** self.value_bits
+        indices = [i for i, value in enumerate(values) if not 0 <= value < bound]
+        if indices:
+            raise ValueError(f"Values at indices {indices[:10]} are out of [0, 2 ** {self.value_bits})")
+        slot_bits = self.slot_bits
+        plaintext = []
+        for start in range(0, len(values), self.slots):
+            digit = 0
+            for value in reversed(values[start:start + self.slots]):
+                digit = (digit << slot_bits) | value
+            plaintext.append(digit)
+        return plaintext
+
+    def unpack(self, plaintext: [int], count: int = None):
+        """Function for unpacking plaintexts, e.g. decrypted text, into slot values.
+
+        :param plaintext: (list[int]) packed numbers
+        :param count: (int) optional, number of values to return (by default all slots)
+        :return: (list[int]) slot values
+        """
+        slot_bits = self.slot_bits
+        mask = 2 ** slot_bits - 1
+        values = []
+        for digit in plaintext:
+            for _ in range(self.slots):
+                values.append(digit & mask)
+                digit >>= slot_bits
+        if count is not None:
+            del values[count:]
+        return values
+
+    def encryption(self, public_key, values: [int], don_t_use_r: bool = False, as_vector: bool = False):
+        """Function for packing and encrypting values.
+
+        :param public_key: (PaillierPublicKey) key with the n of the layout
+        :param values: (list[int]) numbers from [0, 2 ** value_bits)
+        :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+        :param as_vector: (bool) optional, return EncryptedVector
+        :return: list [int] (or EncryptedVector) of packed_length(len(values)) encrypted numbers
+        """
+        return public_key.encryption(self.pack(values), don_t_use_r, as_vector, validate=False)
+
+    def decryption(self, private_key, encrypt_text, count: int = None):
+        """Function for decrypting and unpacking values.
+
+        :param private_key: (PaillierPrivateKey) key with the n of the layout
+        :param encrypt_text: list [int] or EncryptedVector of encrypted packed numbers
+        :param count: (int) optional, number of values to return (by default all slots)
+        :return: (list[int]) slot values
+        """
+        return self.unpack(private_key.decryption(encrypt_text), count)
+
+    def addition_of_plaintext(self, homomorphic, encrypt_text, values: [int]):
+        """Function for adding values slot-wise to encrypted packed numbers.
+
+        :param homomorphic: (Homomorphic) with the n of the layout
+        :param encrypt_text: list [int] or EncryptedVector of encrypted packed numbers
+        :param values: (list[int]) numbers from [0, 2 ** value_bits), packed like the encrypted ones
+        :return: encrypted packed sums as in Homomorphic.addition_of_plaintext
+        """
+        plaintext = self.pack(values)
+        plaintext += [0] * (len(encrypt_text) - len(plaintext))
+        return homomorphic.addition_of_plaintext(encrypt_text, plaintext)
@@ -0,0 +1,198 @@
+"""Multiprocess batch processing for py_paillier"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from py_paillier.multiexp import batch_inversion
+
+DEFAULT_CHUNK_SIZE = 256
+
+# key of the current worker process, set once by initialize_worker
+_worker_key = None
+
+
+def initialize_worker(key):
+    """Initializer of worker processes: the key is pickled once per worker, not per task.
+
+    :param key: PaillierPublicKey or PaillierPrivateKey
+    :return: None
+    """
+    global _worker_key
+    _worker_key = key
+
+
+def run_in_worker(function, chunk: [int], *function_args):
+    """Task function of worker processes: applies a chunk function to the key of the worker.
+
+    :param function: module-level chunk function (encrypt_chunk or decrypt_chunk)
+    :param chunk: (list[int]) input numbers
+    :param function_args: extra arguments of the chunk function
+    :return: (list[int]) result of the chunk function
+    """
+    return function(_worker_key, chunk, *function_args)
+
+
+def encrypt_chunk(public_key, chunk: [int], don_t_use_r: bool = False):
+    """Chunk function for encrypting already checked numbers.
+
+    :param public_key: PaillierPublicKey
+    :param chunk: (list[int]) unencrypted numbers
+    :param don_t_use_r: (bool) optional, deterministic encryption
+    :return: (list[int]) encrypted numbers
+    """
+    if don_t_use_r:
+        return [public_key.raw_encryption(digit) for digit in chunk]
+    return [public_key.raw_encryption(digit, public_key.next_obfuscator()) for digit in chunk]
+
+
+def decrypt_chunk(private_key, chunk: [int]):
+    """Chunk function for decrypting numbers.
+
+    :param private_key: PaillierPrivateKey
+    :param chunk: (list[int]) encrypted numbers
+    :return: (list[int]) decrypted numbers
+    """
+    return [private_key.raw_decryption(encrypt_digit) for encrypt_digit in chunk]
+
+
+def homomorphic_chunk(homomorphic, chunk: [tuple], operation: str):
+    """Chunk function for applying a raw homomorphic operation to pairs of operands.
+
+    :param homomorphic: Homomorphic
+    :param chunk: (list[tuple]) pairs of operands
+    :param operation: (str) name of the raw method of Homomorphic, e.g. "raw_addition"
+    :return: (list[int]) encrypted results
+    """
+    raw_operation = getattr(homomorphic, operation)
+    return [raw_operation(first, second) for first, second in chunk]
+
+
+def negation_chunk(homomorphic, chunk: [int]):
+    """Chunk function for negating encrypted numbers with one modular inversion.
+
+    :param homomorphic: Homomorphic
+    :param chunk: (list[int]) encrypted numbers
+    :return: (list[int]) encrypted negations
+    """
+    return batch_inversion(chunk, homomorphic.n_square)
+
+
+def summation_chunk(homomorphic, chunk: [int]):
+    """Chunk function for adding encrypted numbers.
+
+    :param homomorphic: Homomorphic
+    :param chunk: (list[int]) encrypted numbers
+    :return: (list[int]) one encrypted partial sum
+    """
+    return [homomorphic.summation(chunk)]
+
+
+def dot_product_chunk(homomorphic, chunk: [tuple]):
+    """Chunk function for the plaintext-weighted sum of encrypted numbers.
+
+    :param homomorphic: Homomorphic
+    :param chunk: (list[tuple]) pairs of an encrypted number and its unencrypted weight
+    :return: (list[int]) one encrypted partial dot product
+    """
+    encrypt_text, plaintext = zip(*chunk)
+    return [homomorphic.dot_product(list(encrypt_text), list(plaintext))]
+
+
+def vector_matrix_chunk(homomorphic, columns: [[int]], encrypt_text: [int]):
+    """Chunk function for multiplying an encrypted vector by columns of an unencrypted matrix.
+
+    :param homomorphic: Homomorphic
+    :param columns: (list[list[int]]) columns of the matrix
+    :param encrypt_text: (list[int]) encrypted vector
+    :return: (list[int]) encrypted dot products with every column
+    """
+    return homomorphic.vector_matrix_product(encrypt_text, [list(row) for row in zip(*columns)])
+
+
+def split_into_chunks(digits_list: [int], chunk_size: int):
+    """Function for splitting a list into consecutive chunks.
+
+    :param digits_list: (list[int])
+    :param chunk_size: (int) maximum length of a chunk
+    :return: (list[list[int]]) chunks in input order
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}")
+    return [digits_list[i:i + chunk_size] for i in range(0, len(digits_list), chunk_size)]
+
+
+def batch_map(key, function, digits_list: [int], workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              function_args: tuple = ()):
+    """Function for applying a chunk function to a list across a pool of processes.
+
+    :param key: PaillierPublicKey or PaillierPrivateKey shipped to the workers
+    :param function: module-level chunk function (encrypt_chunk or decrypt_chunk)
+    :param digits_list: (list[int]) input numbers
+    :param workers: (int) optional, number of processes (by default the number of CPUs)
+    :param chunk_size: (int) optional, number of input numbers per task
+    :param function_args: (tuple) optional, extra arguments of the chunk function
+    :return: (list[int], dict) results in input order and statistics
+             (items, chunks, workers, seconds, items_per_second)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers must be positive, got {workers}")
+    chunks = split_into_chunks(digits_list, chunk_size)
+    workers = max(1, min(workers, len(chunks)))
+
+    start = time.perf_counter()
+    if workers == 1:
+        # a single process is cheaper inline than through a pool
+        results = [function(key, chunk, *function_args) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker, initargs=(key,)) as executor:
+            results = list(executor.map(
+                run_in_worker, [function] * len(chunks), chunks, *[[arg] * len(chunks) for arg in function_args]
+            ))
+    seconds = time.perf_counter() - start
+
+    output = [digit for chunk in results for digit in chunk]
+    statistics = {
+        "items": len(output),
+        "chunks": len(chunks),
+        "workers": workers,
+        "seconds": seconds,
+        "items_per_second": len(output) / seconds if seconds > 0 else float("inf"),
+    }
+    return output, statistics
+
+
+def stream_map(key, function, chunks, workers: int = 1, max_pending: int = None, function_args: tuple = ()):
+    """Generator applying a chunk function to an iterable of chunks across a pool of processes.
+    At most max_pending chunks are submitted ahead of the consumer, so memory does not depend on the input size.
+
+    :param key: PaillierPublicKey or PaillierPrivateKey shipped to the workers
+    :param function: module-level chunk function (encrypt_chunk or decrypt_chunk)
+    :param chunks: iterable of (list[int]) input chunks, read lazily
+    :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+    :param function_args: (tuple) optional, extra arguments of the chunk function
+    :return: generator of (list[int]) results per chunk in input order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"The number of workers must be positive, got {workers}")
+    if workers == 1:
+        for chunk in chunks:
+            yield function(key, chunk, *function_args)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker, initargs=(key,)) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(run_in_worker, function, chunk, *function_args))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,156 @@
+"""Pool of precomputed obfuscators r ** n modulo n ** 2 for py_paillier"""
+
+import queue
+import threading
+
+DEFAULT_POOL_CAPACITY = 1024
+
+
+class ObfuscatorPool(object):
+    """Bounded queue of obfuscators filled by a background producer thread.
+
+    The producer computes obfuscators while the caller is idle, so bursts of encryption
+    take them from the queue; when the queue is empty the obfuscator is generated inline.
+
+    Args:
+        :arg capacity (int): maximum number of stored obfuscators \n
+        :arg high_water_mark (int): maximum number of obfuscators ever stored at once \n
+        :arg produced (int): number of obfuscators computed by the producer \n
+        :arg hits (int): number of obfuscators taken from the queue \n
+        :arg misses (int): number of obfuscators generated inline because the queue was empty \n
+    """
+
+    def __init__(self, generation_obfuscator, capacity: int = DEFAULT_POOL_CAPACITY):
+        """
+        :param generation_obfuscator: function without arguments returning a new obfuscator
+        :param capacity: (int) maximum number of stored obfuscators
+        """
+        if capacity < 1:
+            raise ValueError(f"The capacity of the pool must be positive, got {capacity}")
+        self.capacity = capacity
+        self.high_water_mark = 0
+        self.produced = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.__generation_obfuscator = generation_obfuscator
+        self.__queue = queue.Queue(maxsize=capacity)
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+    def __len__(self):
+        return self.__queue.qsize()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def is_running(self):
+        """Producer state.
+
+        :return: (bool) True if the producer thread is alive
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        """Function for starting the producer thread.
+
+        :return: None
+        """
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__produce, name="py-paillier-obfuscator-pool", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Function for stopping the producer thread. Stored obfuscators remain available.
+
+        :return: None
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __put(self, obfuscator: int, timeout: float = None):
+        """Helper function for storing one obfuscator and updating the high-water mark.
+
+        :param obfuscator: (int) r ** n modulo n ** 2
+        :param timeout: (float) seconds to wait for a free slot, None - don't wait
+        :return: None
+        :raises queue.Full: if there is no free slot
+        """
+        if timeout is None:
+            self.__queue.put_nowait(obfuscator)
+        else:
+            self.__queue.put(obfuscator, timeout=timeout)
+        with self.__lock:
+            self.produced += 1
+            self.high_water_mark = max(self.high_water_mark, self.__queue.qsize())
+
+    def __produce(self):
+        """Producer loop: computes obfuscators until the pool is stopped.
+
+        :return: None
+        """
+        while not self.__stop_event.is_set():
+            obfuscator = self.__generation_obfuscator()
+            while not self.__stop_event.is_set():
+                try:
+                    self.__put(obfuscator, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def fill(self, count: int = None):
+        """Function for synchronously storing obfuscators in the calling thread.
+
+        :param count: (int) optional, number of obfuscators (by default up to capacity)
+        :return: (int) number of stored obfuscators
+        """
+        if count is None:
+            count = self.capacity - len(self)
+        stored = 0
+        for _ in range(count):
+            try:
+                self.__put(self.__generation_obfuscator())
+            except queue.Full:
+                break
+            stored += 1
+        return stored
+
+    def get(self):
+        """Function for taking one obfuscator, generated inline if the pool is empty.
+
+        :return: (int) r ** n modulo n ** 2
+        """
+        try:
+            obfuscator = self.__queue.get_nowait()
+        except queue.Empty:
+            with self.__lock:
+                self.misses += 1
+            return self.__generation_obfuscator()
+        with self.__lock:
+            self.hits += 1
+        return obfuscator
+
+    def statistics(self):
+        """Function for collecting pool statistics.
+
+        :return: (dict) size, capacity, high_water_mark, produced, hits and misses
+        """
+        with self.__lock:
+            return {
+                "size": len(self),
+                "capacity": self.capacity,
+                "high_water_mark": self.high_water_mark,
+                "produced": self.produced,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
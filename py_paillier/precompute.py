@@ -0,0 +1,111 @@
+"""Fixed-base exponentiation tables for py_paillier.
+
+For a fixed base b the table stores b ** (d * 2 ** (window * j)) for every window j and digit d,
+so b ** e is a product of one table entry per window of e without any squaring - see [1].
+
+Links:
+    [1] - https://en.wikipedia.org/wiki/Exponentiation_by_squaring#Fixed-base_exponent
+"""
+
+from py_paillier.backend import powmod, to_number
+
+# default memory limit of one table in bytes
+DEFAULT_TABLE_MEMORY = 16 * 2 ** 20
+MAX_WINDOW = 10
+
+
+def table_size(exponent_bits: int, window: int, width: int):
+    """Function for estimating the memory of a table.
+
+    :param exponent_bits: (int) maximum length of exponents in bits
+    :param window: (int) window width in bits
+    :param width: (int) size of one entry in bytes
+    :return: (int) size in bytes
+    """
+    return -(-exponent_bits // window) * (2 ** window - 1) * width
+
+
+def window_for_memory(exponent_bits: int, width: int, memory: int = DEFAULT_TABLE_MEMORY):
+    """Function for choosing the widest window whose table fits into the memory limit.
+
+    :param exponent_bits: (int) maximum length of exponents in bits
+    :param width: (int) size of one entry in bytes
+    :param memory: (int) optional, memory limit in bytes
+    :return: (int) window width in bits, 0 if even a 1-bit window does not fit
+    """
+    window = 0
+    for candidate in range(1, MAX_WINDOW + 1):
+        if table_size(exponent_bits, candidate, width) <= memory:
+            window = candidate
+    return window
+
+
+class FixedBaseTable(object):
+    """Precomputed powers of a fixed base modulo a number.
+
+    Args:
+        :arg base (int): fixed base \n
+        :arg modulo (int): as modulo \n
+        :arg exponent_bits (int): maximum length of exponents served by the table \n
+        :arg window (int): window width in bits \n
+    """
+
+    def __init__(self, base: int, modulo: int, exponent_bits: int, window: int = None,
+                 memory: int = DEFAULT_TABLE_MEMORY):
+        """
+        :param base: (int) fixed base
+        :param modulo: (int) as modulo
+        :param exponent_bits: (int) maximum length of exponents in bits
+        :param window: (int) optional, window width in bits (by default the widest one fitting into memory)
+        :param memory: (int) optional, memory limit in bytes used to choose the window
+        :raises ValueError: if no table fits into the memory limit
+        """
+        if window is None:
+            window = window_for_memory(exponent_bits, (modulo.bit_length() + 7) // 8, memory)
+        if window < 1:
+            raise ValueError(f"A fixed-base table for {exponent_bits}-bit exponents does not fit into {memory} bytes")
+        self.base = base
+        self.modulo = modulo
+        self.exponent_bits = exponent_bits
+        self.window = window
+
+        _modulo = to_number(modulo)
+        rows = []
+        row_base = to_number(base % modulo)
+        for _ in range(-(-exponent_bits // window)):
+            row = [to_number(1), row_base]
+            for _ in range(2 ** window - 2):
+                row.append((row[-1] * row_base) % _modulo)
+            rows.append(row)
+            row_base = (row[-1] * row_base) % _modulo
+        self.__rows = rows
+        self.__modulo = _modulo
+
+    @property
+    def nbytes(self):
+        """Approximate memory of the table.
+
+        :return: (int) size in bytes
+        """
+        return table_size(self.exponent_bits, self.window, (self.modulo.bit_length() + 7) // 8)
+
+    def power(self, exponent: int):
+        """Function for calculating base ** exponent modulo by the table.
+        Exponents outside [0, 2 ** exponent_bits) are calculated by powmod.
+
+        :param exponent: (int)
+        :return: (int) base ** exponent modulo
+        """
+        if exponent < 0 or exponent.bit_length() > self.exponent_bits:
+            return powmod(self.base, exponent, self.modulo)
+        mask = 2 ** self.window - 1
+        modulo = self.__modulo
+        result = self.__rows[0][0]
+        for row in self.__rows:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = (result * row[digit]) % modulo
+            exponent >>= self.window
+        return int(result % modulo)
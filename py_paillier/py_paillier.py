@@ -1,8 +1,31 @@
 """Paillier encryption library for partially homomorphic encryption."""
 
-from py_paillier.util import Euclid, PrimeDigit, check_plaintext
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from numbers import Integral
+
+from py_paillier.asynchronous import decrypt_async, dot_product_async, encrypt_async, summation_async
+from py_paillier.backend import gcd, invert, is_prime, powmod
+from py_paillier.encoding import BASE
+from py_paillier.instrumentation import instrumented, measure
+from py_paillier.multiexp import PIPPENGER_THRESHOLD, batch_inversion, multi_exponentiation, pippenger, straus
+from py_paillier.multiexp import straus_tables, tree_product
+from py_paillier.parallel import DEFAULT_CHUNK_SIZE, batch_map, decrypt_chunk, encrypt_chunk, homomorphic_chunk
+from py_paillier.parallel import dot_product_chunk, negation_chunk, summation_chunk, vector_matrix_chunk
+from py_paillier.pool import DEFAULT_POOL_CAPACITY, ObfuscatorPool
+from py_paillier.precompute import DEFAULT_TABLE_MEMORY, FixedBaseTable
+from py_paillier.streaming import decrypt_stream, encrypt_stream
+from py_paillier.util import DEFAULT_MILLER_RABIN_ROUNDS, Euclid, PrimeDigit, ReducedResidueSystem
+from py_paillier.util import check_plaintext
+from py_paillier.vector import EncryptedVector, obfuscate_reduction
 
 DEFAULT_BIT_KEY_LENGTH = 16
+# number of exponentiations of g after which its fixed-base table is built
+FIXED_BASE_TABLE_THRESHOLD = 64
+
+logger = logging.getLogger(__name__)
 
 
 def l_func(u: int, _n: int):
@@ -23,64 +46,302 @@ class PaillierPublicKey(object):
 
     Args:
         :arg n (int): part of public key - see [1] \n
-        :arg g (int): part of public key - see [1] \n
+        :arg g (int): part of public key, n + 1 if not given - see [1] \n
         :arg n_square (int): (n ** 2), stored for calculations \n
+        :arg obfuscator_pool (ObfuscatorPool): precomputed obfuscators or None - see start_obfuscator_pool \n
+        :arg g_table (FixedBaseTable): precomputed powers of g or None - see precompute_g_table \n
+        :arg g_table_memory (int): memory limit of g_table in bytes \n
 
     Links:
         [1] - https://en.wikipedia.org/wiki/Paillier_cryptosystem#Key_generation
     """
 
-    def __init__(self, n):
+    def __init__(self, n, g: int = None, n_square: int = None):
         # public key
         self.n = n
-        self.g = self.generation_g(self.n)
+        self.g = self.generation_g(self.n) if g is None else g
 
         # parameters for calculations
-        self.n_square = n ** 2
+        self.n_square = n ** 2 if n_square is None else n_square
+        self.obfuscator_pool = None
+        self.g_table = None
+        self.g_table_memory = DEFAULT_TABLE_MEMORY
+        # g whose exponentiations are counted and their number, guarded by the lock
+        self.__g_powers_base = self.g
+        self.__g_powers_count = 0
+        self.__g_table_lock = threading.Lock()
+
+    def __getstate__(self):
+        # the pool holds a thread and is not shipped to other processes, neither is the lock
+        state = self.__dict__.copy()
+        state["obfuscator_pool"] = None
+        del state["_PaillierPublicKey__g_table_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__g_table_lock = threading.Lock()
 
     @staticmethod
     def generation_g(_n: int):
         """Function for generating g as part of a public key.
+        The standard choice g = n + 1 is always a valid generator and allows encryption
+        by the shortcut (1 + n) ** m = 1 + m * n (mod n ** 2) - see [1].
 
         :param _n: int as modulo
-        :return: g (int) as large prime
+        :return: g (int) as n + 1
         """
-        g = PrimeDigit().generating_a_large_prime_modulo(_n ** 2)
-        return g
+        return _n + 1
 
     def show_public_key(self):
         """Public key display function
 
         :return: None
         """
-        print(f"public_key: {self.n}, {self.g}")
+        with measure("printing"):
+            print(f"public_key: {self.n}, {self.g}")
+
+    def power_of_g(self, digit: int):
+        """Function for calculating g ** digit modulo n_square.
+        If g = n + 1 the binomial shortcut (1 + n) ** m = 1 + m * n (mod n ** 2) is used - see [1].
+
+        :param digit: (int) unencrypted number
+        :return: (int) g ** digit modulo n_square
+
+        Links:
+            [1] - https://en.wikipedia.org/wiki/Paillier_cryptosystem#Key_generation
+        """
+        if self.g == self.n + 1:
+            return (1 + digit * self.n) % self.n_square
+        table = self.g_table
+        if table is None or table.base != self.g:
+            table = self.__count_power_of_g()
+            if table is None:
+                return powmod(self.g, digit, self.n_square)
+        return table.power(digit)
+
+    def __count_power_of_g(self):
+        """Helper function for counting the exponentiations of g without a table.
+        The table is built once g has been used often enough to pay for it: by exactly one thread
+        and at most once per value of g, even if it does not fit into the memory limit.
+
+        :return: (FixedBaseTable) table or None if powmod is to be used
+        """
+        with self.__g_table_lock:
+            if self.g_table is not None and self.g_table.base == self.g:
+                # built by another thread meanwhile
+                return self.g_table
+            if self.__g_powers_base != self.g:
+                # g was replaced, the table is stale
+                self.g_table, self.__g_powers_base, self.__g_powers_count = None, self.g, 0
+            self.__g_powers_count += 1
+            if self.__g_powers_count != FIXED_BASE_TABLE_THRESHOLD:
+                return None
+            return self.precompute_g_table()
+
+    def precompute_g_table(self, memory: int = None):
+        """Function for building the fixed-base table of g modulo n_square used by power_of_g.
+        The table is not built for g = n + 1, which has a cheaper shortcut.
+
+        :param memory: (int) optional, memory limit in bytes (by default g_table_memory)
+        :return: (FixedBaseTable) table or None if g = n + 1 or no table fits into the memory limit
+        """
+        if memory is not None:
+            self.g_table_memory = memory
+        self.g_table = None
+        if self.g == self.n + 1:
+            return None
+        try:
+            self.g_table = FixedBaseTable(self.g, self.n_square, self.n.bit_length(), memory=self.g_table_memory)
+        except ValueError:
+            # a table does not fit, powmod is used
+            pass
+        return self.g_table
+
+    def generation_obfuscator(self):
+        """Function for generating the obfuscator r ** n modulo n_square, where r is coprime with n.
+
+        :return: (int) r ** n modulo n_square
+        """
+        r = PrimeDigit().gen_mutually(self.n)
+        return powmod(r, self.n, self.n_square)
+
+    def start_obfuscator_pool(self, capacity: int = DEFAULT_POOL_CAPACITY):
+        """Function for starting a background pool of precomputed obfuscators used by encryption.
+
+        :param capacity: (int) optional, maximum number of stored obfuscators
+        :return: (ObfuscatorPool) running pool
+        """
+        pool = self.obfuscator_pool
+        if pool is None:
+            pool = self.obfuscator_pool = ObfuscatorPool(self.generation_obfuscator, capacity)
+        pool.start()
+        return pool
 
-    def encryption(self, plaintext_as_digits_list: [int], don_t_use_r: bool = False):
+    def stop_obfuscator_pool(self):
+        """Function for stopping and detaching the pool of precomputed obfuscators.
+        Threads encrypting at the same time generate obfuscators inline from then on.
+
+        :return: None
+        """
+        # detached first, so a concurrent call or encryption never sees a half-stopped pool
+        pool, self.obfuscator_pool = self.obfuscator_pool, None
+        if pool is not None:
+            pool.stop()
+
+    def next_obfuscator(self):
+        """Function for taking the next obfuscator from the pool or generating it inline.
+
+        :return: (int) r ** n modulo n_square
+        """
+        with measure("encryption.randomness"):
+            # read once, the pool may be detached by another thread
+            pool = self.obfuscator_pool
+            if pool is not None:
+                return pool.get()
+            return self.generation_obfuscator()
+
+    def raw_encryption(self, digit: int, obfuscator: int = 1):
+        """Encryption function of one unencrypted number without checking it.
+
+        :param digit: (int) unencrypted number from Z_n
+        :param obfuscator: (int) optional, r ** n modulo n_square (1 - deterministic encryption)
+        :return: (int) encrypted number
+        """
+        with measure("encryption.modexp"):
+            if obfuscator == 1:
+                return self.power_of_g(digit)
+            return (self.power_of_g(digit) * obfuscator) % self.n_square
+
+    @property
+    def ciphertext_width(self):
+        """Size of one encrypted number in bytes, used by EncryptedVector.
+
+        :return: (int) width in bytes
+        """
+        return EncryptedVector.width_for_modulo(self.n_square)
+
+    @instrumented("encryption", "plaintext_as_digits_list")
+    def encryption(
+            self,
+            plaintext_as_digits_list: [int],
+            don_t_use_r: bool = False,
+            as_vector: bool = False,
+            validate: bool = True,
+            obfuscate: bool = True
+    ):
         """Encryption function of plain text presented as a list of unencrypted numbers.
 
         :param don_t_use_r: (bool) optional, used for homomorphic encryption function
         :param plaintext_as_digits_list: (list[int]) - list of unencrypted numbers
-        :return: empty list [] or non-empty list including encrypted digits
+        :param as_vector: (bool) optional, return the encrypted digits packed into EncryptedVector
+        :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+        :param obfuscate: (bool) optional, False postpones r: an EncryptedVector is obfuscated by its obfuscate()
+                          or serialization, a list by the obfuscate function of the key
+        :return: list (or EncryptedVector) including encrypted digits
+        :raises PlaintextError: if validate and some numbers do not belong to Z_n
         """
-        plaintext_is_current: bool = check_plaintext(
-            plaintext_as_digits_list, self.n
-        )
-        if plaintext_is_current:
-            encrypt_text_as_digits_list = []
-            if don_t_use_r:
-                for digit in plaintext_as_digits_list:
-                    encrypt_text_as_digits_list.append(
-                        ((self.g ** digit) * (1 ** self.n)) % self.n_square
-                    )
-            else:
-                for digit in plaintext_as_digits_list:
-                    r = PrimeDigit().gen_random(self.n)
-                    encrypt_text_as_digits_list.append(
-                        ((self.g ** digit) * (r ** self.n)) % self.n_square
-                    )
-            return encrypt_text_as_digits_list
+        if validate:
+            with measure("encryption.validation", len(plaintext_as_digits_list)):
+                check_plaintext(plaintext_as_digits_list, self.n)
+        if don_t_use_r or not obfuscate:
+            encrypt_digits = (self.raw_encryption(digit) for digit in plaintext_as_digits_list)
         else:
-            return []
+            encrypt_digits = (
+                self.raw_encryption(digit, self.next_obfuscator()) for digit in plaintext_as_digits_list
+            )
+        if as_vector:
+            obfuscator_key = None if don_t_use_r or obfuscate else self
+            return EncryptedVector.from_iterable(encrypt_digits, self.ciphertext_width, obfuscator_key)
+        return list(encrypt_digits)
+
+    def obfuscate(self, encrypt_text):
+        """Function for re-randomizing encrypted numbers by fresh obfuscators r ** n (from the pool if started),
+        e.g. results of homomorphic operations before they are sent out.
+
+        :param encrypt_text: (int, list [int] or EncryptedVector) encrypted numbers
+        :return: (int) or a new list [int]; EncryptedVector is re-randomized in place and returned
+        """
+        if isinstance(encrypt_text, EncryptedVector):
+            return encrypt_text.obfuscate(self)
+        if isinstance(encrypt_text, Integral):
+            return (encrypt_text * self.next_obfuscator()) % self.n_square
+        return [(encrypt_digit * self.next_obfuscator()) % self.n_square for encrypt_digit in encrypt_text]
+
+    @instrumented("encryption", "plaintext_as_digits_list")
+    def encrypt_batch(
+            self,
+            plaintext_as_digits_list: [int],
+            workers: int = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            don_t_use_r: bool = False,
+            return_statistics: bool = False,
+            validate: bool = True
+    ):
+        """Encryption function of a large list sharded across a pool of processes.
+
+        :param plaintext_as_digits_list: (list[int]) - list of unencrypted numbers
+        :param workers: (int) optional, number of processes (by default the number of CPUs)
+        :param chunk_size: (int) optional, number of numbers per task
+        :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+        :param return_statistics: (bool) optional, also return the throughput statistics
+        :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+        :return: list [int] of encrypted digits in input order and (dict) statistics if return_statistics
+        :raises PlaintextError: if validate and some numbers do not belong to Z_n
+        """
+        if validate:
+            with measure("encryption.validation", len(plaintext_as_digits_list)):
+                check_plaintext(plaintext_as_digits_list, self.n)
+        encrypt_text_as_digits_list, statistics = batch_map(
+            self, encrypt_chunk, plaintext_as_digits_list, workers, chunk_size, (don_t_use_r,)
+        )
+        if return_statistics:
+            return encrypt_text_as_digits_list, statistics
+        return encrypt_text_as_digits_list
+
+    def encrypt_stream(
+            self,
+            plaintext_digits,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            workers: int = 1,
+            max_pending: int = None,
+            don_t_use_r: bool = False,
+            validate: bool = True
+    ):
+        """Generator encrypting an iterable of unencrypted numbers (e.g. a file) chunk by chunk
+        in constant memory, see py_paillier.streaming.
+
+        :param plaintext_digits: iterable of (int) unencrypted numbers
+        :param chunk_size: (int) optional, number of numbers per chunk
+        :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+        :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+        :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+        :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+        :return: generator of (int) encrypted numbers in input order
+        :raises PlaintextError: if validate and some numbers do not belong to Z_n
+        """
+        return encrypt_stream(self, plaintext_digits, chunk_size, workers, max_pending, don_t_use_r, validate)
+
+    async def encrypt_async(
+            self,
+            plaintext_as_digits_list: [int],
+            executor=None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            don_t_use_r: bool = False,
+            validate: bool = True
+    ):
+        """Coroutine encrypting a list in an executor chunk by chunk without blocking the event loop,
+        see py_paillier.asynchronous.
+
+        :param plaintext_as_digits_list: (list[int]) - list of unencrypted numbers
+        :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+        :param chunk_size: (int) optional, number of numbers per chunk
+        :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+        :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+        :return: list [int] of encrypted digits
+        :raises PlaintextError: if validate and some numbers do not belong to Z_n
+        """
+        return await encrypt_async(self, plaintext_as_digits_list, executor, chunk_size, don_t_use_r, validate)
 
 
 class PaillierPrivateKey(object):
@@ -94,17 +355,67 @@ class PaillierPrivateKey(object):
             __public_key (object): object of class PaillierPublicKey
             __p (int): large prime
             __q (int): large prime
+            __p_square, __q_square (int): (p ** 2) and (q ** 2), stored for CRT decryption
+            __hp, __hq (int): CRT decryption constants - see [2]
+            __p_inverse (int): reverse digit of p modulo q, stored for CRT recombination
 
     Links:
         [1] - https://en.wikipedia.org/wiki/Paillier_cryptosystem#Key_generation
+        [2] - https://en.wikipedia.org/wiki/Paillier_cryptosystem#Decryption
     """
 
-    def __init__(self, public_key, p, q):
+    PRECOMPUTED_FIELDS = ("lambdas", "mu", "hp", "hq", "p_inverse")
+
+    def __init__(self, public_key, p, q, precomputed: dict = None):
+        """
+        :param public_key: object of class PaillierPublicKey
+        :param p: (int) large prime
+        :param q: (int) large prime
+        :param precomputed: (dict) optional, already known derived values (see PRECOMPUTED_FIELDS)
+                            which are taken as is instead of being calculated
+        """
+        precomputed = precomputed or {}
         self.__public_key: PaillierPublicKey = public_key
         self.__p = p
         self.__q = q
-        self.lambdas = self.generation_lambdas(self.__p, self.__q)
-        self.mu = self.generation_mu(self.__public_key.g, self.__public_key.n, self.lambdas)
+        self.lambdas = precomputed.get("lambdas") or self.generation_lambdas(self.__p, self.__q)
+        self.mu = precomputed.get("mu") or self.generation_mu(self.__public_key.g, self.__public_key.n, self.lambdas)
+
+        # parameters for CRT decryption
+        self.__p_square = p ** 2
+        self.__q_square = q ** 2
+        self.__hp = precomputed.get("hp") or self.generation_h(self.__public_key.g, p, self.__p_square)
+        self.__hq = precomputed.get("hq") or self.generation_h(self.__public_key.g, q, self.__q_square)
+        self.__p_inverse = precomputed.get("p_inverse") or invert(p, q)
+
+    @property
+    def public_key(self):
+        """Public key of the pair.
+
+        :return: object of class PaillierPublicKey
+        """
+        return self.__public_key
+
+    def private_values(self, include_precomputed: bool = True):
+        """Function for exporting the private numbers, e.g. for serialization.
+
+        :param include_precomputed: (bool) optional, also export the derived values of PRECOMPUTED_FIELDS
+        :return: (dict) p, q and, optionally, lambdas, mu, hp, hq, p_inverse
+        """
+        values = {"p": self.__p, "q": self.__q}
+        if include_precomputed:
+            values.update(
+                lambdas=self.lambdas, mu=self.mu, hp=self.__hp, hq=self.__hq, p_inverse=self.__p_inverse
+            )
+        return values
+
+    def reduced_residue_system(self, square: bool = False):
+        """Function for getting the units modulo n (or n ** 2, the ciphertext space) by the known p and q.
+
+        :param square: (bool) optional, modulo n ** 2 instead of n
+        :return: (ReducedResidueSystem) lazy system with the totient, enumeration, sampling and membership
+        """
+        return ReducedResidueSystem.for_private_key(self, square)
 
     @staticmethod
     def generation_lambdas(p: int, q: int):
@@ -126,47 +437,146 @@ class PaillierPrivateKey(object):
         :param _lambdas: (int) _lambdas as least common multiple of (p - 1) and (q - 1)
         :return: (int) mu as reverse digit modulo _n
         """
-        result_l_func = l_func(pow(_g, _lambdas, _n ** 2), _n)
-        reverse_digit = Euclid().reverse_digit(result_l_func, _n)
-        mu = reverse_digit % _n
+        result_l_func = l_func(powmod(_g, _lambdas, _n ** 2), _n)
+        mu = invert(result_l_func, _n)
         return mu
 
+    @staticmethod
+    def generation_h(_g: int, prime: int, prime_square: int):
+        """Function for generating the CRT decryption constant hp (or hq) for one of the primes.
+
+        :param _g: (int) part of public key
+        :param prime: (int) p or q
+        :param prime_square: (int) (prime ** 2)
+        :return: (int) reverse digit of L(g ** (prime - 1) mod prime ** 2) modulo prime
+        """
+        result_l_func = l_func(powmod(_g, prime - 1, prime_square), prime)
+        return invert(result_l_func, prime)
+
     def show_private_key(self):
         """Private key display function
 
         :return: None
         """
-        print(f"private_key: {self.lambdas}, {self.mu}")
+        with measure("printing"):
+            print(f"private_key: {self.lambdas}, {self.mu}")
+
+    def raw_decryption_via_lambda(self, encrypt_digit: int):
+        """Decryption function of one encrypted number over the full modulo n_square.
+
+        :param encrypt_digit: (int) encrypted number
+        :return: (int) decrypted number
+        """
+        return (
+                (l_func(
+                    powmod(encrypt_digit, self.lambdas, self.__public_key.n_square),
+                    self.__public_key.n
+                ) * self.mu) % self.__public_key.n
+        )
+
+    def raw_decryption_via_crt(self, encrypt_digit: int):
+        """Decryption function of one encrypted number by the Chinese remainder theorem - see [1].
+        Exponentiation is done modulo p ** 2 and q ** 2 separately, then the results are recombined.
+
+        :param encrypt_digit: (int) encrypted number
+        :return: (int) decrypted number
+
+        Links:
+            [1] - https://en.wikipedia.org/wiki/Chinese_remainder_theorem
+        """
+        mp = (l_func(powmod(encrypt_digit, self.__p - 1, self.__p_square), self.__p) * self.__hp) % self.__p
+        mq = (l_func(powmod(encrypt_digit, self.__q - 1, self.__q_square), self.__q) * self.__hq) % self.__q
+        return mp + (((mq - mp) * self.__p_inverse) % self.__q) * self.__p
+
+    def raw_decryption(self, encrypt_digit: int):
+        """Decryption function of one encrypted number.
+        CRT decryption is selected when the primes p and q are known.
+
+        :param encrypt_digit: (int) encrypted number
+        :return: (int) decrypted number
+        """
+        if self.__p is not None and self.__q is not None:
+            return self.raw_decryption_via_crt(encrypt_digit)
+        return self.raw_decryption_via_lambda(encrypt_digit)
 
+    @instrumented("decryption", "encryption_digits_list")
     def decryption(self, encryption_digits_list: [int]):
         """Function for decrypting a list of encrypted numbers.
 
-        :param encryption_digits_list: list [int] - list of encrypted numbers
+        :param encryption_digits_list: list [int] or EncryptedVector - list of encrypted numbers
         :return: list [int] - list of decrypted numbers
         """
-        decrypt_text = []
-        for encrypt_digit in encryption_digits_list:
-            decrypt_digit = (
-                    (l_func(
-                        pow(encrypt_digit, self.lambdas, self.__public_key.n_square),
-                        self.__public_key.n
-                    ) * self.mu) % self.__public_key.n
-            )
-            decrypt_text.append(decrypt_digit)
+        return [self.raw_decryption(encrypt_digit) for encrypt_digit in encryption_digits_list]
+
+    @instrumented("decryption", "encryption_digits_list")
+    def decrypt_batch(
+            self,
+            encryption_digits_list: [int],
+            workers: int = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            return_statistics: bool = False
+    ):
+        """Function for decrypting a large list sharded across a pool of processes.
 
+        :param encryption_digits_list: list [int] - list of encrypted numbers
+        :param workers: (int) optional, number of processes (by default the number of CPUs)
+        :param chunk_size: (int) optional, number of numbers per task
+        :param return_statistics: (bool) optional, also return the throughput statistics
+        :return: list [int] of decrypted numbers in input order and (dict) statistics if return_statistics
+        """
+        decrypt_text, statistics = batch_map(self, decrypt_chunk, encryption_digits_list, workers, chunk_size)
+        if return_statistics:
+            return decrypt_text, statistics
         return decrypt_text
 
+    def decrypt_stream(
+            self,
+            encryption_digits,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            workers: int = 1,
+            max_pending: int = None
+    ):
+        """Generator decrypting an iterable of encrypted numbers (e.g. a file) chunk by chunk
+        in constant memory, see py_paillier.streaming.
+
+        :param encryption_digits: iterable of (int) encrypted numbers
+        :param chunk_size: (int) optional, number of numbers per chunk
+        :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+        :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+        :return: generator of (int) decrypted numbers in input order
+        """
+        return decrypt_stream(self, encryption_digits, chunk_size, workers, max_pending)
+
+    async def decrypt_async(self, encryption_digits_list: [int], executor=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Coroutine decrypting a list in an executor chunk by chunk without blocking the event loop,
+        see py_paillier.asynchronous.
+
+        :param encryption_digits_list: list [int] or EncryptedVector - list of encrypted numbers
+        :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+        :param chunk_size: (int) optional, number of numbers per chunk
+        :return: list [int] - list of decrypted numbers
+        """
+        return await decrypt_async(self, encryption_digits_list, executor, chunk_size)
+
 
 class PaillierKeyPairGenerator(object):
     """Class includes function for generation public and private keys.
 
     """
     @staticmethod
-    def paillier_key_pair_generation(bit_key_length: int = DEFAULT_BIT_KEY_LENGTH, return_pq: bool = False):
+    @instrumented("keygen")
+    def paillier_key_pair_generation(
+            bit_key_length: int = DEFAULT_BIT_KEY_LENGTH,
+            return_pq: bool = False,
+            rounds: int = DEFAULT_MILLER_RABIN_ROUNDS,
+            parallel: bool = False
+    ):
         """Function for generating public and private keys based on the bit length of the key.
 
         :param bit_key_length: (int) key length in bits (optional)
         :param return_pq: (bool) used for test
+        :param rounds: (int) optional, number of Miller-Rabin rounds for p and q
+        :param parallel: (bool) optional, generate p and q in two processes
         :return: object's of classes PaillierPublicKey and PaillierPrivateKey
         """
 
@@ -177,24 +587,29 @@ class PaillierKeyPairGenerator(object):
             :param half_bit_key_length: (int) half of key length in bits
             :return: (int) _p and (int) _q as large primes
             """
+            arguments = (half_bit_key_length, rounds, is_prime)
 
             _p = 3
             _q = 2
 
-            while Euclid().greatest_common_divisor(_p * _q, (_p - 1) * (_q - 1)) != 1:
-                _p = PrimeDigit().generation_a_large_prime(half_bit_key_length)
-                _q = PrimeDigit().generation_a_large_prime(half_bit_key_length)
+            while gcd(_p * _q, (_p - 1) * (_q - 1)) != 1:
+                if parallel:
+                    with ProcessPoolExecutor(max_workers=2) as executor:
+                        futures = [
+                            executor.submit(PrimeDigit.generation_a_large_prime_by_sieve, *arguments) for _ in range(2)
+                        ]
+                        _p, _q = [future.result() for future in futures]
+                else:
+                    _p = PrimeDigit().generation_a_large_prime_by_sieve(*arguments)
+                    _q = PrimeDigit().generation_a_large_prime_by_sieve(*arguments)
                 while _q == _p:
-                    _q = PrimeDigit().generation_a_large_prime(half_bit_key_length)
+                    _q = PrimeDigit().generation_a_large_prime_by_sieve(*arguments)
 
             return _p, _q
 
         p, q = p_q_generating(bit_key_length // 2)
 
-        n = p * q
-
-        public_key = PaillierPublicKey(n)
-        private_key = PaillierPrivateKey(public_key, p, q)
+        public_key, private_key = PaillierKeyPairGenerator.paillier_key_pair_generation_from_pq(p, q)
         if return_pq:
             return public_key, private_key, p, q
         else:
@@ -217,12 +632,15 @@ class PaillierKeyPairGenerator(object):
 
 
 class Homomorphic(PaillierPublicKey):
-    """
+    """Homomorphic operations on texts encrypted with the public key (n, g).
 
+    The list methods (addition_of_two_ciphertexts, ...) work on texts of equal length.
+    The vectorized methods (addition, addition_of_plaintext, multiplication_by_plaintext) broadcast
+    a scalar operand over a list or EncryptedVector, can write into a preallocated output
+    and can be sharded across processes.
     """
     def __init__(self, n, g):
-        super().__init__(n)
-        self.g = g
+        super().__init__(n, g)
 
     @staticmethod
     def comparison_of_text_lengths(
@@ -238,21 +656,19 @@ class Homomorphic(PaillierPublicKey):
         length_first_enc_text = len(first_encrypt_text_as_digits_list)
         length_second_enc_text = len(second_encrypt_text_as_digits_list)
         if length_first_enc_text != length_second_enc_text:
-            print("The texts are different in length.")
-            if length_first_enc_text > length_second_enc_text:
-                print("The first text is longer than the second. Add to the second text its values from the beginning "
-                      "of the list, and then cut the second text to the length of the first in any way convenient for "
-                      "you. ")
-                print("Example (second_encrypt_text_as_digits_list * 2)[:len(first_encrypt_text_as_digits_list)]")
-            else:
-                print("The second text is longer than the first. Add to the first text its values from the beginning "
-                      "of the list, and then cut the first text to the length of the second in any way convenient for "
-                      "you. ")
-                print("Example (first_encrypt_text_as_digits_list * 2)[:len(second_encrypt_text_as_digits_list)]")
+            shorter, longer = ("first", "second") if length_first_enc_text < length_second_enc_text else (
+                "second", "first"
+            )
+            logger.warning(
+                "The texts are different in length: %d and %d. Repeat the %s text from the beginning of the list "
+                "and cut it to the length of the %s one, e.g. (%s_text * 2)[:len(%s_text)]",
+                length_first_enc_text, length_second_enc_text, shorter, longer, shorter, longer
+            )
             return False
         else:
             return True
 
+    @instrumented("homomorphic.addition_of_two_ciphertexts", "first_encrypt_text_as_digits_list")
     def addition_of_two_ciphertexts(
             self,
             first_encrypt_text_as_digits_list: [int],
@@ -269,14 +685,15 @@ class Homomorphic(PaillierPublicKey):
         addition = []
 
         if not self.comparison_of_text_lengths(first_encrypt_text_as_digits_list, second_encrypt_text_as_digits_list):
-            print("An empty list will be returned to you.")
+            logger.warning("An empty list will be returned.")
         else:
             for i in range(len(first_encrypt_text_as_digits_list)):
                 addition.append(
                     (first_encrypt_text_as_digits_list[i] * second_encrypt_text_as_digits_list[i]) % self.n_square
                 )
-        return addition
+        return self.__result_like(first_encrypt_text_as_digits_list, addition)
 
+    @instrumented("homomorphic.addition_of_cipher_and_plaintext_via_g", "first_encrypt_text_as_digits_list")
     def addition_of_cipher_and_plaintext_via_g(
             self,
             first_encrypt_text_as_digits_list: [int],
@@ -293,14 +710,25 @@ class Homomorphic(PaillierPublicKey):
         addition = []
 
         if not self.comparison_of_text_lengths(first_encrypt_text_as_digits_list, second_plaintext_as_digits_list):
-            print("An empty list will be returned to you.")
+            logger.warning("An empty list will be returned.")
         else:
             second_encrypt_text_as_digits_list = self.encryption(second_plaintext_as_digits_list, True)
             for i in range(len(first_encrypt_text_as_digits_list)):
                 addition.append(
                     (first_encrypt_text_as_digits_list[i] * second_encrypt_text_as_digits_list[i]) % self.n_square
                 )
-        return addition
+        return self.__result_like(first_encrypt_text_as_digits_list, addition)
+
+    def __result_like(self, encrypt_text, result_list: [int]):
+        """Helper function for returning a result of the same container type as the encrypted input.
+
+        :param encrypt_text: (list [int] or EncryptedVector) encrypted input
+        :param result_list: (list [int]) encrypted result
+        :return: EncryptedVector if the input is EncryptedVector, otherwise result_list
+        """
+        if isinstance(encrypt_text, EncryptedVector):
+            return EncryptedVector.from_iterable(result_list, encrypt_text.width, encrypt_text.obfuscator_key)
+        return result_list
 
     def __raising_an_encrypted_number_to_the_k_power(
             self,
@@ -313,8 +741,9 @@ class Homomorphic(PaillierPublicKey):
         :param k_power: (int) power
         :return: (int)
         """
-        return pow(encrypted_number, k_power, self.n_square)
+        return powmod(encrypted_number, k_power, self.n_square)
 
+    @instrumented("homomorphic.raising_of_ciphertext_to_the_power_of_plaintext", "first_encrypt_text_as_digits_list")
     def raising_of_ciphertext_to_the_power_of_plaintext(
             self,
             first_encrypt_text_as_digits_list: [int],
@@ -331,7 +760,7 @@ class Homomorphic(PaillierPublicKey):
         result_list = []
 
         if not self.comparison_of_text_lengths(first_encrypt_text_as_digits_list, second_plaintext_as_digits_list):
-            print("An empty list will be returned to you.")
+            logger.warning("An empty list will be returned.")
         else:
             for i in range(len(first_encrypt_text_as_digits_list)):
                 result_list.append(
@@ -339,8 +768,9 @@ class Homomorphic(PaillierPublicKey):
                         first_encrypt_text_as_digits_list[i], second_plaintext_as_digits_list[i]
                     )
                 )
-        return result_list
+        return self.__result_like(first_encrypt_text_as_digits_list, result_list)
 
+    @instrumented("homomorphic.raising_the_ciphertext_to_the_k_power", "encrypt_text_as_digits_list")
     def raising_the_ciphertext_to_the_k_power(
             self,
             encrypt_text_as_digits_list: [int],
@@ -361,4 +791,353 @@ class Homomorphic(PaillierPublicKey):
                     encrypt_text_as_digits_list[i], k_power
                 )
             )
-        return result_list
+        return self.__result_like(encrypt_text_as_digits_list, result_list)
+
+    def raw_addition(self, first_encrypt_digit: int, second_encrypt_digit: int):
+        """Function for adding two encrypted numbers.
+
+        :param first_encrypt_digit: (int) encrypted number
+        :param second_encrypt_digit: (int) encrypted number
+        :return: (int) encrypted sum
+        """
+        return (first_encrypt_digit * second_encrypt_digit) % self.n_square
+
+    def raw_addition_of_plaintext(self, encrypt_digit: int, digit: int):
+        """Function for adding an unencrypted number to an encrypted one via g.
+
+        :param encrypt_digit: (int) encrypted number
+        :param digit: (int) unencrypted number
+        :return: (int) encrypted sum
+        """
+        return (encrypt_digit * self.power_of_g(digit)) % self.n_square
+
+    def raw_multiplication_by_plaintext(self, encrypt_digit: int, digit: int):
+        """Function for multiplying an encrypted number by an unencrypted one.
+
+        :param encrypt_digit: (int) encrypted number
+        :param digit: (int) unencrypted number
+        :return: (int) encrypted product
+        """
+        return powmod(encrypt_digit, digit, self.n_square)
+
+    def raw_negation(self, encrypt_digit: int):
+        """Function for negating an encrypted number: E(-m) = E(m) ** -1 mod n ** 2.
+
+        :param encrypt_digit: (int) encrypted number
+        :return: (int) encrypted negation
+        :raises ZeroDivisionError: if encrypt_digit is not a ciphertext (not coprime with n)
+        """
+        return invert(encrypt_digit, self.n_square)
+
+    def raw_subtraction(self, first_encrypt_digit: int, second_encrypt_digit: int):
+        """Function for subtracting an encrypted number from another one.
+
+        :param first_encrypt_digit: (int) encrypted minuend
+        :param second_encrypt_digit: (int) encrypted subtrahend
+        :return: (int) encrypted difference
+        :raises ZeroDivisionError: if second_encrypt_digit is not a ciphertext (not coprime with n)
+        """
+        return (first_encrypt_digit * self.raw_negation(second_encrypt_digit)) % self.n_square
+
+    @staticmethod
+    def __broadcast(first, second):
+        """Helper function for matching a scalar operand with a sequence operand.
+
+        :param first: (int, list [int] or EncryptedVector)
+        :param second: (int, list [int] or EncryptedVector)
+        :return: (int or None, iterable, iterable) length of the result (None for two scalars)
+                 and both operands as iterables
+        :raises ValueError: if the operands are sequences of different lengths
+        """
+        first_is_scalar = isinstance(first, Integral)
+        second_is_scalar = isinstance(second, Integral)
+        if first_is_scalar and second_is_scalar:
+            return None, (first,), (second,)
+        if first_is_scalar:
+            return len(second), repeat(first), second
+        if second_is_scalar:
+            return len(first), first, repeat(second)
+        if len(first) != len(second):
+            raise ValueError(f"Operands of lengths {len(first)} and {len(second)} could not be broadcast together")
+        return len(first), first, second
+
+    def __apply(self, operation: str, first, second, out, workers: int, chunk_size: int):
+        """Helper function for applying an element-wise raw operation with broadcasting.
+
+        :param operation: (str) name of the raw method, e.g. "raw_addition"
+        :param first: (int, list [int] or EncryptedVector) encrypted operand
+        :param second: (int, list [int] or EncryptedVector) second operand
+        :param out: (list [int] or EncryptedVector) optional, preallocated output of the result length
+        :param workers: (int) number of processes, 1 - in the calling process
+        :param chunk_size: (int) number of elements per task for processes
+        :return: (int) for two scalars, otherwise out or a new list (EncryptedVector for EncryptedVector input)
+        """
+        length, firsts, seconds = self.__broadcast(first, second)
+        raw_operation = getattr(self, operation)
+        if length is None:
+            return raw_operation(first, second)
+
+        if workers == 1:
+            results = map(raw_operation, firsts, seconds)
+        else:
+            results, _ = batch_map(
+                self, homomorphic_chunk, list(zip(firsts, seconds)), workers, chunk_size, (operation,)
+            )
+
+        return self.__output(results, length, (first, second), out)
+
+    def __output(self, results, length: int, operands: tuple, out):
+        """Helper function for storing the results of an element-wise operation.
+
+        :param results: (iterable) encrypted results
+        :param length: (int) length of the result
+        :param operands: (tuple) operands of the operation
+        :param out: (list [int] or EncryptedVector) optional, preallocated output of the result length
+        :return: out or a new list (EncryptedVector if any operand is EncryptedVector)
+        :raises ValueError: if out has another length
+        """
+        # results of unobfuscated operands are unobfuscated too
+        obfuscator_key = None
+        for operand in operands:
+            if isinstance(operand, EncryptedVector) and not operand.obfuscated:
+                obfuscator_key = operand.obfuscator_key
+        if out is None:
+            if any(isinstance(operand, EncryptedVector) for operand in operands):
+                return EncryptedVector.from_iterable(results, self.ciphertext_width, obfuscator_key)
+            return list(results)
+        if len(out) != length:
+            raise ValueError(f"Output of length {len(out)} does not match the result length {length}")
+        for i, result in enumerate(results):
+            out[i] = result
+        if isinstance(out, EncryptedVector) and obfuscator_key is not None:
+            out.obfuscator_key = obfuscator_key
+        return out
+
+    @instrumented("homomorphic.addition", "first_encrypt_text")
+    def addition(self, first_encrypt_text, second_encrypt_text, out=None, workers: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for adding encrypted texts (or an encrypted text and an encrypted number).
+
+        :param first_encrypt_text: (int, list [int] or EncryptedVector)
+        :param second_encrypt_text: (int, list [int] or EncryptedVector)
+        :param out: (list [int] or EncryptedVector) optional, preallocated output, e.g. one of the operands
+                    for in-place accumulation
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted sums as out, a new list or EncryptedVector, (int) for two numbers
+        """
+        return self.__apply("raw_addition", first_encrypt_text, second_encrypt_text, out, workers, chunk_size)
+
+    @instrumented("homomorphic.negation", "encrypt_text")
+    def negation(self, encrypt_text, out=None, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for negating an encrypted text. All numbers are inverted modulo n ** 2 together
+        (see multiexp.batch_inversion): one modular inversion and about 3 multiplications per number.
+
+        :param encrypt_text: (int, list [int] or EncryptedVector)
+        :param out: (list [int] or EncryptedVector) optional, preallocated output, e.g. encrypt_text itself
+        :param workers: (int) optional, number of processes (None - the number of CPUs), one inversion per chunk
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted negations as out, a new list or EncryptedVector, (int) for a number
+        :raises ZeroDivisionError: if some number is not a ciphertext (not coprime with n)
+        """
+        if isinstance(encrypt_text, Integral):
+            return self.raw_negation(encrypt_text)
+        if workers == 1:
+            results = batch_inversion(encrypt_text, self.n_square)
+        else:
+            results, _ = batch_map(self, negation_chunk, encrypt_text, workers, chunk_size)
+        return self.__output(results, len(encrypt_text), (encrypt_text,), out)
+
+    @instrumented("homomorphic.subtraction", "first_encrypt_text")
+    def subtraction(self, first_encrypt_text, second_encrypt_text, out=None, workers: int = 1,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for subtracting encrypted texts (or an encrypted number) via the negation
+        of the subtrahend, see negation.
+
+        :param first_encrypt_text: (int, list [int] or EncryptedVector) encrypted minuends
+        :param second_encrypt_text: (int, list [int] or EncryptedVector) encrypted subtrahends
+        :param out: (list [int] or EncryptedVector) optional, preallocated output
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted differences as out, a new list or EncryptedVector, (int) for two numbers
+        :raises ZeroDivisionError: if some subtrahend is not a ciphertext (not coprime with n)
+        """
+        negation = self.negation(second_encrypt_text, None, workers, chunk_size)
+        return self.addition(first_encrypt_text, negation, out, workers, chunk_size)
+
+    @instrumented("homomorphic.addition_of_plaintext", "encrypt_text")
+    def addition_of_plaintext(self, encrypt_text, plaintext, out=None, workers: int = 1,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for adding plaintext to an encrypted text via g.
+
+        :param encrypt_text: (int, list [int] or EncryptedVector)
+        :param plaintext: (int or list [int]) unencrypted numbers
+        :param out: (list [int] or EncryptedVector) optional, preallocated output
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted sums as out, a new list or EncryptedVector, (int) for two numbers
+        """
+        return self.__apply("raw_addition_of_plaintext", encrypt_text, plaintext, out, workers, chunk_size)
+
+    @instrumented("homomorphic.multiplication_by_plaintext", "encrypt_text")
+    def multiplication_by_plaintext(self, encrypt_text, plaintext, out=None, workers: int = 1,
+                                    chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for multiplying an encrypted text by plaintext (a scalar k or a list).
+
+        :param encrypt_text: (int, list [int] or EncryptedVector)
+        :param plaintext: (int or list [int]) unencrypted numbers
+        :param out: (list [int] or EncryptedVector) optional, preallocated output
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted products as out, a new list or EncryptedVector, (int) for two numbers
+        """
+        return self.__apply("raw_multiplication_by_plaintext", encrypt_text, plaintext, out, workers, chunk_size)
+
+    def decrease_exponent(self, encrypt_text, exponent: int, new_exponent: int, out=None, workers: int = 1,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Function for representing encrypted encodings (see py_paillier.encoding) with a smaller exponent
+        by multiplying them by BASE ** (exponent - new_exponent).
+
+        :param encrypt_text: (int, list [int] or EncryptedVector) encrypted encodings with a common exponent
+        :param exponent: (int) current exponent
+        :param new_exponent: (int) exponent not greater than the current one
+        :param out: (list [int] or EncryptedVector) optional, preallocated output
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: encrypted encodings with new_exponent as out, a new list or EncryptedVector, (int) for a number
+        :raises ValueError: if new_exponent is greater than the current exponent
+        """
+        if new_exponent > exponent:
+            raise ValueError(f"New exponent {new_exponent} should be not greater than {exponent}")
+        if new_exponent == exponent and out is None:
+            return encrypt_text
+        return self.multiplication_by_plaintext(
+            encrypt_text, BASE ** (exponent - new_exponent), out, workers, chunk_size
+        )
+
+    def addition_with_exponents(self, first_encrypt_text, first_exponent: int, second_encrypt_text,
+                                second_exponent: int, out=None, workers: int = 1,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Vectorized function for adding encrypted encodings with different exponents.
+        The operand with the greater exponent is aligned to the smaller one first.
+
+        :param first_encrypt_text: (int, list [int] or EncryptedVector) encrypted encodings
+        :param first_exponent: (int) exponent of the first operand
+        :param second_encrypt_text: (int, list [int] or EncryptedVector) encrypted encodings
+        :param second_exponent: (int) exponent of the second operand
+        :param out: (list [int] or EncryptedVector) optional, preallocated output
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: (encrypted sums, int) the sums as in addition and their common exponent
+        """
+        exponent = min(first_exponent, second_exponent)
+        first_encrypt_text = self.decrease_exponent(first_encrypt_text, first_exponent, exponent, None,
+                                                    workers, chunk_size)
+        second_encrypt_text = self.decrease_exponent(second_encrypt_text, second_exponent, exponent, None,
+                                                     workers, chunk_size)
+        return self.addition(first_encrypt_text, second_encrypt_text, out, workers, chunk_size), exponent
+
+    def __non_negative_weights(self, plaintext: [int]):
+        """Helper function for replacing negative weights by equivalent ones modulo n.
+
+        :param plaintext: (list [int]) unencrypted weights
+        :return: (list [int]) non-negative weights
+        """
+        return [weight if weight >= 0 else weight % self.n for weight in plaintext]
+
+    @instrumented("homomorphic.summation", "encrypt_text")
+    def summation(self, encrypt_text, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Function for the encrypted sum of all numbers of an encrypted text by tree reduction.
+
+        :param encrypt_text: (list [int] or EncryptedVector)
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: (int) encrypted sum (encryption of 0 without r for an empty list), obfuscated once
+                 for an unobfuscated EncryptedVector
+        """
+        partial_sums = encrypt_text
+        if workers != 1 and len(encrypt_text) > chunk_size:
+            partial_sums, _ = batch_map(self, summation_chunk, encrypt_text, workers, chunk_size)
+        return obfuscate_reduction(encrypt_text, tree_product(partial_sums, self.n_square))
+
+    async def summation_async(self, encrypt_text, executor=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Coroutine for the encrypted sum of an encrypted text by chunks in an executor.
+
+        :param encrypt_text: (list [int] or EncryptedVector)
+        :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+        :param chunk_size: (int) optional, number of numbers per chunk
+        :return: (int) encrypted sum
+        """
+        return await summation_async(self, encrypt_text, executor, chunk_size)
+
+    async def dot_product_async(self, encrypt_text, plaintext: [int], executor=None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Coroutine for the encrypted plaintext-weighted sum of an encrypted text by chunks in an executor.
+
+        :param encrypt_text: (list [int] or EncryptedVector)
+        :param plaintext: (list [int]) unencrypted weights
+        :param executor: concurrent.futures.Executor, optional (None - the default executor of the loop)
+        :param chunk_size: (int) optional, number of pairs per chunk
+        :return: (int) encrypted sum of plaintext[i] * decrypted encrypt_text[i]
+        :raises ValueError: if the lengths are different
+        """
+        return await dot_product_async(self, encrypt_text, plaintext, executor, chunk_size)
+
+    @instrumented("homomorphic.dot_product", "encrypt_text")
+    def dot_product(self, encrypt_text, plaintext: [int], workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Function for the encrypted plaintext-weighted sum of an encrypted text by multi-exponentiation.
+
+        :param encrypt_text: (list [int] or EncryptedVector)
+        :param plaintext: (list [int]) unencrypted weights
+        :param workers: (int) optional, number of processes (None - the number of CPUs)
+        :param chunk_size: (int) optional, number of elements per task for processes
+        :return: (int) encrypted sum of plaintext[i] * decrypted encrypt_text[i], obfuscated once
+                 for an unobfuscated EncryptedVector
+        :raises ValueError: if the lengths are different
+        """
+        if len(encrypt_text) != len(plaintext):
+            raise ValueError(f"Got {len(encrypt_text)} encrypted numbers and {len(plaintext)} weights")
+        if workers != 1 and len(encrypt_text) > chunk_size:
+            partial_sums, _ = batch_map(
+                self, dot_product_chunk, list(zip(encrypt_text, plaintext)), workers, chunk_size
+            )
+            result = tree_product(partial_sums, self.n_square)
+        else:
+            result = multi_exponentiation(list(encrypt_text), self.__non_negative_weights(plaintext), self.n_square)
+        return obfuscate_reduction(encrypt_text, result)
+
+    @instrumented("homomorphic.vector_matrix_product", "encrypt_text")
+    def vector_matrix_product(
+            self,
+            encrypt_text,
+            matrix: [[int]],
+            workers: int = 1,
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """Function for multiplying an encrypted vector x by an unencrypted matrix M (x^T M).
+
+        :param encrypt_text: (list [int] or EncryptedVector) encrypted vector of length m
+        :param matrix: (list [list [int]]) m rows of k unencrypted numbers
+        :param workers: (int) optional, number of processes (None - the number of CPUs), sharded by columns
+        :param chunk_size: (int) optional, number of columns per task for processes
+        :return: list [int] (EncryptedVector for EncryptedVector input, obfuscated like the input) of k
+                 encrypted dot products
+        :raises ValueError: if the number of rows differs from the length of the vector
+        """
+        if len(matrix) != len(encrypt_text):
+            raise ValueError(f"Got a vector of length {len(encrypt_text)} and a matrix with {len(matrix)} rows")
+        columns = [self.__non_negative_weights(column) for column in zip(*matrix)]
+
+        if workers != 1 and len(columns) > chunk_size:
+            result_list, _ = batch_map(
+                self, vector_matrix_chunk, columns, workers, chunk_size, (list(encrypt_text),)
+            )
+        elif len(encrypt_text) < PIPPENGER_THRESHOLD:
+            # powers of the encrypted numbers are shared by all columns
+            bases = list(encrypt_text)
+            tables = straus_tables(bases, self.n_square, 4)
+            result_list = [straus(bases, column, self.n_square, 4, tables) for column in columns]
+        else:
+            bases = list(encrypt_text)
+            result_list = [pippenger(bases, column, self.n_square) for column in columns]
+        return self.__result_like(encrypt_text, result_list)
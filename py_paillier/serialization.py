@@ -0,0 +1,187 @@
+"""Serialization of py_paillier keys.
+
+Two formats are supported:
+    JSON - an object with "version", "type" and big integers as hexadecimal strings;
+    binary - MAGIC, version (1 byte), type (1 byte), flags (1 byte), then every integer
+             as a 4-byte big-endian length followed by its big-endian bytes.
+Derived values (n_square for a public key, lambdas, mu and CRT constants for a private key)
+can be embedded, so loading a key is a parse rather than a recalculation.
+"""
+
+import json
+import struct
+
+from py_paillier.py_paillier import PaillierPrivateKey, PaillierPublicKey
+
+FORMAT_VERSION = 1
+MAGIC = b"PPK"
+
+PUBLIC_KEY_TYPE = "paillier_public_key"
+PRIVATE_KEY_TYPE = "paillier_private_key"
+KEY_TYPE_CODES = {PUBLIC_KEY_TYPE: 0, PRIVATE_KEY_TYPE: 1}
+
+PRECOMPUTED_FLAG = 1
+
+PUBLIC_FIELDS = ("n", "g")
+PUBLIC_PRECOMPUTED_FIELDS = ("n_square",)
+PRIVATE_FIELDS = PUBLIC_FIELDS + ("p", "q")
+PRIVATE_PRECOMPUTED_FIELDS = PUBLIC_PRECOMPUTED_FIELDS + PaillierPrivateKey.PRECOMPUTED_FIELDS
+
+
+def public_key_to_dict(public_key: PaillierPublicKey, include_precomputed: bool = False):
+    """Function for representing a public key as a dictionary of integers.
+
+    :param public_key: object of class PaillierPublicKey
+    :param include_precomputed: (bool) optional, also store n_square
+    :return: (dict) type, n, g and, optionally, n_square
+    """
+    values = {"type": PUBLIC_KEY_TYPE, "n": public_key.n, "g": public_key.g}
+    if include_precomputed:
+        values["n_square"] = public_key.n_square
+    return values
+
+
+def private_key_to_dict(private_key: PaillierPrivateKey, include_precomputed: bool = True):
+    """Function for representing a private key together with its public key as a dictionary of integers.
+
+    :param private_key: object of class PaillierPrivateKey
+    :param include_precomputed: (bool) optional, also store n_square, lambdas, mu and CRT constants
+    :return: (dict) type, n, g, p, q and, optionally, the derived values
+    """
+    values = public_key_to_dict(private_key.public_key, include_precomputed)
+    values.update(private_key.private_values(include_precomputed))
+    values["type"] = PRIVATE_KEY_TYPE
+    return values
+
+
+def key_from_dict(values: dict):
+    """Function for creating a key from a dictionary made by public_key_to_dict or private_key_to_dict.
+
+    :param values: (dict)
+    :return: object of class PaillierPublicKey or PaillierPrivateKey
+    :raises ValueError: if the key type is unknown or a required field is missing
+    """
+    key_type = values.get("type")
+    if key_type not in KEY_TYPE_CODES:
+        raise ValueError(f"Unknown key type {key_type!r}")
+    required = PUBLIC_FIELDS if key_type == PUBLIC_KEY_TYPE else PRIVATE_FIELDS
+    missing = [field for field in required if values.get(field) is None]
+    if missing:
+        raise ValueError(f"Fields {missing} are required for {key_type}")
+
+    public_key = PaillierPublicKey(values["n"], values["g"], values.get("n_square"))
+    if key_type == PUBLIC_KEY_TYPE:
+        return public_key
+    precomputed = {field: values[field] for field in PaillierPrivateKey.PRECOMPUTED_FIELDS if field in values}
+    return PaillierPrivateKey(public_key, values["p"], values["q"], precomputed)
+
+
+def key_to_dict(key, include_precomputed: bool = None):
+    """Function for representing any key as a dictionary of integers.
+
+    :param key: object of class PaillierPublicKey or PaillierPrivateKey
+    :param include_precomputed: (bool) optional, by default only private keys store the derived values
+    :return: (dict)
+    """
+    if isinstance(key, PaillierPrivateKey):
+        return private_key_to_dict(key, True if include_precomputed is None else include_precomputed)
+    return public_key_to_dict(key, bool(include_precomputed))
+
+
+def dumps(key, include_precomputed: bool = None):
+    """Function for serializing a key to JSON.
+
+    :param key: object of class PaillierPublicKey or PaillierPrivateKey
+    :param include_precomputed: (bool) optional, by default only private keys store the derived values
+    :return: (str) JSON document
+    """
+    values = key_to_dict(key, include_precomputed)
+    document = {"version": FORMAT_VERSION, "type": values.pop("type")}
+    document.update((field, format(value, "x")) for field, value in values.items())
+    return json.dumps(document)
+
+
+def loads(document: str):
+    """Function for deserializing a key from JSON.
+
+    :param document: (str) JSON document made by dumps
+    :return: object of class PaillierPublicKey or PaillierPrivateKey
+    :raises ValueError: if the document is malformed or has an unsupported version
+    """
+    values = json.loads(document)
+    if not isinstance(values, dict):
+        raise ValueError("Document is not a serialized py_paillier key")
+    if values.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported key format version {values.get('version')!r}")
+    numbers = {}
+    for field, value in values.items():
+        if field in ("version", "type"):
+            continue
+        if not isinstance(value, str):
+            raise ValueError(f"Field {field!r} must be a hexadecimal string, got {type(value).__name__}")
+        numbers[field] = int(value, 16)
+    return key_from_dict(dict(numbers, type=values.get("type")))
+
+
+def to_bytes(key, include_precomputed: bool = None):
+    """Function for serializing a key to the binary format.
+
+    :param key: object of class PaillierPublicKey or PaillierPrivateKey
+    :param include_precomputed: (bool) optional, by default only private keys store the derived values
+    :return: (bytes)
+    """
+    values = key_to_dict(key, include_precomputed)
+    key_type = values["type"]
+    fields = PUBLIC_FIELDS if key_type == PUBLIC_KEY_TYPE else PRIVATE_FIELDS
+    precomputed_fields = PUBLIC_PRECOMPUTED_FIELDS if key_type == PUBLIC_KEY_TYPE else PRIVATE_PRECOMPUTED_FIELDS
+    flags = 0
+    if all(field in values for field in precomputed_fields):
+        flags |= PRECOMPUTED_FLAG
+        fields += precomputed_fields
+
+    chunks = [MAGIC, struct.pack(">BBB", FORMAT_VERSION, KEY_TYPE_CODES[key_type], flags)]
+    for field in fields:
+        value = values[field]
+        data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        chunks.append(struct.pack(">I", len(data)))
+        chunks.append(data)
+    return b"".join(chunks)
+
+
+def from_bytes(data: bytes):
+    """Function for deserializing a key from the binary format.
+
+    :param data: (bytes, bytearray or memoryview) made by to_bytes
+    :return: object of class PaillierPublicKey or PaillierPrivateKey
+    :raises ValueError: if the data is malformed or has an unsupported version
+    """
+    data = memoryview(data)
+    header_size = len(MAGIC) + 3
+    if len(data) < header_size or bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Data is not a serialized py_paillier key")
+    version, type_code, flags = struct.unpack_from(">BBB", data, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported key format version {version}")
+    key_types = {code: key_type for key_type, code in KEY_TYPE_CODES.items()}
+    if type_code not in key_types:
+        raise ValueError(f"Unknown key type code {type_code}")
+
+    key_type = key_types[type_code]
+    fields = PUBLIC_FIELDS if key_type == PUBLIC_KEY_TYPE else PRIVATE_FIELDS
+    if flags & PRECOMPUTED_FLAG:
+        fields += PUBLIC_PRECOMPUTED_FIELDS if key_type == PUBLIC_KEY_TYPE else PRIVATE_PRECOMPUTED_FIELDS
+
+    values = {"type": key_type}
+    offset = header_size
+    for field in fields:
+        if offset + 4 > len(data):
+            raise ValueError("Serialized key is truncated")
+        (length,) = struct.unpack_from(">I", data, offset)
+        offset += 4
+        if offset + length > len(data):
+            raise ValueError("Serialized key is truncated")
+        values[field] = int.from_bytes(data[offset:offset + length], "big")
+        offset += length
+    if offset != len(data):
+        raise ValueError(f"Serialized key has {len(data) - offset} unexpected trailing bytes")
+    return key_from_dict(values)
@@ -0,0 +1,517 @@
+"""Decryption server of py_paillier: a private key held by a dedicated process.
+
+Clients send batches of ciphertexts over a Unix socket or localhost TCP. The server splits large batches
+into chunks and joins small ones of different clients into shared batches (see RequestCoalescer), decrypts
+them in a pool of worker threads or processes and streams the results back chunk by chunk.
+LocalDecryptionClient is an in-process stand-in with the same interface, e.g. for tests.
+
+Protocol: every message is a frame - type (1 byte) and payload length (4 bytes, big-endian), then the payload.
+    REQUEST_FRAME - ciphertexts serialized as an EncryptedVector;
+    RESULT_FRAME - the next chunk of decrypted numbers in the same format (width of n);
+    END_FRAME - the request is finished, empty payload;
+    ERROR_FRAME - the request failed, the payload is the UTF-8 message;
+    STATISTICS_FRAME - empty request of the server statistics, answered with JSON.
+
+Usage:
+    python -m py_paillier.server private_key.json (--unix PATH | --port PORT) [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from py_paillier import serialization
+from py_paillier.asynchronous import DEFAULT_COALESCING_DELAY, RequestCoalescer
+from py_paillier.instrumentation import Histogram
+from py_paillier.parallel import DEFAULT_CHUNK_SIZE, decrypt_chunk, initialize_worker, run_in_worker
+from py_paillier.parallel import split_into_chunks
+from py_paillier.vector import EncryptedVector
+
+FRAME_HEADER = struct.Struct(">BI")
+REQUEST_FRAME = 0
+RESULT_FRAME = 1
+END_FRAME = 2
+ERROR_FRAME = 3
+STATISTICS_FRAME = 4
+
+# frames longer than this number of bytes are rejected
+MAX_FRAME_SIZE = 256 * 2 ** 20
+
+
+class DecryptionError(Exception):
+    """Error of a request reported by the decryption server"""
+
+
+async def read_frame(reader):
+    """Coroutine reading one frame.
+
+    :param reader: asyncio.StreamReader
+    :return: (int, bytes) type and payload, (None, b"") at the end of the stream
+    :raises ValueError: if the frame is longer than MAX_FRAME_SIZE
+    """
+    try:
+        frame_type, length = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    except asyncio.IncompleteReadError:
+        return None, b""
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {length} bytes is longer than {MAX_FRAME_SIZE}")
+    return frame_type, await reader.readexactly(length)
+
+
+def write_frame(writer, frame_type: int, payload: bytes = b""):
+    """Function for writing one frame, the caller drains the writer.
+
+    :param writer: asyncio.StreamWriter
+    :param frame_type: (int) one of *_FRAME
+    :param payload: (bytes) optional
+    :return: None
+    """
+    writer.write(FRAME_HEADER.pack(frame_type, len(payload)))
+    writer.write(payload)
+
+
+class DecryptionServer(object):
+    """Holder of a private key decrypting coalesced batches of many clients.
+
+    Args:
+        :arg private_key: PaillierPrivateKey \n
+        :arg workers (int): number of worker processes, 1 - one worker thread \n
+        :arg max_batch (int): number of ciphertexts per chunk and per coalesced batch \n
+        :arg max_pending (int): number of chunks of one request decrypted ahead of sending \n
+        :arg queue_depth (int): number of ciphertexts accepted and not decrypted yet \n
+        :arg max_queue_depth (int): maximum queue_depth ever reached \n
+        :arg latency (Histogram): durations of finished requests \n
+    """
+
+    def __init__(self, private_key, workers: int = 1, max_batch: int = DEFAULT_CHUNK_SIZE,
+                 max_delay: float = DEFAULT_COALESCING_DELAY, max_pending: int = None):
+        """
+        :param private_key: PaillierPrivateKey
+        :param workers: (int) optional, number of worker processes, 1 - one worker thread
+        :param max_batch: (int) optional, number of ciphertexts per chunk and per coalesced batch
+        :param max_delay: (float) optional, the longest wait of a small request for others in seconds
+        :param max_pending: (int) optional, chunks of one request decrypted ahead (by default 2 * workers)
+        :raises ValueError: if workers is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"The number of workers must be positive, got {workers}")
+        self.private_key = private_key
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_pending = max_pending or 2 * workers
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.latency = Histogram()
+        self.result_width = EncryptedVector.width_for_modulo(private_key.public_key.n)
+
+        if workers == 1:
+            self.__executor = ThreadPoolExecutor(1)
+            self.__coalescer = RequestCoalescer(private_key, decrypt_chunk, self.__executor, max_batch, max_delay)
+        else:
+            # the key is shipped once to every worker process, so run_in_worker(decrypt_chunk, batch)
+            # takes the place of decrypt_chunk(private_key, batch)
+            self.__executor = ProcessPoolExecutor(workers, initializer=initialize_worker, initargs=(private_key,))
+            self.__coalescer = RequestCoalescer(decrypt_chunk, run_in_worker, self.__executor, max_batch, max_delay)
+        self.__servers = []
+        self.__connections = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def decrypt_chunks(self, encrypt_text):
+        """Asynchronous generator decrypting ciphertexts by chunks of max_batch.
+        At most max_pending chunks are decrypted ahead of the consumer.
+
+        :param encrypt_text: list [int] or EncryptedVector of encrypted numbers
+        :return: async iterator of (list[int]) decrypted chunks in input order
+        """
+        start = time.perf_counter()
+        digits_list = list(encrypt_text)
+        remaining = len(digits_list)
+        self.__enqueue(remaining)
+        pending = deque()
+        try:
+            for chunk in split_into_chunks(digits_list, self.max_batch):
+                pending.append(asyncio.ensure_future(self.__coalescer.submit(chunk)))
+                if len(pending) >= self.max_pending:
+                    result = await pending.popleft()
+                    remaining -= len(result)
+                    self.__enqueue(-len(result))
+                    yield result
+            while pending:
+                result = await pending.popleft()
+                remaining -= len(result)
+                self.__enqueue(-len(result))
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            self.__enqueue(-remaining)
+        self.latency.add(time.perf_counter() - start)
+
+    async def decrypt(self, encrypt_text):
+        """Coroutine decrypting ciphertexts, see decrypt_chunks.
+
+        :param encrypt_text: list [int] or EncryptedVector of encrypted numbers
+        :return: (list[int]) decrypted numbers
+        """
+        return [digit async for chunk in self.decrypt_chunks(encrypt_text) for digit in chunk]
+
+    def statistics(self):
+        """Function for getting the statistics of the server.
+
+        :return: (dict) connections, requests, batches, items, queue_depth, max_queue_depth
+                 and latency_ms (count, mean and percentiles of finished requests)
+        """
+        statistics = dict(self.__coalescer.statistics)
+        statistics.update(
+            connections=self.__connections,
+            queue_depth=self.queue_depth,
+            max_queue_depth=self.max_queue_depth,
+            latency_ms={name: value * 1000 if name != "count" else value
+                        for name, value in self.latency.summary().items()},
+        )
+        return statistics
+
+    async def start_unix(self, path: str):
+        """Coroutine starting to accept clients on a Unix socket.
+
+        :param path: (str) path of the socket
+        :return: asyncio.Server
+        """
+        server = await asyncio.start_unix_server(self.__handle_connection, path)
+        self.__servers.append(server)
+        return server
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0):
+        """Coroutine starting to accept clients on a TCP port.
+
+        :param host: (str) optional, by default only local clients
+        :param port: (int) optional, 0 - any free port
+        :return: (int) port
+        """
+        server = await asyncio.start_server(self.__handle_connection, host, port)
+        self.__servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Coroutine serving the started sockets until cancelled.
+
+        :return: None
+        """
+        await asyncio.gather(*(server.serve_forever() for server in self.__servers))
+
+    async def close(self):
+        """Coroutine stopping the sockets and the worker pool.
+
+        :return: None
+        """
+        for server in self.__servers:
+            server.close()
+            await server.wait_closed()
+        self.__servers = []
+        self.__coalescer.flush()
+        await asyncio.get_running_loop().run_in_executor(None, self.__executor.shutdown)
+
+    def __enqueue(self, length: int):
+        """Helper function for changing the queue depth.
+
+        :param length: (int) number of added (negative - removed) ciphertexts
+        :return: None
+        """
+        self.queue_depth += length
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    async def __handle_connection(self, reader, writer):
+        """Helper coroutine serving the requests of one client one by one.
+
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        self.__connections += 1
+        try:
+            while True:
+                try:
+                    frame_type, payload = await read_frame(reader)
+                except ValueError as error:
+                    write_frame(writer, ERROR_FRAME, str(error).encode())
+                    break
+                if frame_type is None:
+                    break
+                if frame_type == STATISTICS_FRAME:
+                    write_frame(writer, STATISTICS_FRAME, json.dumps(self.statistics()).encode())
+                elif frame_type == REQUEST_FRAME:
+                    await self.__handle_request(payload, writer)
+                else:
+                    write_frame(writer, ERROR_FRAME, f"Unknown frame type {frame_type}".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__connections -= 1
+            writer.close()
+
+    async def __handle_request(self, payload: bytes, writer):
+        """Helper coroutine decrypting one request and streaming the results.
+
+        :param payload: (bytes) serialized EncryptedVector
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        try:
+            encrypt_text = EncryptedVector.from_buffer(payload)
+            async for chunk in self.decrypt_chunks(encrypt_text):
+                write_frame(writer, RESULT_FRAME, EncryptedVector.from_iterable(chunk, self.result_width).to_bytes())
+                await writer.drain()
+        except Exception as error:
+            # a bad request must not stop the server
+            write_frame(writer, ERROR_FRAME, f"{type(error).__name__}: {error}".encode())
+        else:
+            write_frame(writer, END_FRAME)
+
+
+class DecryptionClient(object):
+    """Client of a DecryptionServer, one request at a time per connection.
+
+    A request left early (break, an exception or aclose of decrypt_chunks) is drained up to its END frame,
+    so the connection stays usable. If the stream is interrupted inside a frame (e.g. the task is cancelled
+    while reading), the connection is closed and the client is marked unusable.
+
+    Args:
+        :arg width (int): size of one ciphertext in bytes, see PaillierPublicKey.ciphertext_width \n
+    """
+
+    def __init__(self, reader, writer, width: int):
+        """
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :param width: (int) size of one ciphertext in bytes
+        """
+        self.width = width
+        self.__reader = reader
+        self.__writer = writer
+        self.__lock = asyncio.Lock()
+        self.__broken = False
+
+    @classmethod
+    async def connect_unix(cls, path: str, width: int):
+        """Coroutine connecting to a server on a Unix socket.
+
+        :param path: (str) path of the socket
+        :param width: (int) size of one ciphertext in bytes
+        :return: (DecryptionClient)
+        """
+        return cls(*await asyncio.open_unix_connection(path), width)
+
+    @classmethod
+    async def connect_tcp(cls, port: int, width: int, host: str = "127.0.0.1"):
+        """Coroutine connecting to a server on a TCP port.
+
+        :param port: (int)
+        :param width: (int) size of one ciphertext in bytes
+        :param host: (str) optional
+        :return: (DecryptionClient)
+        """
+        return cls(*await asyncio.open_connection(host, port), width)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def decrypt_chunks(self, encrypt_text):
+        """Asynchronous generator sending ciphertexts and receiving the decrypted chunks as they are ready.
+
+        :param encrypt_text: list [int] or EncryptedVector of encrypted numbers
+        :return: async iterator of (list[int]) decrypted chunks in input order
+        :raises DecryptionError: if the server reports an error or the connection is unusable
+        """
+        if not isinstance(encrypt_text, EncryptedVector):
+            encrypt_text = EncryptedVector.from_iterable(encrypt_text, self.width)
+        async with self.__lock:
+            self.__check_usable()
+            # True while the stream is between frames of the request and may be drained
+            between_frames = False
+            finished = False
+            try:
+                write_frame(self.__writer, REQUEST_FRAME, encrypt_text.to_bytes())
+                await self.__writer.drain()
+                while True:
+                    frame_type, payload = await read_frame(self.__reader)
+                    if frame_type == RESULT_FRAME:
+                        between_frames = True
+                        yield EncryptedVector.from_buffer(payload).to_list()
+                        between_frames = False
+                    elif frame_type == END_FRAME:
+                        finished = True
+                        return
+                    elif frame_type == ERROR_FRAME:
+                        finished = True
+                        raise DecryptionError(payload.decode())
+                    else:
+                        raise DecryptionError("Connection to the decryption server was closed")
+            finally:
+                if not finished:
+                    await self.__abandon_request(between_frames)
+
+    async def __abandon_request(self, between_frames: bool):
+        """Helper function for skipping the rest of a request left early, called under the lock.
+        The frames are read up to END or ERROR; if the stream is inside a frame or breaks,
+        the connection is closed instead.
+
+        :param between_frames: (bool) True if the stream is at the border of frames
+        :return: None
+        """
+        drained = False
+        try:
+            frame_type = RESULT_FRAME if between_frames else None
+            while frame_type == RESULT_FRAME:
+                frame_type, _ = await read_frame(self.__reader)
+            drained = frame_type in (END_FRAME, ERROR_FRAME)
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if not drained:
+                self.__broken = True
+                self.__writer.close()
+
+    def __check_usable(self):
+        """Helper function for refusing requests on a connection closed after an interrupted request.
+
+        :return: None
+        :raises DecryptionError: if the connection is unusable
+        """
+        if self.__broken:
+            raise DecryptionError("Connection to the decryption server was closed after an interrupted request")
+
+    async def decrypt(self, encrypt_text):
+        """Coroutine decrypting ciphertexts on the server, see decrypt_chunks.
+
+        :param encrypt_text: list [int] or EncryptedVector of encrypted numbers
+        :return: (list[int]) decrypted numbers
+        """
+        return [digit async for chunk in self.decrypt_chunks(encrypt_text) for digit in chunk]
+
+    async def statistics(self):
+        """Coroutine getting the statistics of the server.
+
+        :return: (dict) see DecryptionServer.statistics
+        """
+        async with self.__lock:
+            self.__check_usable()
+            write_frame(self.__writer, STATISTICS_FRAME)
+            await self.__writer.drain()
+            frame_type, payload = await read_frame(self.__reader)
+        if frame_type != STATISTICS_FRAME:
+            raise DecryptionError(payload.decode() or "Connection to the decryption server was closed")
+        return json.loads(payload)
+
+    async def close(self):
+        """Coroutine closing the connection.
+
+        :return: None
+        """
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+
+class LocalDecryptionClient(object):
+    """In-process stand-in of DecryptionClient calling a DecryptionServer of the same event loop directly."""
+
+    def __init__(self, server: DecryptionServer):
+        """
+        :param server: (DecryptionServer)
+        """
+        self.server = server
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def decrypt_chunks(self, encrypt_text):
+        """See DecryptionClient.decrypt_chunks"""
+        try:
+            async for chunk in self.server.decrypt_chunks(encrypt_text):
+                yield chunk
+        except Exception as error:
+            raise DecryptionError(f"{type(error).__name__}: {error}") from error
+
+    async def decrypt(self, encrypt_text):
+        """See DecryptionClient.decrypt"""
+        return [digit async for chunk in self.decrypt_chunks(encrypt_text) for digit in chunk]
+
+    async def statistics(self):
+        """See DecryptionClient.statistics"""
+        return json.loads(json.dumps(self.server.statistics()))
+
+    async def close(self):
+        """See DecryptionClient.close, the server is not closed"""
+
+
+async def serve(private_key, path: str = None, host: str = "127.0.0.1", port: int = None, workers: int = 1,
+                max_batch: int = DEFAULT_CHUNK_SIZE, max_delay: float = DEFAULT_COALESCING_DELAY):
+    """Coroutine running a decryption server until cancelled.
+
+    :param private_key: PaillierPrivateKey
+    :param path: (str) optional, path of a Unix socket
+    :param host: (str) optional, TCP host
+    :param port: (int) optional, TCP port
+    :param workers: (int) optional, number of worker processes
+    :param max_batch: (int) optional, number of ciphertexts per chunk and per coalesced batch
+    :param max_delay: (float) optional, the longest wait of a small request for others in seconds
+    :return: None
+    """
+    async with DecryptionServer(private_key, workers, max_batch, max_delay) as server:
+        if path is not None:
+            await server.start_unix(path)
+        if port is not None:
+            print(f"listening on {host}:{await server.start_tcp(host, port)}", file=sys.stderr)
+        await server.serve_forever()
+
+
+def main(arguments: [str] = None):
+    """Entry point of the command line interface.
+
+    :param arguments: (list[str]) optional, command line arguments (by default sys.argv)
+    :return: (int) exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m py_paillier.server", description=__doc__.splitlines()[0])
+    parser.add_argument("key", help="private key file in the JSON or binary format of py_paillier.serialization")
+    parser.add_argument("--unix", default=None, help="path of a Unix socket")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    parser.add_argument("--port", type=int, default=None, help="TCP port, 0 - any free port")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_CHUNK_SIZE, help="ciphertexts per batch")
+    parser.add_argument("--max-delay", type=float, default=DEFAULT_COALESCING_DELAY,
+                        help="the longest wait of a small request for others in seconds")
+    args = parser.parse_args(arguments)
+    if args.unix is None and args.port is None:
+        parser.error("one of --unix and --port is required")
+
+    with open(args.key, "rb") as file:
+        data = file.read()
+    if data.startswith(serialization.MAGIC):
+        private_key = serialization.from_bytes(data)
+    else:
+        private_key = serialization.loads(data.decode())
+    try:
+        asyncio.run(serve(private_key, args.unix, args.host, args.port, args.workers, args.max_batch, args.max_delay))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Streaming encryption and decryption for py_paillier.
+
+Numbers are read lazily from an iterable or a file, processed in chunks (optionally by a pool of processes
+with a bounded number of chunks in flight) and written incrementally, so memory does not depend on the
+input size. Binary ciphertext files use the EncryptedVector format and can be mapped by mmap.
+"""
+
+import csv
+from itertools import islice
+
+from py_paillier.parallel import DEFAULT_CHUNK_SIZE, decrypt_chunk, encrypt_chunk, stream_map
+from py_paillier.util import PlaintextError, check_plaintext
+from py_paillier.vector import VECTOR_FORMAT_VERSION, VECTOR_HEADER, VECTOR_MAGIC
+
+
+def iterate_chunks(digits, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Generator splitting an iterable into consecutive lists.
+
+    :param digits: iterable of (int)
+    :param chunk_size: (int) optional, maximum length of a chunk
+    :return: generator of (list[int]) chunks in input order
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}")
+    iterator = iter(digits)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def read_lines(file):
+    """Generator of numbers from a text file with one number per line (decimal, blank lines are skipped).
+
+    :param file: text file-like object
+    :return: generator of (int)
+    """
+    for line in file:
+        line = line.strip()
+        if line:
+            yield int(line)
+
+
+def read_csv_column(file, column=0, delimiter: str = ",", header: bool = False):
+    """Generator of numbers from one column of a CSV file.
+
+    :param file: text file-like object
+    :param column: (int or str) index of the column or its name (the name requires the header)
+    :param delimiter: (str) optional, CSV delimiter
+    :param header: (bool) optional, the first row is a header (always True when the column is a name)
+    :return: generator of (int)
+    :raises ValueError: if the named column is not in the header
+    """
+    reader = csv.reader(file, delimiter=delimiter)
+    if header or isinstance(column, str):
+        names = next(reader, [])
+        if isinstance(column, str):
+            if column not in names:
+                raise ValueError(f"Column {column!r} is not in the header {names}")
+            column = names.index(column)
+    for row in reader:
+        if row:
+            yield int(row[column])
+
+
+def read_records(file, width: int = None):
+    """Generator of numbers from a binary file of fixed-width big-endian records.
+    Without width the file should start with the EncryptedVector header, e.g. written by write_records.
+
+    :param file: binary file-like object
+    :param width: (int) optional, size of one record in bytes (None - read it from the header)
+    :return: generator of (int)
+    :raises ValueError: if the header is wrong or the file ends inside a record
+    """
+    if width is None:
+        header = file.read(VECTOR_HEADER.size)
+        if len(header) != VECTOR_HEADER.size:
+            raise ValueError(f"The file ends inside the header of {VECTOR_HEADER.size} bytes")
+        magic, version, width = VECTOR_HEADER.unpack(header)
+        if magic != VECTOR_MAGIC or version != VECTOR_FORMAT_VERSION or width < 1:
+            raise ValueError("File is not a serialized encrypted vector")
+    while True:
+        record = file.read(width)
+        if not record:
+            return
+        if len(record) != width:
+            raise ValueError(f"The file ends inside a record of {width} bytes")
+        yield int.from_bytes(record, "big")
+
+
+def write_lines(file, digits):
+    """Function for writing numbers to a text file, one number per line.
+
+    :param file: text file-like object
+    :param digits: iterable of (int)
+    :return: (int) number of written numbers
+    """
+    count = 0
+    for digit in digits:
+        file.write(f"{digit}\n")
+        count += 1
+    return count
+
+
+def write_records(file, digits, width: int, header: bool = True):
+    """Function for writing numbers to a binary file as fixed-width big-endian records.
+
+    :param file: binary file-like object
+    :param digits: iterable of (int)
+    :param width: (int) size of one record in bytes, e.g. PaillierPublicKey.ciphertext_width
+    :param header: (bool) optional, start with the EncryptedVector header (to read by EncryptedVector.from_buffer)
+    :return: (int) number of written numbers
+    """
+    if header:
+        file.write(VECTOR_HEADER.pack(VECTOR_MAGIC, VECTOR_FORMAT_VERSION, width))
+    count = 0
+    for digit in digits:
+        file.write(digit.to_bytes(width, "big"))
+        count += 1
+    return count
+
+
+def checked_chunks(digits, n: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Generator of chunks of unencrypted numbers checked to belong to Z_n.
+
+    :param digits: iterable of (int)
+    :param n: (int) as limit
+    :param chunk_size: (int) optional, maximum length of a chunk
+    :return: generator of (list[int]) chunks
+    :raises PlaintextError: with positions in the whole stream if some numbers do not belong to Z_n
+    """
+    offset = 0
+    for chunk in iterate_chunks(digits, chunk_size):
+        try:
+            check_plaintext(chunk, n)
+        except PlaintextError as error:
+            raise PlaintextError([offset + i for i in error.indices], error.digits, n) from None
+        offset += len(chunk)
+        yield chunk
+
+
+def encrypt_stream(
+        public_key,
+        digits,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = 1,
+        max_pending: int = None,
+        don_t_use_r: bool = False,
+        validate: bool = True
+):
+    """Generator encrypting numbers from an iterable (e.g. read_lines(file)) chunk by chunk.
+
+    :param public_key: PaillierPublicKey
+    :param digits: iterable of (int) unencrypted numbers
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+    :param don_t_use_r: (bool) optional, used for homomorphic encryption function
+    :param validate: (bool) optional, False skips checking the numbers for trusted inputs
+    :return: generator of (int) encrypted numbers in input order
+    :raises PlaintextError: if validate and some numbers do not belong to Z_n
+    """
+    if validate:
+        chunks = checked_chunks(digits, public_key.n, chunk_size)
+    else:
+        chunks = iterate_chunks(digits, chunk_size)
+    for encrypt_chunk_result in stream_map(public_key, encrypt_chunk, chunks, workers, max_pending, (don_t_use_r,)):
+        yield from encrypt_chunk_result
+
+
+def decrypt_stream(
+        private_key,
+        encrypt_digits,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = 1,
+        max_pending: int = None
+):
+    """Generator decrypting numbers from an iterable (e.g. read_records(file)) chunk by chunk.
+
+    :param private_key: PaillierPrivateKey
+    :param encrypt_digits: iterable of (int) encrypted numbers
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+    :return: generator of (int) decrypted numbers in input order
+    """
+    chunks = iterate_chunks(encrypt_digits, chunk_size)
+    for decrypt_chunk_result in stream_map(private_key, decrypt_chunk, chunks, workers, max_pending):
+        yield from decrypt_chunk_result
+
+
+def encrypt_file(public_key, source, sink, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                 max_pending: int = None):
+    """Function for encrypting a text file of numbers (one per line) into a binary file of ciphertexts.
+
+    :param public_key: PaillierPublicKey
+    :param source: text file-like object, read by read_lines
+    :param sink: binary file-like object, written by write_records with the header
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+    :return: (int) number of encrypted numbers
+    """
+    encrypt_digits = encrypt_stream(public_key, read_lines(source), chunk_size, workers, max_pending)
+    return write_records(sink, encrypt_digits, public_key.ciphertext_width)
+
+
+def decrypt_file(private_key, source, sink, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                 max_pending: int = None):
+    """Function for decrypting a binary file of ciphertexts into a text file of numbers (one per line).
+
+    :param private_key: PaillierPrivateKey
+    :param source: binary file-like object with the header, read by read_records
+    :param sink: text file-like object, written by write_lines
+    :param chunk_size: (int) optional, number of numbers per chunk
+    :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - inline)
+    :param max_pending: (int) optional, number of chunks in flight (by default 2 * workers)
+    :return: (int) number of decrypted numbers
+    """
+    return write_lines(sink, decrypt_stream(private_key, read_records(source), chunk_size, workers, max_pending))
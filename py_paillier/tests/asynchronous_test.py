@@ -0,0 +1,97 @@
+from py_paillier.asynchronous import decryption_coalescer, encryption_coalescer, map_chunks
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from py_paillier.util import PlaintextError
+from concurrent.futures import ThreadPoolExecutor
+from unittest import main, TestCase
+import asyncio
+import random
+import time
+
+
+class AsynchronousTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        self.plaintext = [random.randrange(self.public_key.n) for _ in range(100)]
+
+    def test_en_decrypt_async(self):
+        async def run():
+            encrypt_text = await self.public_key.encrypt_async(self.plaintext, chunk_size=16)
+            return await self.private_key.decrypt_async(encrypt_text, chunk_size=16)
+
+        self.assertEqual(self.plaintext, asyncio.run(run()))
+        with self.assertRaises(PlaintextError):
+            asyncio.run(self.public_key.encrypt_async([0, self.public_key.n]))
+
+    def test_homomorphic_async(self):
+        homomorphic = Homomorphic(self.public_key.n, self.public_key.g)
+        encrypt_text = self.public_key.encryption(self.plaintext)
+        weights = [random.randrange(10) for _ in range(100)]
+
+        async def run():
+            with ThreadPoolExecutor(2) as executor:
+                return await asyncio.gather(
+                    homomorphic.summation_async(encrypt_text, executor, 16),
+                    homomorphic.dot_product_async(encrypt_text, weights, executor, 16)
+                )
+
+        summation, dot_product = asyncio.run(run())
+        self.assertEqual(homomorphic.summation(encrypt_text), summation)
+        self.assertEqual(homomorphic.dot_product(encrypt_text, weights), dot_product)
+
+    def test_cancellation(self):
+        async def run():
+            with ThreadPoolExecutor(1) as executor:
+                task = asyncio.ensure_future(
+                    self.public_key.encrypt_async(self.plaintext * 100, executor, chunk_size=1)
+                )
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+
+    def test_chunks_in_flight_are_bounded(self):
+        taken, finished, in_flight = [], [], []
+
+        def chunks():
+            for i in range(40):
+                taken.append(i)
+                in_flight.append(len(taken) - len(finished))
+                yield [i]
+
+        def double(_key, chunk):
+            time.sleep(0.001)
+            finished.append(chunk)
+            return [2 * digit for digit in chunk]
+
+        async def run():
+            with ThreadPoolExecutor(4) as executor:
+                return await map_chunks(None, double, chunks(), executor, max_pending=3)
+
+        self.assertEqual([2 * i for i in range(40)], asyncio.run(run()))
+        self.assertLessEqual(max(in_flight), 3)
+
+    def test_coalescing(self):
+        encryption = encryption_coalescer(self.public_key, max_batch=32, max_delay=0.01)
+        decryption = decryption_coalescer(self.private_key, max_batch=32, max_delay=0.01)
+
+        async def round_trip(digits_list):
+            return await decryption.submit(await encryption.submit(digits_list))
+
+        async def run():
+            requests = [self.plaintext[i:i + 5] for i in range(0, 100, 5)] + [self.plaintext]
+            return requests, await asyncio.gather(*[round_trip(request) for request in requests])
+
+        requests, results = asyncio.run(run())
+        self.assertEqual(requests, results)
+        self.assertEqual(21, encryption.statistics["requests"])
+        self.assertLess(encryption.statistics["batches"], 21)
+
+        with self.assertRaises(PlaintextError):
+            asyncio.run(encryption.submit([self.public_key.n]))
+
+
+if __name__ == '__main__':
+    main()
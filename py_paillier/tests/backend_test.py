@@ -0,0 +1,68 @@
+from py_paillier import backend
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.util import Euclid, PrimeDigit
+from unittest import main, TestCase, skipIf
+
+
+class BackendTest(TestCase):
+
+    def check_backend(self, name: str):
+        previous = backend.set_backend(name)
+        self.addCleanup(backend.set_backend, previous.name)
+        self.assertEqual(name, backend.get_backend().name)
+
+        self.assertEqual(pow(7, 560, 561), backend.powmod(7, 560, 561))
+        self.assertEqual(1, (backend.invert(17, 3120) * 17) % 3120)
+        self.assertEqual(1, (backend.invert(3137, 3120) * 3137) % 3120)
+        with self.assertRaises(ZeroDivisionError):
+            backend.invert(6, 3120)
+        self.assertEqual(6, backend.gcd(12, 18))
+        self.assertTrue(backend.is_prime(2 ** 61 - 1))
+        self.assertFalse(backend.is_prime(2 ** 61 + 1))
+        self.assertEqual([2, 3, 5, 11, 101], [backend.next_prime(n) for n in (0, 2, 4, 7, 100)])
+
+        public_key, private_key = pkpg().paillier_key_pair_generation(128)
+        plaintext = [19025, 32145, 17900, 29522, 30085]
+        self.assertEqual(plaintext, private_key.decryption(public_key.encryption(plaintext)))
+
+    def test_python_backend(self):
+        self.check_backend("python")
+
+    @skipIf(backend.gmpy2 is None, "gmpy2 is not installed")
+    def test_gmpy2_backend(self):
+        self.check_backend("gmpy2")
+
+    def test_util_helpers_use_the_backend(self):
+        calls = []
+
+        class RecordingBackend(backend.PythonBackend):
+            name = "recording"
+
+            @staticmethod
+            def powmod(base: int, exponent: int, modulo: int):
+                calls.append("powmod")
+                return backend.PythonBackend.powmod(base, exponent, modulo)
+
+            @staticmethod
+            def gcd(a: int, b: int):
+                calls.append("gcd")
+                return backend.PythonBackend.gcd(a, b)
+
+        backend.BACKENDS[RecordingBackend.name] = RecordingBackend
+        self.addCleanup(backend.BACKENDS.pop, RecordingBackend.name)
+        previous = backend.set_backend(RecordingBackend.name)
+        self.addCleanup(backend.set_backend, previous.name)
+
+        self.assertEqual(6, Euclid().greatest_common_divisor(12, 18))
+        self.assertTrue(PrimeDigit().miller_rabin(2 ** 61 - 1, 2))
+        self.assertTrue(PrimeDigit().fermat_s_little_theorem(101))
+        self.assertEqual(1, Euclid().greatest_common_divisor(PrimeDigit().gen_mutually(3120), 3120))
+        self.assertEqual({"gcd", "powmod"}, set(calls))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            backend.set_backend("unknown")
+
+
+if __name__ == '__main__':
+    main()
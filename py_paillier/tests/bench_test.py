@@ -0,0 +1,50 @@
+from py_paillier import bench
+from py_paillier.bench import compare_reports, percentile, run_benchmarks
+from unittest import main, TestCase
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+
+class BenchTest(TestCase):
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(50, percentile(samples, 50))
+        self.assertEqual(99, percentile(samples, 99))
+        self.assertEqual(1, percentile([1], 90))
+
+    def test_run_benchmarks(self):
+        report = run_benchmarks([64], [2], 2, operations=["keygen", "encryption", "dot_product"])
+        self.assertEqual(["keygen", "encryption", "dot_product"], [result["name"] for result in report["results"]])
+        for result in report["results"]:
+            self.assertEqual(2, result["repeats"])
+            self.assertGreater(result["ops_per_second"], 0)
+            self.assertLessEqual(result["latency_ms"]["p50"], result["latency_ms"]["p99"])
+            self.assertGreaterEqual(result["peak_memory_bytes"], 0)
+
+    def test_compare_reports(self):
+        baseline = {"results": [{"name": "encryption", "bits": 64, "batch": 2, "ops_per_second": 100.0}]}
+        current = {"results": [{"name": "encryption", "bits": 64, "batch": 2, "ops_per_second": 80.0},
+                               {"name": "decryption", "bits": 64, "batch": 2, "ops_per_second": 80.0}]}
+        comparisons = compare_reports(baseline, current, 0.1)
+        self.assertEqual(1, len(comparisons))
+        self.assertAlmostEqual(0.8, comparisons[0]["ratio"])
+        self.assertTrue(comparisons[0]["regression"])
+        self.assertFalse(compare_reports(baseline, current, 0.3)[0]["regression"])
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(0, bench.main(["--bits", "64", "--batch", "2", "--repeats", "1",
+                                                "--operations", "encryption", "--output", path]))
+                with open(path) as file:
+                    self.assertEqual("encryption", json.load(file)["results"][0]["name"])
+                self.assertEqual(0, bench.main(["--compare", path, path]))
+
+
+if __name__ == '__main__':
+    main()
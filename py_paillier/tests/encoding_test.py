@@ -0,0 +1,93 @@
+from py_paillier import encoding
+from py_paillier.encoding import EncodedNumber, decode_array, encode_array, max_int
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from unittest import main, TestCase
+import random
+
+
+N = (2 ** 61 - 1) * (2 ** 31 - 1)
+
+
+class EncodedNumberTest(TestCase):
+
+    def test_signed_integers(self):
+        for scalar in [0, 1, -1, 12345, -12345, max_int(N), -max_int(N)]:
+            encoded = EncodedNumber.encode(N, scalar)
+            self.assertEqual(0, encoded.exponent)
+            self.assertTrue(0 <= encoded.encoding < N)
+            self.assertEqual(scalar, encoded.decode())
+        self.assertEqual(N - 1, EncodedNumber.encode(N, -1).encoding)
+
+    def test_floats(self):
+        for scalar in [0.5, -0.1, 3.141592653589793, 1e-10, -2.5e15, 123456.789]:
+            self.assertEqual(scalar, EncodedNumber.encode(N, scalar).decode())
+
+    def test_precision(self):
+        encoded = EncodedNumber.encode(N, 0.1, precision=1e-3)
+        self.assertEqual(-3, encoded.exponent)
+        self.assertAlmostEqual(0.1, encoded.decode(), delta=1e-3)
+
+    def test_decrease_exponent_to(self):
+        encoded = EncodedNumber.encode(N, -7).decrease_exponent_to(-2)
+        self.assertEqual(-2, encoded.exponent)
+        self.assertEqual(-7, encoded.decode())
+        with self.assertRaises(ValueError):
+            encoded.decrease_exponent_to(0)
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            EncodedNumber.encode(N, max_int(N) + 1)
+        with self.assertRaises(OverflowError):
+            EncodedNumber(N, N // 2, 0).decode()
+
+
+class ArrayEncodingTest(TestCase):
+
+    def test_floats(self):
+        values = [random.uniform(-1000, 1000) for _ in range(100)]
+        encodings, exponent = encode_array(N, values)
+        self.assertEqual([EncodedNumber(N, encoding, exponent).decode() for encoding in encodings],
+                         list(decode_array(N, encodings, exponent)))
+        for value, decoded in zip(values, decode_array(N, encodings, exponent)):
+            self.assertAlmostEqual(value, decoded, delta=16.0 ** exponent)
+
+    def test_integers_with_exponent(self):
+        encodings, exponent = encode_array(N, [-3, 0, 5], exponent=-1)
+        self.assertEqual(-1, exponent)
+        self.assertEqual([(-48) % N, 0, 80], encodings)
+
+    def test_without_numpy(self):
+        numpy = encoding.numpy
+        encoding.numpy = None
+        self.addCleanup(setattr, encoding, "numpy", numpy)
+
+        encodings, exponent = encode_array(N, [1.5, -2, 3])
+        self.assertEqual([1.5, -2.0, 3.0], decode_array(N, encodings, exponent))
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            encode_array(N, [1.0, float(N)])
+        with self.assertRaises(OverflowError):
+            decode_array(N, [0, N // 2], 0)
+
+
+class EncryptedEncodingTest(TestCase):
+
+    def test_addition_with_exponents(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(2 ** 61 - 1, 2 ** 31 - 1)
+        homomorphic = Homomorphic(public_key.n, public_key.g)
+
+        first, first_exponent = encode_array(public_key.n, [1, -2, 300])
+        second, second_exponent = encode_array(public_key.n, [0.25, 1.5, -0.125])
+        result, exponent = homomorphic.addition_with_exponents(
+            public_key.encryption(first), first_exponent, public_key.encryption(second), second_exponent
+        )
+
+        self.assertEqual(second_exponent, exponent)
+        self.assertEqual([1.25, -0.5, 299.875], list(decode_array(public_key.n, private_key.decryption(result), exponent)))
+        with self.assertRaises(ValueError):
+            homomorphic.decrease_exponent(result, exponent, exponent + 1)
+
+
+if __name__ == '__main__':
+    main()
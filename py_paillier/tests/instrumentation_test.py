@@ -0,0 +1,65 @@
+from py_paillier import instrumentation
+from py_paillier.instrumentation import Histogram, add_callback, instrumented, measure, profile, remove_callback
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from unittest import main, TestCase
+
+
+class HistogramTest(TestCase):
+
+    def test_percentile(self):
+        histogram = Histogram()
+        self.assertEqual(0.0, histogram.percentile(50))
+        for seconds in [1e-6] * 90 + [1e-3] * 10:
+            histogram.add(seconds)
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(1e-6, histogram.percentile(50))
+        self.assertEqual(1e-3, histogram.percentile(99))
+        self.assertAlmostEqual(1e-3, histogram.summary()["max"])
+
+
+class InstrumentationTest(TestCase):
+
+    def test_disabled(self):
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(measure("phase"), measure("other"))
+
+    def test_profile_of_crypto_operations(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        homomorphic = Homomorphic(public_key.n, public_key.g)
+
+        with profile() as result:
+            self.assertTrue(instrumentation.is_enabled())
+            encrypt_text = public_key.encryption([1, 2, 3])
+            private_key.decryption(homomorphic.addition(encrypt_text, encrypt_text))
+            pkpg().paillier_key_pair_generation(32)
+        self.assertFalse(instrumentation.is_enabled())
+
+        summary = result.summary()
+        self.assertEqual(3, summary["encryption"]["items"])
+        self.assertEqual(1, summary["encryption"]["count"])
+        self.assertEqual(3, summary["encryption.randomness"]["count"])
+        self.assertEqual(3, summary["encryption.modexp"]["count"])
+        self.assertEqual(3, summary["encryption.validation"]["items"])
+        self.assertEqual(3, summary["homomorphic.addition"]["items"])
+        self.assertEqual(3, summary["decryption"]["items"])
+        self.assertEqual(1, summary["keygen"]["count"])
+        self.assertGreaterEqual(summary["keygen.prime"]["count"], 2)
+        self.assertGreaterEqual(summary["keygen.candidates"]["items"], summary["keygen.primality_tests"]["items"])
+        self.assertIn("encryption.modexp", result.report())
+
+    def test_callback(self):
+        records = []
+        callback = add_callback(lambda name, seconds, items: records.append((name, items)))
+        self.addCleanup(remove_callback, callback)
+
+        @instrumented("work", "digits")
+        def work(digits, factor=1):
+            return [digit * factor for digit in digits]
+
+        self.assertEqual([2, 4], work(digits=[1, 2], factor=2))
+        instrumentation.count("events", 5)
+        self.assertEqual([("work", 2), ("events", 5)], records)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+from py_paillier.keyring import Keyring, key_fingerprint, key_memory
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from concurrent.futures import ThreadPoolExecutor
+from unittest import main, TestCase
+
+
+PRIMES = [(223, 211), (227, 229), (233, 239), (241, 251)]
+
+
+class KeyringTest(TestCase):
+
+    def setUp(self):
+        self.moduli = [p * q for p, q in PRIMES]
+
+    def test_hits_and_misses(self):
+        keyring = Keyring()
+        key = keyring.get(self.moduli[0])
+        self.assertIsInstance(key, Homomorphic)
+        self.assertEqual(self.moduli[0] ** 2, key.n_square)
+        self.assertIs(key, keyring.get(self.moduli[0]))
+        self.assertIs(key, keyring.find(key_fingerprint(self.moduli[0])))
+        self.assertIsNone(keyring.find(key_fingerprint(self.moduli[1])))
+
+        other_g = keyring.get(self.moduli[0], self.moduli[0] + 2)
+        self.assertIsNot(key, other_g)
+        self.assertEqual(1, len(keyring))
+
+        statistics = keyring.statistics()
+        self.assertEqual((1, 2, 0), (statistics["hits"], statistics["misses"], statistics["evictions"]))
+        self.assertEqual(key_memory(other_g), statistics["memory"])
+
+    def test_lru_eviction(self):
+        keyring = Keyring(max_keys=2)
+        first, second = keyring.get(self.moduli[0]), keyring.get(self.moduli[1])
+        keyring.get(self.moduli[0])
+        keyring.get(self.moduli[2])
+        self.assertIn(self.moduli[0], keyring)
+        self.assertNotIn(self.moduli[1], keyring)
+        self.assertEqual(1, keyring.evictions)
+        self.assertIs(first, keyring.get(self.moduli[0]))
+
+        keyring = Keyring(max_memory=2 * key_memory(first))
+        for n in self.moduli:
+            keyring.get(n)
+        self.assertEqual(2, len(keyring))
+        self.assertLessEqual(keyring.memory, keyring.max_memory)
+
+    def test_pools_of_removed_keys_are_stopped(self):
+        public_key, _ = pkpg().paillier_key_pair_generation_from_pq(*PRIMES[0])
+        keyring = Keyring(max_keys=1)
+        key = keyring.add(public_key)
+        pool = key.start_obfuscator_pool(4)
+        self.assertIs(key, keyring.get(public_key.n))
+        self.assertEqual(key_memory(key), keyring.memory)
+
+        keyring.get(self.moduli[1])
+        self.assertFalse(pool.is_running)
+        self.assertTrue(keyring.remove(self.moduli[1]))
+        self.assertFalse(keyring.remove(self.moduli[1]))
+        self.assertEqual(0, keyring.memory)
+
+    def test_eviction_while_encrypting(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(*PRIMES[0])
+        keyring = Keyring(max_keys=1)
+        key = keyring.add(public_key)
+        plaintext = list(range(20))
+        errors, decrypted = [], []
+
+        def encrypt():
+            try:
+                for _ in range(50):
+                    decrypted.append(private_key.decryption(key.encryption(plaintext)))
+            except Exception as error:
+                errors.append(error)
+
+        with ThreadPoolExecutor(3) as executor:
+            futures = [executor.submit(encrypt) for _ in range(2)]
+            for _ in range(50):
+                key.start_obfuscator_pool(4)
+                keyring.add(key)
+                keyring.get(self.moduli[1])
+            for future in futures:
+                future.result()
+
+        self.assertEqual([], errors)
+        self.assertEqual([plaintext] * 100, decrypted)
+        self.assertIsNone(key.obfuscator_pool)
+
+    def test_concurrent_lookups(self):
+        keyring = Keyring(max_keys=3)
+        with ThreadPoolExecutor(8) as executor:
+            keys = list(executor.map(lambda i: keyring.get(self.moduli[i % 4]), range(400)))
+        self.assertTrue(all(key.n == self.moduli[i % 4] for i, key in enumerate(keys)))
+
+        statistics = keyring.statistics()
+        self.assertEqual(400, statistics["hits"] + statistics["misses"])
+        self.assertEqual(3, statistics["keys"])
+        self.assertLessEqual(statistics["evictions"], statistics["misses"] - 3)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            Keyring(max_keys=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+from py_paillier.multiexp import batch_inversion, multi_exponentiation, pippenger, straus, tree_product
+from unittest import main, TestCase
+import random
+
+
+MODULO = (2 ** 127 - 1) * (2 ** 89 - 1)
+
+
+class MultiExponentiationTest(TestCase):
+
+    def test_tree_product(self):
+        for length in [0, 1, 2, 7, 64]:
+            digits = [random.randrange(MODULO) for _ in range(length)]
+            expected = 1
+            for digit in digits:
+                expected = (expected * digit) % MODULO
+            self.assertEqual(expected, tree_product(digits, MODULO))
+
+    def test_batch_inversion(self):
+        for length in [0, 1, 2, 33]:
+            digits = [random.randrange(1, MODULO) for _ in range(length)]
+            self.assertEqual([pow(digit, -1, MODULO) for digit in digits], batch_inversion(digits, MODULO))
+        with self.assertRaises(ZeroDivisionError):
+            batch_inversion([3, 2 ** 127 - 1, 5], MODULO)
+
+    def test_multi_exponentiation(self):
+        for length in [0, 1, 5, 63, 64, 200]:
+            bases = [random.randrange(MODULO) for _ in range(length)]
+            exponents = [random.randrange(2 ** random.randrange(80)) for _ in range(length)]
+            expected = 1
+            for base, exponent in zip(bases, exponents):
+                expected = (expected * pow(base, exponent, MODULO)) % MODULO
+
+            self.assertEqual(expected, straus(bases, exponents, MODULO))
+            self.assertEqual(expected, straus(bases, exponents, MODULO, 2))
+            self.assertEqual(expected, pippenger(bases, exponents, MODULO))
+            self.assertEqual(expected, pippenger(bases, exponents, MODULO, 3))
+            self.assertEqual(expected, multi_exponentiation(bases, exponents, MODULO))
+
+        with self.assertRaises(ValueError):
+            multi_exponentiation([1, 2], [1], MODULO)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+from py_paillier.packing import SlotPacking, packing_capacity, slot_bit_length
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from unittest import main, TestCase
+import random
+
+
+class PackingCapacityTest(TestCase):
+
+    def test_slot_bit_length(self):
+        self.assertEqual(32, slot_bit_length(32))
+        self.assertEqual(42, slot_bit_length(32, 1000))
+        self.assertEqual(50, slot_bit_length(32, 1000, 255))
+        with self.assertRaises(ValueError):
+            slot_bit_length(0)
+
+    def test_packing_capacity(self):
+        self.assertEqual(63, packing_capacity(2048, 32))
+        self.assertEqual(48, packing_capacity(2048, 32, 1000))
+        self.assertEqual(0, packing_capacity(16, 32))
+
+
+class SlotPackingTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(2 ** 61 - 1, 2 ** 31 - 1)
+        self.packing = SlotPacking(self.public_key.n, 8, additions=3, max_scalar=2)
+
+    def test_pack_unpack(self):
+        self.assertEqual(11, self.packing.slot_bits)
+        self.assertEqual(8, self.packing.slots)
+
+        values = [random.randrange(256) for _ in range(20)]
+        plaintext = self.packing.pack(values)
+        self.assertEqual(3, len(plaintext))
+        self.assertEqual(self.packing.packed_length(20), len(plaintext))
+        self.assertTrue(all(digit < self.public_key.n for digit in plaintext))
+        self.assertEqual(values, self.packing.unpack(plaintext, 20))
+        with self.assertRaises(ValueError):
+            self.packing.pack([256])
+
+    def test_homomorphic_slots(self):
+        homomorphic = Homomorphic(self.public_key.n, self.public_key.g)
+        first = [random.randrange(256) for _ in range(12)]
+        second = [random.randrange(256) for _ in range(12)]
+        third = [random.randrange(256) for _ in range(12)]
+
+        encrypt_text = homomorphic.addition(
+            self.packing.encryption(self.public_key, first), self.packing.encryption(self.public_key, second)
+        )
+        encrypt_text = self.packing.addition_of_plaintext(homomorphic, encrypt_text, third)
+        encrypt_text = homomorphic.multiplication_by_plaintext(encrypt_text, 2)
+
+        self.assertEqual(
+            [2 * (a + b + c) for a, b, c in zip(first, second, third)],
+            self.packing.decryption(self.private_key, encrypt_text, 12)
+        )
+
+    def test_too_wide_slot(self):
+        with self.assertRaises(ValueError):
+            SlotPacking(223 * 211, 32)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.parallel import split_into_chunks
+from py_paillier.util import PlaintextError
+from unittest import main, TestCase
+import random
+
+
+class BatchTest(TestCase):
+
+    def test_split_into_chunks(self):
+        self.assertEqual([[1, 2], [3, 4], [5]], split_into_chunks([1, 2, 3, 4, 5], 2))
+        self.assertEqual([], split_into_chunks([], 2))
+        with self.assertRaises(ValueError):
+            split_into_chunks([1], 0)
+
+    def test_en_decrypt_batch_in_processes(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        public_key.start_obfuscator_pool(4)
+
+        plaintext = [random.randrange(public_key.n) for _ in range(100)]
+        encrypt_text, statistics = public_key.encrypt_batch(plaintext, 2, 16, return_statistics=True)
+        self.assertEqual(100, statistics["items"])
+        self.assertEqual(7, statistics["chunks"])
+        self.assertEqual(2, statistics["workers"])
+
+        self.assertEqual(plaintext, private_key.decrypt_batch(encrypt_text, 2, 16))
+        self.assertEqual(public_key.encryption(plaintext, True), public_key.encrypt_batch(plaintext, 2, 16, True))
+        public_key.stop_obfuscator_pool()
+
+    def test_en_decrypt_batch_inline(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+
+        plaintext = [19025, 32145, 17900, 29522, 30085]
+        encrypt_text = public_key.encrypt_batch(plaintext, 1)
+        decrypt_text, statistics = private_key.decrypt_batch(encrypt_text, 1, return_statistics=True)
+
+        self.assertEqual(plaintext, decrypt_text)
+        self.assertEqual(1, statistics["workers"])
+        with self.assertRaises(PlaintextError):
+            public_key.encrypt_batch([public_key.n])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.pool import ObfuscatorPool
+from unittest import main, TestCase
+import time
+
+
+class ObfuscatorPoolTest(TestCase):
+
+    def test_fill_and_get(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        pool = ObfuscatorPool(public_key.generation_obfuscator, 4)
+
+        self.assertEqual(4, pool.fill())
+        self.assertEqual(0, pool.fill())
+        for _ in range(6):
+            obfuscator = pool.get()
+            self.assertTrue(0 < obfuscator < public_key.n_square)
+
+        statistics = pool.statistics()
+        self.assertEqual(0, statistics["size"])
+        self.assertEqual(4, statistics["high_water_mark"])
+        self.assertEqual(4, statistics["hits"])
+        self.assertEqual(2, statistics["misses"])
+
+    def test_background_producer(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+
+        pool = public_key.start_obfuscator_pool(8)
+        deadline = time.monotonic() + 5
+        while len(pool) < 8 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(8, len(pool))
+
+        plaintext = [19025, 32145, 17900, 29522, 30085]
+        self.assertEqual(plaintext, private_key.decryption(public_key.encryption(plaintext)))
+        self.assertGreaterEqual(pool.hits, 1)
+
+        public_key.stop_obfuscator_pool()
+        self.assertFalse(pool.is_running)
+        self.assertIsNone(public_key.obfuscator_pool)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            ObfuscatorPool(lambda: 1, 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+from py_paillier import backend
+from py_paillier.precompute import FixedBaseTable, table_size, window_for_memory
+from py_paillier.py_paillier import FIXED_BASE_TABLE_THRESHOLD, PaillierPrivateKey, PaillierPublicKey
+from unittest import main, TestCase
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import random
+
+
+MODULO = ((2 ** 61 - 1) * (2 ** 31 - 1)) ** 2
+
+
+class FixedBaseTableTest(TestCase):
+
+    def test_power(self):
+        base = random.randrange(MODULO)
+        for window in [1, 3, 8]:
+            table = FixedBaseTable(base, MODULO, 92, window)
+            for exponent in [0, 1, 2 ** 92 - 1, 2 ** 92, -1] + [random.randrange(2 ** 92) for _ in range(20)]:
+                self.assertEqual(pow(base, exponent, MODULO), table.power(exponent))
+
+    def test_python_backend_numbers(self):
+        previous = backend.set_backend("python")
+        self.addCleanup(backend.set_backend, previous.name)
+
+        table = FixedBaseTable(12345, MODULO, 92, 4)
+        self.assertEqual(pow(12345, 2 ** 91 + 7, MODULO), table.power(2 ** 91 + 7))
+
+    def test_memory_limit(self):
+        window = window_for_memory(2048, 512, 2 ** 20)
+        self.assertLessEqual(table_size(2048, window, 512), 2 ** 20)
+        self.assertGreater(table_size(2048, window + 1, 512), 2 ** 20)
+        self.assertLessEqual(FixedBaseTable(3, MODULO, 92, memory=2 ** 12).nbytes, 2 ** 12)
+        with self.assertRaises(ValueError):
+            FixedBaseTable(3, MODULO, 92, memory=10)
+
+
+class PublicKeyTableTest(TestCase):
+
+    def test_lazy_table_for_g(self):
+        p, q = 2 ** 61 - 1, 2 ** 31 - 1
+        public_key = PaillierPublicKey(p * q, p * q + 2)
+        private_key = PaillierPrivateKey(public_key, p, q)
+
+        plaintext = [random.randrange(public_key.n) for _ in range(FIXED_BASE_TABLE_THRESHOLD - 1)]
+        encrypt_text = public_key.encryption(plaintext, True)
+        self.assertIsNone(public_key.g_table)
+
+        encrypt_text += public_key.encryption([5, 6], True)
+        self.assertIsNotNone(public_key.g_table)
+        self.assertEqual([pow(public_key.g, digit, public_key.n_square) for digit in plaintext + [5, 6]], encrypt_text)
+        self.assertEqual(plaintext + [5, 6], private_key.decryption(encrypt_text))
+
+        public_key.g = public_key.n + 3
+        self.assertEqual(pow(public_key.g, 5, public_key.n_square), public_key.power_of_g(5))
+        self.assertIsNone(public_key.g_table)
+
+    def test_table_is_built_once_by_concurrent_threads(self):
+        p, q = 2 ** 61 - 1, 2 ** 31 - 1
+        public_key = PaillierPublicKey(p * q, p * q + 2)
+        builds = []
+        precompute_g_table = public_key.precompute_g_table
+        public_key.precompute_g_table = lambda: builds.append(1) or precompute_g_table(memory=10)
+
+        with ThreadPoolExecutor(8) as executor:
+            powers = list(executor.map(public_key.power_of_g, range(8 * FIXED_BASE_TABLE_THRESHOLD)))
+        self.assertEqual([pow(public_key.g, digit, public_key.n_square) for digit in range(len(powers))], powers)
+        # the table does not fit into the memory limit and is not tried again
+        self.assertEqual([1], builds)
+        self.assertIsNone(public_key.g_table)
+
+        del public_key.precompute_g_table
+        copy = pickle.loads(pickle.dumps(public_key))
+        self.assertEqual(pow(public_key.g, 7, public_key.n_square), copy.power_of_g(7))
+
+    def test_no_table_for_n_plus_1(self):
+        public_key = PaillierPublicKey(223 * 211)
+        self.assertIsNone(public_key.precompute_g_table())
+        self.assertIsNone(PaillierPublicKey(223 * 211, 3).precompute_g_table(memory=10))
+
+
+if __name__ == '__main__':
+    main()
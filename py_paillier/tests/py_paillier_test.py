@@ -1,6 +1,8 @@
 from py_paillier.py_paillier import PaillierPublicKey, PaillierPrivateKey, Homomorphic
 from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.util import PlaintextError
 from unittest import main, TestCase
+import random
 
 
 MIN_POWER = 1024
@@ -36,12 +38,32 @@ class PaillierKeyPairGenerationTest(TestCase):
             repr(public_key)
             repr(private_key)
 
+    def test_key_length(self):
+        for bit_key_length in [16, 64, 256]:
+            public_key, private_key, p, q = pkpg().paillier_key_pair_generation(bit_key_length, True)
+
+            self.assertEqual(bit_key_length, public_key.n.bit_length())
+            self.assertNotEqual(p, q)
+
+    def test_create_key_pair_in_parallel(self):
+        public_key, private_key, p, q = pkpg().paillier_key_pair_generation(256, True, parallel=True)
+
+        self.assertEqual(256, public_key.n.bit_length())
+        self.assertEqual(p * q, public_key.n)
+
     def test_public_key_constructor(self):
         for power in range(MIN_POWER, MAX_POWER):
             public_key, private_key = pkpg().paillier_key_pair_generation(power)
             public_key_from_static = PaillierPublicKey(public_key.n)
 
             self.assertEqual(public_key.n, public_key_from_static.n)
+            self.assertEqual(public_key.n + 1, public_key_from_static.g)
+
+    def test_public_key_constructor_with_g(self):
+        public_key = PaillierPublicKey(223 * 211, 12345)
+
+        self.assertEqual(12345, public_key.g)
+        self.assertEqual((223 * 211) ** 2, public_key.n_square)
 
     def test_private_key_constructor(self):
         for power in range(MIN_POWER, MAX_POWER):
@@ -62,12 +84,22 @@ class PaillierEnDecryptionTest(TestCase):
         self.assertEqual([plaintext_1], private_key.decryption(cipher_text_1))
 
         plaintext_2 = public_key.n
-        cipher_text_2 = public_key.encryption([plaintext_2])
-        self.assertEqual([], private_key.decryption(cipher_text_2))
+        with self.assertRaises(PlaintextError) as context:
+            public_key.encryption([plaintext_1, plaintext_2])
+        self.assertEqual([1], context.exception.indices)
 
         plaintext_3 = public_key.n + 1
-        cipher_text_3 = public_key.encryption([plaintext_3])
-        self.assertEqual([], private_key.decryption(cipher_text_3))
+        with self.assertRaises(PlaintextError) as context:
+            public_key.encryption([plaintext_3, -1, plaintext_1])
+        self.assertEqual([0, 1], context.exception.indices)
+        self.assertEqual([plaintext_3, -1], context.exception.digits)
+
+    def test_encryption_without_validation(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+
+        plaintext = [19025, 32145, 17900, 29522, 30085]
+        encrypt_text = public_key.encryption(plaintext, validate=False)
+        self.assertEqual(plaintext, private_key.decryption(encrypt_text))
 
     def test_en_decryption(self):
         public_key, private_key = pkpg().paillier_key_pair_generation(16)
@@ -87,6 +119,39 @@ class PaillierEnDecryptionTest(TestCase):
 
         self.assertEqual(plaintext, decrypt_text)
 
+    def test_encryption_in_residue_ring(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+
+        plaintext = [0, 1, 19025, 32145, public_key.n - 1]
+        encrypt_text = public_key.encryption(plaintext, True)
+        default_encrypt_text = [(public_key.g ** digit) % public_key.n_square for digit in plaintext]
+
+        self.assertEqual(default_encrypt_text, encrypt_text)
+
+    def test_en_decryption_with_g_equal_n_plus_1(self):
+        public_key = Homomorphic(223 * 211, 223 * 211 + 1)
+        private_key = PaillierPrivateKey(public_key, 223, 211)
+
+        plaintext = [0, 1, 19025, 32145, public_key.n - 1]
+        self.assertEqual(
+            [pow(public_key.g, digit, public_key.n_square) for digit in plaintext],
+            public_key.encryption(plaintext, True)
+        )
+        self.assertEqual(plaintext, private_key.decryption(public_key.encryption(plaintext)))
+
+    def test_crt_decryption_matches_lambda_decryption(self):
+        # (2 ** 61 - 1) and (2 ** 31 - 1) are Mersenne primes
+        for p, q in [(223, 211), (2 ** 61 - 1, 2 ** 31 - 1)]:
+            public_key, private_key = pkpg().paillier_key_pair_generation_from_pq(p, q)
+
+            plaintext = [0, 1, 19025, 32145, public_key.n - 1]
+            for encrypt_digit in public_key.encryption(plaintext):
+                self.assertEqual(
+                    private_key.raw_decryption_via_lambda(encrypt_digit),
+                    private_key.raw_decryption_via_crt(encrypt_digit)
+                )
+            self.assertEqual(plaintext, private_key.decryption(public_key.encryption(plaintext)))
+
 
 class HomomorphicTest(TestCase):
 
@@ -215,5 +280,140 @@ class HomomorphicTest(TestCase):
         self.assertEqual(default_multiple_plaintexts_to_k, decrypt_raising)
 
 
+class VectorizedHomomorphicTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        self.homomorphic = Homomorphic(self.public_key.n, self.public_key.g)
+        self.plaintext_1 = [20094, 25774, 16518, 18209, 22329]
+        self.plaintext_2 = [19025, 32145, 17900, 29522, 30085]
+        self.cipher_text_1 = self.public_key.encryption(self.plaintext_1)
+        self.cipher_text_2 = self.public_key.encryption(self.plaintext_2)
+
+    def decrypt(self, encrypt_text):
+        return self.private_key.decryption(encrypt_text)
+
+    def test_addition_with_broadcasting(self):
+        n = self.public_key.n
+        addition = self.homomorphic.addition(self.cipher_text_1, self.cipher_text_2)
+        self.assertEqual([(a + b) % n for a, b in zip(self.plaintext_1, self.plaintext_2)], self.decrypt(addition))
+
+        encrypt_digit = self.public_key.encryption([7])[0]
+        addition = self.homomorphic.addition(encrypt_digit, self.cipher_text_1)
+        self.assertEqual([(a + 7) % n for a in self.plaintext_1], self.decrypt(addition))
+
+        addition = self.homomorphic.addition(encrypt_digit, encrypt_digit)
+        self.assertEqual([14], self.decrypt([addition]))
+
+        with self.assertRaises(ValueError):
+            self.homomorphic.addition(self.cipher_text_1, self.cipher_text_2[:2])
+
+    def test_in_place_accumulation(self):
+        n = self.public_key.n
+        accumulator = self.public_key.encryption([0] * 5, as_vector=True)
+        for _ in range(3):
+            result = self.homomorphic.addition(accumulator, self.cipher_text_1, out=accumulator)
+            self.assertIs(accumulator, result)
+        self.assertEqual([(3 * a) % n for a in self.plaintext_1], self.decrypt(accumulator))
+
+        out = [0] * 5
+        self.homomorphic.addition_of_plaintext(self.cipher_text_1, 1, out=out)
+        self.assertEqual([(a + 1) % n for a in self.plaintext_1], self.decrypt(out))
+
+        with self.assertRaises(ValueError):
+            self.homomorphic.addition(self.cipher_text_1, self.cipher_text_2, out=[0])
+
+    def test_addition_of_plaintext_and_multiplication(self):
+        n = self.public_key.n
+        addition = self.homomorphic.addition_of_plaintext(self.cipher_text_1, self.plaintext_2)
+        self.assertEqual([(a + b) % n for a, b in zip(self.plaintext_1, self.plaintext_2)], self.decrypt(addition))
+
+        product = self.homomorphic.multiplication_by_plaintext(self.cipher_text_1, self.plaintext_2)
+        self.assertEqual([(a * b) % n for a, b in zip(self.plaintext_1, self.plaintext_2)], self.decrypt(product))
+
+        product = self.homomorphic.multiplication_by_plaintext(self.cipher_text_1, 18)
+        self.assertEqual(
+            self.decrypt(self.homomorphic.raising_the_ciphertext_to_the_k_power(self.cipher_text_1, 18)),
+            self.decrypt(product)
+        )
+
+    def test_subtraction_and_negation(self):
+        n = self.public_key.n
+        negation = self.homomorphic.negation(self.cipher_text_1)
+        self.assertEqual([-a % n for a in self.plaintext_1], self.decrypt(negation))
+        self.assertEqual([-a % n for a in self.plaintext_1[:1]],
+                         self.decrypt([self.homomorphic.negation(self.cipher_text_1[0])]))
+
+        subtraction = self.homomorphic.subtraction(self.cipher_text_1, self.cipher_text_2)
+        self.assertEqual([(a - b) % n for a, b in zip(self.plaintext_1, self.plaintext_2)], self.decrypt(subtraction))
+
+        vector = self.public_key.encryption(self.plaintext_2, as_vector=True)
+        self.homomorphic.subtraction(vector, self.cipher_text_1[0], out=vector)
+        self.assertEqual([(b - self.plaintext_1[0]) % n for b in self.plaintext_2], self.decrypt(vector))
+        self.assertEqual(
+            self.homomorphic.negation(vector),
+            self.homomorphic.negation(vector, workers=2, chunk_size=2)
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            self.homomorphic.negation([1, n])
+
+    def test_parallel_execution(self):
+        vector = self.public_key.encryption(self.plaintext_1, as_vector=True)
+        sequential = self.homomorphic.multiplication_by_plaintext(vector, self.plaintext_2)
+        parallel = self.homomorphic.multiplication_by_plaintext(vector, self.plaintext_2, workers=2, chunk_size=2)
+
+        self.assertEqual(sequential, parallel)
+
+
+class AggregationTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        self.homomorphic = Homomorphic(self.public_key.n, self.public_key.g)
+        self.plaintext = [random.randrange(1000) for _ in range(100)]
+        self.cipher_text = self.public_key.encryption(self.plaintext)
+
+    def decrypt(self, encrypt_digit):
+        return self.private_key.decryption([encrypt_digit])[0]
+
+    def test_summation(self):
+        n = self.public_key.n
+        self.assertEqual(sum(self.plaintext) % n, self.decrypt(self.homomorphic.summation(self.cipher_text)))
+        self.assertEqual(
+            sum(self.plaintext) % n,
+            self.decrypt(self.homomorphic.summation(self.cipher_text, workers=2, chunk_size=16))
+        )
+        self.assertEqual(0, self.decrypt(self.homomorphic.summation([])))
+
+    def test_dot_product(self):
+        n = self.public_key.n
+        for length in [5, 100]:
+            weights = [random.randrange(-100, 100) for _ in range(length)]
+            expected = sum(a * b for a, b in zip(self.plaintext, weights)) % n
+            self.assertEqual(
+                expected, self.decrypt(self.homomorphic.dot_product(self.cipher_text[:length], weights))
+            )
+        self.assertEqual(
+            expected, self.decrypt(self.homomorphic.dot_product(self.cipher_text, weights, workers=2, chunk_size=16))
+        )
+        with self.assertRaises(ValueError):
+            self.homomorphic.dot_product(self.cipher_text, weights[:-1])
+
+    def test_vector_matrix_product(self):
+        n = self.public_key.n
+        for rows in [5, 100]:
+            matrix = [[random.randrange(-50, 50) for _ in range(7)] for _ in range(rows)]
+            expected = [sum(self.plaintext[i] * matrix[i][j] for i in range(rows)) % n for j in range(7)]
+
+            product = self.homomorphic.vector_matrix_product(self.cipher_text[:rows], matrix)
+            self.assertEqual(expected, self.private_key.decryption(product))
+
+        product = self.homomorphic.vector_matrix_product(self.cipher_text, matrix, workers=2, chunk_size=2)
+        self.assertEqual(expected, self.private_key.decryption(product))
+        with self.assertRaises(ValueError):
+            self.homomorphic.vector_matrix_product(self.cipher_text, matrix[:-1])
+
+
 if __name__ == '__main__':
     main()
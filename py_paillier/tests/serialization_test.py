@@ -0,0 +1,74 @@
+from py_paillier import serialization
+from py_paillier.py_paillier import PaillierPrivateKey, PaillierPublicKey
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from unittest import main, TestCase
+import json
+
+
+class SerializationTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation(256)
+        self.plaintext = [19025, 32145, 17900, 29522, 30085]
+
+    def check_private_key(self, private_key: PaillierPrivateKey):
+        self.assertIsInstance(private_key, PaillierPrivateKey)
+        self.assertEqual(self.private_key.private_values(), private_key.private_values())
+        self.assertEqual(self.public_key.n, private_key.public_key.n)
+        self.assertEqual(self.plaintext, private_key.decryption(self.public_key.encryption(self.plaintext)))
+
+    def test_json_public_key(self):
+        for include_precomputed in [False, True]:
+            document = serialization.dumps(self.public_key, include_precomputed)
+            self.assertEqual(include_precomputed, "n_square" in json.loads(document))
+
+            public_key = serialization.loads(document)
+            self.assertIsInstance(public_key, PaillierPublicKey)
+            self.assertEqual((self.public_key.n, self.public_key.g, self.public_key.n_square),
+                             (public_key.n, public_key.g, public_key.n_square))
+
+    def test_json_private_key(self):
+        for include_precomputed in [False, True]:
+            self.check_private_key(serialization.loads(serialization.dumps(self.private_key, include_precomputed)))
+
+    def test_binary_keys(self):
+        for include_precomputed in [False, True]:
+            data = serialization.to_bytes(self.public_key, include_precomputed)
+            self.assertEqual(serialization.MAGIC, data[:3])
+            self.assertEqual(self.public_key.n, serialization.from_bytes(data).n)
+
+            data = serialization.to_bytes(self.private_key, include_precomputed)
+            self.check_private_key(serialization.from_bytes(memoryview(data)))
+
+    def test_precomputed_values_are_not_recalculated(self):
+        values = serialization.private_key_to_dict(self.private_key)
+        values["mu"] += 1
+        self.assertEqual(values["mu"], serialization.key_from_dict(values).mu)
+
+    def test_malformed_data(self):
+        data = serialization.to_bytes(self.private_key)
+        with self.assertRaises(ValueError):
+            serialization.from_bytes(b"XYZ" + data[3:])
+        with self.assertRaises(ValueError):
+            serialization.from_bytes(data[:3] + bytes([serialization.FORMAT_VERSION + 1]) + data[4:])
+        with self.assertRaises(ValueError):
+            serialization.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            serialization.from_bytes(data + b"\x00")
+
+        document = json.loads(serialization.dumps(self.public_key))
+        document["version"] = serialization.FORMAT_VERSION + 1
+        with self.assertRaises(ValueError):
+            serialization.loads(json.dumps(document))
+        document["version"] = serialization.FORMAT_VERSION
+        document["n"] = 12345
+        with self.assertRaises(ValueError):
+            serialization.loads(json.dumps(document))
+        with self.assertRaises(ValueError):
+            serialization.loads("[]")
+        with self.assertRaises(ValueError):
+            serialization.key_from_dict({"type": serialization.PRIVATE_KEY_TYPE, "n": 1, "g": 2})
+
+
+if __name__ == '__main__':
+    main()
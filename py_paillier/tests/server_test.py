@@ -0,0 +1,131 @@
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.server import DecryptionClient, DecryptionError, DecryptionServer, LocalDecryptionClient
+from py_paillier.server import ERROR_FRAME, REQUEST_FRAME, read_frame, write_frame
+from unittest import main, TestCase
+import asyncio
+import os
+import random
+import tempfile
+
+
+class DecryptionServerTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        self.plaintexts = [[random.randrange(self.public_key.n) for _ in range(length)] for length in [3, 5, 100]]
+        self.encrypt_texts = [self.public_key.encryption(plaintext) for plaintext in self.plaintexts]
+
+    def test_local_clients_are_coalesced(self):
+        async def run():
+            async with DecryptionServer(self.private_key, max_batch=16, max_delay=0.05) as server:
+                clients = [LocalDecryptionClient(server) for _ in self.encrypt_texts]
+                results = await asyncio.gather(*(
+                    client.decrypt(encrypt_text) for client, encrypt_text in zip(clients, self.encrypt_texts)
+                ))
+                return results, await clients[0].statistics()
+
+        results, statistics = asyncio.run(run())
+        self.assertEqual(self.plaintexts, results)
+        self.assertEqual(108, statistics["items"])
+        # 7 chunks of the large request and the two small requests, which share a batch
+        self.assertEqual(9, statistics["requests"])
+        self.assertLess(statistics["batches"], statistics["requests"])
+        self.assertEqual(0, statistics["queue_depth"])
+        self.assertGreaterEqual(statistics["max_queue_depth"], 100)
+        self.assertEqual(3, statistics["latency_ms"]["count"])
+
+    def test_unix_socket(self):
+        async def run(path):
+            async with DecryptionServer(self.private_key, max_batch=16) as server:
+                await server.start_unix(path)
+                async with await DecryptionClient.connect_unix(path, self.public_key.ciphertext_width) as client:
+                    chunks = [chunk async for chunk in client.decrypt_chunks(self.encrypt_texts[2])]
+                    small = await client.decrypt(self.encrypt_texts[0])
+                    empty = await client.decrypt([])
+                    return chunks, small, empty, await client.statistics()
+
+        with tempfile.TemporaryDirectory() as directory:
+            chunks, small, empty, statistics = asyncio.run(run(os.path.join(directory, "decryption.sock")))
+        self.assertEqual(7, len(chunks))
+        self.assertEqual(self.plaintexts[2], [digit for chunk in chunks for digit in chunk])
+        self.assertEqual(self.plaintexts[0], small)
+        self.assertEqual([], empty)
+        self.assertEqual(1, statistics["connections"])
+
+    def test_tcp_with_worker_processes(self):
+        async def run():
+            async with DecryptionServer(self.private_key, workers=2, max_batch=16) as server:
+                port = await server.start_tcp()
+                clients = [await DecryptionClient.connect_tcp(port, self.public_key.ciphertext_width)
+                           for _ in self.encrypt_texts]
+                try:
+                    return await asyncio.gather(*(
+                        client.decrypt(encrypt_text) for client, encrypt_text in zip(clients, self.encrypt_texts)
+                    ))
+                finally:
+                    for client in clients:
+                        await client.close()
+
+        self.assertEqual(self.plaintexts, asyncio.run(run()))
+
+    def test_request_left_early(self):
+        async def run(path):
+            async with DecryptionServer(self.private_key, max_batch=16) as server:
+                await server.start_unix(path)
+                async with await DecryptionClient.connect_unix(path, self.public_key.ciphertext_width) as client:
+                    chunks = client.decrypt_chunks(self.encrypt_texts[2])
+                    async for first in chunks:
+                        break
+                    await chunks.aclose()
+                    # the rest of the first request does not leak into the next one
+                    results = [first, await client.decrypt(self.encrypt_texts[0])]
+
+                    with self.assertRaises(KeyError):
+                        async for _ in client.decrypt_chunks(self.encrypt_texts[2]):
+                            raise KeyError("consumer error")
+                    results.append(await client.decrypt(self.encrypt_texts[1]))
+
+                    task = asyncio.ensure_future(client.decrypt(self.encrypt_texts[2] * 20))
+                    await asyncio.sleep(0.01)
+                    task.cancel()
+                    with self.assertRaises(asyncio.CancelledError):
+                        await task
+                    try:
+                        results.append(await client.decrypt(self.encrypt_texts[0]))
+                    except DecryptionError:
+                        # cancelled inside a frame, the connection was closed
+                        results.append(None)
+                    return results
+
+        with tempfile.TemporaryDirectory() as directory:
+            first, small, other, after_cancel = asyncio.run(run(os.path.join(directory, "decryption.sock")))
+        self.assertEqual(self.plaintexts[2][:16], first)
+        self.assertEqual(self.plaintexts[0], small)
+        self.assertEqual(self.plaintexts[1], other)
+        self.assertIn(after_cancel, [self.plaintexts[0], None])
+
+    def test_invalid_request(self):
+        async def run():
+            async with DecryptionServer(self.private_key) as server:
+                port = await server.start_tcp()
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                write_frame(writer, REQUEST_FRAME, b"not a vector")
+                await writer.drain()
+                frame = await read_frame(reader)
+                writer.close()
+                return frame
+
+        frame_type, payload = asyncio.run(run())
+        self.assertEqual(ERROR_FRAME, frame_type)
+        self.assertIn(b"vector", payload)
+
+        async def run_local():
+            async with DecryptionServer(self.private_key) as server:
+                await LocalDecryptionClient(server).decrypt(self.encrypt_texts[0] + [None])
+
+        with self.assertRaises(DecryptionError):
+            asyncio.run(run_local())
+
+
+if __name__ == '__main__':
+    main()
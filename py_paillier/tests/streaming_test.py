@@ -0,0 +1,73 @@
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.streaming import decrypt_file, encrypt_file, iterate_chunks, read_csv_column, read_lines
+from py_paillier.streaming import read_records, write_records
+from py_paillier.util import PlaintextError
+from py_paillier.vector import EncryptedVector
+from unittest import main, TestCase
+import io
+import itertools
+import random
+
+
+class StreamingTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+
+    def test_iterate_chunks(self):
+        self.assertEqual([[0, 1], [2, 3], [4]], list(iterate_chunks(range(5), 2)))
+        self.assertEqual([], list(iterate_chunks([], 2)))
+        with self.assertRaises(ValueError):
+            list(iterate_chunks([1], 0))
+
+    def test_readers(self):
+        self.assertEqual([1, 22, 333], list(read_lines(io.StringIO("1\n22\n\n333"))))
+        self.assertEqual([5, 6], list(read_csv_column(io.StringIO("id,value\n1,5\n2,6\n"), "value")))
+        self.assertEqual([1, 2], list(read_csv_column(io.StringIO("1;5\n2;6\n"), 0, ";")))
+        with self.assertRaises(ValueError):
+            list(read_csv_column(io.StringIO("id,value\n"), "other"))
+
+        buffer = io.BytesIO()
+        self.assertEqual(3, write_records(buffer, [1, 2 ** 16, 7], 3))
+        buffer.seek(0)
+        self.assertEqual([1, 2 ** 16, 7], list(read_records(buffer)))
+        with self.assertRaises(ValueError):
+            list(read_records(io.BytesIO(b"\x00" * 5), 3))
+        for data in [b"", buffer.getvalue()[:5]]:
+            with self.assertRaises(ValueError):
+                list(read_records(io.BytesIO(data)))
+
+    def test_stream_is_lazy(self):
+        plaintext = itertools.count()
+        encrypt_digits = self.public_key.encrypt_stream(plaintext, chunk_size=10)
+        decrypt_digits = self.private_key.decrypt_stream(encrypt_digits, chunk_size=10)
+        self.assertEqual(list(range(25)), list(itertools.islice(decrypt_digits, 25)))
+
+    def test_stream_in_processes(self):
+        plaintext = [random.randrange(self.public_key.n) for _ in range(100)]
+        encrypt_digits = self.public_key.encrypt_stream(iter(plaintext), 16, workers=2, max_pending=2)
+        self.assertEqual(plaintext, list(self.private_key.decrypt_stream(encrypt_digits, 16, workers=2)))
+
+    def test_plaintext_error_position(self):
+        plaintext = [1] * 25 + [self.public_key.n]
+        with self.assertRaises(PlaintextError) as context:
+            list(self.public_key.encrypt_stream(plaintext, chunk_size=10))
+        self.assertEqual([25], context.exception.indices)
+
+    def test_files(self):
+        plaintext = [random.randrange(self.public_key.n) for _ in range(50)]
+        source = io.StringIO("".join(f"{digit}\n" for digit in plaintext))
+        ciphertexts = io.BytesIO()
+        self.assertEqual(50, encrypt_file(self.public_key, source, ciphertexts, chunk_size=8))
+
+        vector = EncryptedVector.from_buffer(ciphertexts.getvalue())
+        self.assertEqual(plaintext, self.private_key.decryption(vector))
+
+        ciphertexts.seek(0)
+        sink = io.StringIO()
+        self.assertEqual(50, decrypt_file(self.private_key, ciphertexts, sink, chunk_size=8))
+        self.assertEqual(plaintext, list(read_lines(io.StringIO(sink.getvalue()))))
+
+
+if __name__ == '__main__':
+    main()
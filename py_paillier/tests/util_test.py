@@ -0,0 +1,139 @@
+from py_paillier import backend
+from py_paillier.py_paillier import PaillierKeyPairGenerator as pkpg
+from py_paillier.util import Euclid, PlaintextError, PrimeDigit, ReducedResidueSystem
+from py_paillier.util import calc_reduced_system_deductions, check_plaintext
+from unittest import main, TestCase, skipIf
+from math import gcd
+import itertools
+
+
+# Carmichael numbers pass the Fermat test for every coprime base
+CARMICHAEL_NUMBERS = [561, 1105, 1729, 2465, 2821, 6601, 8911, 41041, 825265, 321197185]
+
+
+class EuclidTest(TestCase):
+
+    def test_greatest_common_divisor(self):
+        self.assertEqual(6, Euclid().greatest_common_divisor(12, 18))
+        self.assertEqual(1, Euclid().greatest_common_divisor(2 ** 2048 - 1, 2 ** 2047))
+
+    def test_least_common_multiple(self):
+        self.assertEqual(36, Euclid().least_common_multiple(12, 18))
+        a, b = 2 ** 61 - 2, 2 ** 31 - 2
+        self.assertEqual(a * b // gcd(a, b), Euclid().least_common_multiple(a, b))
+
+    def test_reverse_digit(self):
+        for a, n in [(3, 11), (25, 11), (-4, 11), (2 ** 127 + 5, 2 ** 61 - 1), (1, 1)]:
+            self.assertEqual(pow(a, -1, n), Euclid().reverse_digit(a, n))
+        with self.assertRaises(ZeroDivisionError):
+            Euclid().reverse_digit(18, 12)
+
+
+class PrimeDigitTest(TestCase):
+
+    def test_is_probable_prime(self):
+        primes = set(PrimeDigit().sieve_of_eratosthenes(20000))
+        for digit in range(20000):
+            self.assertEqual(digit in primes, PrimeDigit().is_probable_prime(digit), digit)
+
+    def test_sieves(self):
+        primes = [digit for digit in range(2, 5000) if all(digit % d for d in range(2, int(digit ** 0.5) + 1))]
+        for n in [0, 1, 2, 3, 10, 97, 4999]:
+            expected = [prime for prime in primes if prime <= n]
+            self.assertEqual(expected, PrimeDigit().sieve_of_eratosthenes(n), n)
+            self.assertEqual(expected, PrimeDigit().segment_sieve_of_eratosthenes(n), n)
+
+        for start, stop in [(0, 5000), (2, 3), (100, 200), (1, 2), (999, 4999)]:
+            expected = [prime for prime in primes if start <= prime < stop]
+            self.assertEqual(expected, list(PrimeDigit().primes(start, stop, segment_size=7)))
+            self.assertEqual(expected, PrimeDigit().primes_in_range(start, stop, 1, 7))
+            self.assertEqual(expected, PrimeDigit().primes_in_range(start, stop, 2, 97))
+        self.assertEqual(664579, PrimeDigit().count_primes(10 ** 7))
+        self.assertEqual(len(primes), PrimeDigit().count_primes(5000, 2, 101))
+
+    def test_primes_is_lazy(self):
+        primes = PrimeDigit().primes(10 ** 12)
+        self.assertEqual([1000000000039, 1000000000061], [next(primes), next(primes)])
+
+    def test_trial_division(self):
+        self.assertTrue(PrimeDigit().trial_division(1999))
+        self.assertTrue(PrimeDigit().trial_division(2003 * 2011))
+        self.assertFalse(PrimeDigit().trial_division(1999 * 2003))
+        self.assertFalse(PrimeDigit().trial_division(6))
+
+    def test_carmichael_numbers_are_rejected(self):
+        for digit in CARMICHAEL_NUMBERS:
+            self.assertTrue(PrimeDigit().fermat_s_little_theorem(digit))
+            self.assertFalse(PrimeDigit().is_probable_prime(digit))
+
+    def test_generation_a_large_prime_by_sieve(self):
+        for bits in [3, 8, 16, 64, 256]:
+            for _ in range(10):
+                prime = PrimeDigit().generation_a_large_prime_by_sieve(bits)
+                self.assertEqual(bits, prime.bit_length())
+                self.assertEqual(3, prime >> (bits - 2))
+                self.assertTrue(PrimeDigit().is_probable_prime(prime))
+
+        with self.assertRaises(ValueError):
+            PrimeDigit().generation_a_large_prime_by_sieve(2)
+
+
+class ReducedResidueSystemTest(TestCase):
+
+    def test_small_moduli(self):
+        self.assertEqual([1, 2, 4, 5, 7, 8], calc_reduced_system_deductions(9))
+        for factorization in [{3: 1}, {2: 3}, {3: 2, 5: 1}, {41: 2, 59: 1}]:
+            system = ReducedResidueSystem(factorization)
+            units = calc_reduced_system_deductions(system.n)
+            self.assertEqual(len(units), system.totient)
+            self.assertEqual(units, list(system))
+            self.assertEqual(units, sorted(system.unit(i) for i in range(system.totient)))
+            self.assertTrue(all(unit in system for unit in system.sample(50)))
+        with self.assertRaises(IndexError):
+            ReducedResidueSystem({3: 1}).unit(2)
+
+    @skipIf(backend.gmpy2 is None, "gmpy2 is not installed")
+    def test_backend_numbers(self):
+        previous = backend.set_backend("gmpy2")
+        self.addCleanup(backend.set_backend, previous.name)
+
+        system = ReducedResidueSystem({3: 2, 5: 1})
+        self.assertIn(backend.to_number(7), system)
+        self.assertNotIn(backend.to_number(6), system)
+        self.assertNotIn(7.0, system)
+        self.assertNotIn(True, system)
+
+    def test_key_ciphertext_space(self):
+        public_key, private_key, p, q = pkpg().paillier_key_pair_generation(1024, return_pq=True)
+        system = private_key.reduced_residue_system(square=True)
+
+        self.assertEqual(public_key.n_square, system.n)
+        self.assertEqual(p * q * (p - 1) * (q - 1), system.totient)
+        self.assertTrue(all(encrypt_digit in system for encrypt_digit in public_key.encryption([1, 2, 3])))
+        self.assertNotIn(p, system)
+        self.assertNotIn(public_key.n_square, system)
+        self.assertEqual([1, 2, 3], list(itertools.islice(system, 3)))
+        self.assertIn(system.unit(system.totient - 1), system)
+        self.assertIn(system.random_unit(), system)
+        self.assertEqual(public_key.n, private_key.reduced_residue_system().n)
+
+
+class CheckPlaintextTest(TestCase):
+
+    def test_check_plaintext(self):
+        self.assertTrue(check_plaintext([0, 1, 9], 10))
+        self.assertTrue(check_plaintext([], 10))
+
+        with self.assertRaises(PlaintextError) as context:
+            check_plaintext([0, 10, 5, -1, 10], 10)
+        self.assertEqual([1, 3, 4], context.exception.indices)
+        self.assertEqual([10, -1, 10], context.exception.digits)
+        self.assertIsInstance(context.exception, ValueError)
+
+        with self.assertRaises(PlaintextError) as context:
+            check_plaintext([1, 2.0, "3", True, None, 4], 10)
+        self.assertEqual([1, 2, 3, 4], context.exception.indices)
+
+
+if __name__ == '__main__':
+    main()
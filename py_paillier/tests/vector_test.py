@@ -0,0 +1,159 @@
+from py_paillier.py_paillier import Homomorphic, PaillierKeyPairGenerator as pkpg
+from py_paillier.vector import EncryptedVector
+from unittest import main, TestCase
+import asyncio
+import mmap
+import pickle
+import tempfile
+
+
+class EncryptedVectorTest(TestCase):
+
+    def test_sequence(self):
+        vector = EncryptedVector.from_iterable([1, 2 ** 16 - 1, 0, 300], 2)
+
+        self.assertEqual(4, len(vector))
+        self.assertEqual(8, len(vector.buffer))
+        self.assertEqual([1, 65535, 0, 300], list(vector))
+        self.assertEqual(300, vector[-1])
+        self.assertEqual([65535, 0], vector[1:3].to_list())
+        self.assertEqual([1, 0], vector[::2].to_list())
+        with self.assertRaises(IndexError):
+            vector[4]
+
+        vector[2] = 7
+        vector.append(8)
+        self.assertEqual([1, 65535, 7, 300, 8], vector.to_list())
+        with self.assertRaises(OverflowError):
+            vector[0] = 2 ** 16
+        with self.assertRaises(ValueError):
+            EncryptedVector(2, b"abc")
+
+    def test_slice_then_append(self):
+        vector = EncryptedVector.from_iterable([1, 2, 3], 2)
+        head = vector[:2]
+        vector.append(4)
+        vector.extend([5, 6])
+        head.append(7)
+        vector[0] = 9
+        self.assertEqual([9, 2, 3, 4, 5, 6], vector.to_list())
+        self.assertEqual([1, 2, 7], head.to_list())
+
+    def test_zero_copy_reading(self):
+        vector = EncryptedVector.from_iterable(range(1000), 3)
+        data = vector.to_bytes()
+
+        view = EncryptedVector.from_buffer(data)
+        self.assertIsInstance(view.buffer, memoryview)
+        self.assertEqual(vector, view)
+        self.assertEqual(vector, pickle.loads(pickle.dumps(view)))
+
+        with tempfile.TemporaryFile() as file:
+            vector.write(file)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                mapped_vector = EncryptedVector.from_buffer(mapped)
+                self.assertEqual(list(range(1000)), mapped_vector.to_list())
+                del mapped_vector
+
+        with self.assertRaises(ValueError):
+            EncryptedVector.from_buffer(b"XYZ" + data[3:])
+        with self.assertRaises(TypeError):
+            view.append(1)
+
+    def test_en_decryption_and_homomorphic(self):
+        public_key, private_key = pkpg().paillier_key_pair_generation(256)
+        homomorphic = Homomorphic(public_key.n, public_key.g)
+
+        plaintext_1 = [20094, 25774, 16518, 18209, 22329]
+        plaintext_2 = [19025, 32145, 17900, 29522, 30085]
+        vector_1 = public_key.encryption(plaintext_1, as_vector=True)
+        vector_2 = EncryptedVector.from_buffer(public_key.encryption(plaintext_2, as_vector=True).to_bytes())
+
+        self.assertIsInstance(vector_1, EncryptedVector)
+        self.assertEqual(public_key.ciphertext_width, vector_1.width)
+        self.assertEqual(plaintext_1, private_key.decryption(vector_1))
+        self.assertEqual(plaintext_2, private_key.decrypt_batch(vector_2, 2, 2))
+
+        addition = homomorphic.addition_of_two_ciphertexts(vector_1, vector_2)
+        self.assertIsInstance(addition, EncryptedVector)
+        self.assertEqual([a + b for a, b in zip(plaintext_1, plaintext_2)], private_key.decryption(addition))
+
+        raising = homomorphic.raising_the_ciphertext_to_the_k_power(vector_1, 3)
+        self.assertEqual([3 * a for a in plaintext_1], private_key.decryption(raising))
+
+
+class LazyObfuscationTest(TestCase):
+
+    def setUp(self):
+        self.public_key, self.private_key = pkpg().paillier_key_pair_generation_from_pq(223, 211)
+        self.homomorphic = Homomorphic(self.public_key.n, self.public_key.g)
+        self.plaintext = [19025, 32145, 17900]
+
+    def test_chain_is_obfuscated_once(self):
+        vector = self.public_key.encryption(self.plaintext, as_vector=True, obfuscate=False)
+        self.assertFalse(vector.obfuscated)
+        self.assertEqual(self.public_key.encryption(self.plaintext, True, as_vector=True).buffer, vector.buffer)
+
+        result = self.homomorphic.multiplication_by_plaintext(self.homomorphic.addition(vector, vector), 3)
+        self.assertFalse(result.obfuscated)
+        self.assertFalse(result[1:].obfuscated)
+        deterministic = result.to_list()
+
+        serialized = result.to_bytes()
+        self.assertTrue(result.obfuscated)
+        self.assertNotEqual(deterministic, result.to_list())
+        self.assertEqual(
+            [6 * digit % self.public_key.n for digit in self.plaintext],
+            self.private_key.decryption(EncryptedVector.from_buffer(serialized))
+        )
+
+    def test_reductions_of_unobfuscated_vectors(self):
+        vector = self.public_key.encryption(self.plaintext, as_vector=True, obfuscate=False)
+        weights = [2, 3, 5]
+        total = sum(self.plaintext) % self.public_key.n
+        weighted = sum(w * digit for w, digit in zip(weights, self.plaintext)) % self.public_key.n
+
+        async def reductions():
+            return (await self.homomorphic.summation_async(vector, chunk_size=2),
+                    await self.homomorphic.dot_product_async(vector, weights, chunk_size=2))
+
+        synchronous = self.homomorphic.summation(vector), self.homomorphic.dot_product(vector, weights)
+        for summation, dot_product in [synchronous, asyncio.run(reductions())]:
+            self.assertNotEqual(self.public_key.raw_encryption(total), summation)
+            self.assertNotEqual(self.public_key.raw_encryption(weighted), dot_product)
+            self.assertEqual([total, weighted], self.private_key.decryption([summation, dot_product]))
+        self.assertFalse(vector.obfuscated)
+
+        product = self.homomorphic.vector_matrix_product(vector, [[w] for w in weights])
+        self.assertFalse(product.obfuscated)
+        serialized = EncryptedVector.from_buffer(product.to_bytes())
+        self.assertNotEqual([self.public_key.raw_encryption(weighted)], serialized.to_list())
+        self.assertEqual([weighted], self.private_key.decryption(product))
+
+    def test_obfuscated_operands(self):
+        vector = self.public_key.encryption(self.plaintext, as_vector=True)
+        self.assertTrue(vector.obfuscated)
+        self.assertTrue(self.homomorphic.addition(vector, vector).obfuscated)
+
+        out = EncryptedVector.zeros(3, vector.width)
+        lazy = self.public_key.encryption(self.plaintext, as_vector=True, obfuscate=False)
+        self.homomorphic.addition(vector, lazy, out)
+        self.assertFalse(out.obfuscated)
+
+    def test_re_randomization(self):
+        encrypt_text = self.public_key.encryption(self.plaintext, True)
+        obfuscated = self.public_key.obfuscate(encrypt_text)
+        self.assertNotEqual(encrypt_text, obfuscated)
+        self.assertEqual(self.plaintext, self.private_key.decryption(obfuscated))
+        self.assertEqual(self.plaintext[0], self.private_key.raw_decryption(self.public_key.obfuscate(encrypt_text[0])))
+
+        vector = EncryptedVector.from_buffer(self.public_key.encryption(self.plaintext, as_vector=True).to_bytes())
+        before = vector.to_list()
+        self.assertIs(vector, self.public_key.obfuscate(vector))
+        self.assertNotEqual(before, vector.to_list())
+        self.assertEqual(self.plaintext, self.private_key.decryption(vector))
+
+
+if __name__ == '__main__':
+    main()
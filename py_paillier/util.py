@@ -1,6 +1,24 @@
 """Help functions for py_paillier"""
 
+import math
+import os
 import random
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
+from numbers import Integral
+
+from py_paillier.instrumentation import count, measure
+
+DEFAULT_MILLER_RABIN_ROUNDS = 40
+DEFAULT_SIEVE_WINDOW = 4096
+SMALL_PRIMES_LIMIT = 2000
+# number of odd numbers (bytes) per segment of the segmented sieve
+DEFAULT_SEGMENT_SIZE = 2 ** 20
+
+# primes up to SMALL_PRIMES_LIMIT and their product, filled on the first call of PrimeDigit.small_primes
+_small_primes = []
+_small_primes_product = []
 
 
 class Euclid(object):
@@ -8,29 +26,15 @@ class Euclid(object):
 
     @staticmethod
     def greatest_common_divisor(a: int, b: int):
-        """Function wrapper for function gcd.
+        """The function of calculating the greatest common divisor by the current arithmetic backend.
+
         :param a: (int)
         :param b: (int)
         :return: (int) greatest common divisor
         """
-        def gcd(_a: int, _b: int):
-            """The function of calculating the greatest common divisor.
-
-            :param _a: (int)
-            :param _b: (int)
-            :return: (int) greatest common divisor
-            """
-            q = _a // _b
-            r = _a - _b * q
-            if r == 0:
-                return _b
-            else:
-                return gcd(_b, r)
-
-        if a < b:
-            a, b = b, a
-
-        return gcd(a, b)
+        # imported here, the backend module itself is built on this module
+        from py_paillier import backend
+        return backend.gcd(a, b)
 
     @staticmethod
     def least_common_multiple(a: int, b: int):
@@ -41,34 +45,167 @@ class Euclid(object):
         :return: (int) least common multiple
         """
         gsd_result = Euclid().greatest_common_divisor(a, b)
-        return int((a * b) / gsd_result)
+        return (a * b) // gsd_result
 
     @staticmethod
     def reverse_digit(a: int, n: int):
-        """The function of calculating the reverse digit (Unit [see [1]]) modulo n.
+        """The function of calculating the reverse digit (Unit [see [1]]) modulo n
+        by the extended Euclidean algorithm - see [2].
 
-        :param a: (int)
+        :param a: (int) any integer, also greater than n or negative
         :param n: (int) as modulo
-        :return: (int) reverse digit (Unit)
+        :return: (int) reverse digit (Unit) from [0, n)
+        :raises ZeroDivisionError: if a is not coprime with n
 
         Links:
             [1] - https://en.wikipedia.org/wiki/Unit_(ring_theory)
+            [2] - https://en.wikipedia.org/wiki/Extended_Euclidean_algorithm
+        """
+        r, next_r = n, a % n
+        x, next_x = 0, 1
+        while next_r:
+            q = r // next_r
+            r, next_r = next_r, r - q * next_r
+            x, next_x = next_x, x - q * next_x
+        if r != 1:
+            raise ZeroDivisionError(f"{a} is not invertible modulo {n}")
+        return x % n
+
+
+class PrimeDigit(object):
+
+    @staticmethod
+    def small_primes():
+        """Function for getting the cached table of primes up to SMALL_PRIMES_LIMIT used by trial division.
+
+        :return: (list[int]) primes up to SMALL_PRIMES_LIMIT
         """
+        if not _small_primes:
+            _small_primes.extend(PrimeDigit().sieve_of_eratosthenes(SMALL_PRIMES_LIMIT))
+            _small_primes_product.append(math.prod(_small_primes))
+        return _small_primes
+
+    @staticmethod
+    def trial_division(n: int):
+        """Function for checking that n has no factors among the small primes
+        by one gcd with the cached product of the small primes.
+
+        :param n: (int) digit for test
+        :return: (bool) no small factors or n is a small prime (True), n has a small factor (False)
+        """
+        small_primes = PrimeDigit().small_primes()
+        divisor = math.gcd(n, _small_primes_product[0])
+        if divisor == 1:
+            return True
+        return divisor == n <= SMALL_PRIMES_LIMIT and small_primes[bisect_left(small_primes, n)] == n
 
-        x, xx, y, yy = 1, 0, 0, 1
-        _max = max(a, n)
-        while n:
-            q = a // n
-            r = a % n
-            a, n = n, r
-            if r == 0:
-                return xx
+    @staticmethod
+    def miller_rabin(n: int, rounds: int = DEFAULT_MILLER_RABIN_ROUNDS):
+        """Miller-Rabin probabilistic primality test with random bases - see [1].
+        The probability of accepting a composite number is at most 4 ** -rounds.
+
+        :param n: (int) odd digit for test greater than 3
+        :param rounds: (int) optional, number of random bases
+        :return: (bool) probably prime (True) or composite (False)
+
+        Links:
+            [1] - https://en.wikipedia.org/wiki/Miller%E2%80%93Rabin_primality_test
+        """
+        from py_paillier.backend import powmod
+        d, s = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        for _ in range(rounds):
+            x = powmod(random.SystemRandom().randrange(2, n - 1), d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = powmod(x, 2, n)
+                if x == n - 1:
+                    break
             else:
-                x, xx = xx % _max, (x + xx * (_max - q)) % _max
-                y, yy = yy % _max, (y + yy * (_max - q)) % _max
+                return False
+        return True
+
+    @staticmethod
+    def is_probable_prime(n: int, rounds: int = DEFAULT_MILLER_RABIN_ROUNDS):
+        """Function for checking simplicity by trial division and the Miller-Rabin test.
 
+        :param n: (int) digit for test
+        :param rounds: (int) optional, number of Miller-Rabin rounds
+        :return: (bool) probably prime (True) or composite (False)
+        """
+        if n < 2:
+            return False
+        if not PrimeDigit().trial_division(n):
+            return False
+        if n <= SMALL_PRIMES_LIMIT:
+            return True
+        return PrimeDigit().miller_rabin(n, rounds)
 
-class PrimeDigit(object):
+    @staticmethod
+    def generation_a_large_prime_by_sieve(
+            n: int,
+            rounds: int = DEFAULT_MILLER_RABIN_ROUNDS,
+            primality_test=None,
+            window: int = DEFAULT_SIEVE_WINDOW
+    ):
+        """Large prime generation function by odd-only incremental search in a sieve window.
+        The two most significant bits are set, so the product of two such primes has exactly 2 * n bits.
+        Odd candidates after a random start are struck out by the small primes and only the survivors
+        are tested for simplicity.
+
+        :param n: (int) key length in bits, at least 3
+        :param rounds: (int) optional, number of Miller-Rabin rounds
+        :param primality_test: optional function (digit, rounds) -> bool, by default PrimeDigit.is_probable_prime
+        :param window: (int) optional, number of odd candidates per sieve window
+        :return: (int) large prime of n bits
+        """
+        if n < 3:
+            raise ValueError(f"The prime length must be at least 3 bits, got {n}")
+        if primality_test is None:
+            primality_test = PrimeDigit().is_probable_prime
+
+        down_limit = 2 ** (n - 1) + 2 ** (n - 2)
+        up_limit = 2 ** n
+        with measure("keygen.prime"):
+            return PrimeDigit.__search_in_sieve_windows(down_limit, up_limit, rounds, primality_test, window)
+
+    @staticmethod
+    def __search_in_sieve_windows(down_limit: int, up_limit: int, rounds: int, primality_test, window: int):
+        """Helper function of generation_a_large_prime_by_sieve searching random windows until a prime.
+
+        :param down_limit: (int) the smallest start of a window
+        :param up_limit: (int) the bound of candidates
+        :param rounds: (int) number of Miller-Rabin rounds
+        :param primality_test: function (digit, rounds) -> bool
+        :param window: (int) number of odd candidates per sieve window
+        :return: (int) large prime from [down_limit, up_limit)
+        """
+        while True:
+            start = random.SystemRandom().randrange(down_limit, up_limit) | 1
+            size = min(window, (up_limit - start + 1) // 2)
+
+            # window[i] corresponds to start + 2 * i
+            sieve = bytearray([1]) * size
+            end = start + 2 * (size - 1)
+            for prime in PrimeDigit().small_primes()[1:]:
+                if prime * prime > end:
+                    break
+                first = (-start * ((prime + 1) // 2)) % prime
+                sieve[first::prime] = bytes(len(range(first, size, prime)))
+
+            tests = 0
+            for i in range(size):
+                if sieve[i]:
+                    tests += 1
+                    if primality_test(start + 2 * i, rounds):
+                        count("keygen.candidates", i + 1)
+                        count("keygen.primality_tests", tests)
+                        return start + 2 * i
+            count("keygen.candidates", size)
+            count("keygen.primality_tests", tests)
 
     @staticmethod
     def fermat_s_little_theorem(n: int):
@@ -80,7 +217,8 @@ class PrimeDigit(object):
         Links:
             [1] - https://en.wikipedia.org/wiki/Fermat%27s_little_theorem
         """
-        if pow(2, n - 1, n) == 1:
+        from py_paillier.backend import powmod
+        if powmod(2, n - 1, n) == 1:
             return True
         else:
             return False
@@ -110,13 +248,7 @@ class PrimeDigit(object):
         :param n: (int) key length in bits
         :return: (int) large prime
         """
-        x = 4
-        while not PrimeDigit().fermat_s_little_theorem(x):
-            x = random.SystemRandom().randrange(
-                2 ** (n - 1),
-                2 ** n
-            )
-        return x
+        return PrimeDigit().generation_a_large_prime_by_sieve(n)
 
     @staticmethod
     def generating_a_large_prime_modulo(n: int):
@@ -132,7 +264,8 @@ class PrimeDigit(object):
 
     @staticmethod
     def sieve_of_eratosthenes(n: int):
-        """Function of finding all primes up to some integer n.
+        """Function of finding all primes up to some integer n by an odd-only bytearray sieve - see [1].
+        sieve[i] corresponds to 2 * i + 1, multiples of a prime are struck out by one slice assignment.
 
         :param n: (int) as limit
         :return: (list[int]) list of primes up to n
@@ -140,19 +273,146 @@ class PrimeDigit(object):
         Links:
             [1] - https://en.wikipedia.org/wiki/Sieve_of_Eratosthenes
         """
+        if n < 2:
+            return []
+        size = (n + 1) // 2
+        sieve = bytearray([1]) * size
+        sieve[0] = 0
+        for i in range(1, (math.isqrt(n) - 1) // 2 + 1):
+            if sieve[i]:
+                prime = 2 * i + 1
+                first = prime * prime // 2
+                sieve[first::prime] = bytes(len(range(first, size, prime)))
+        return [2] + [2 * i + 1 for i in compress(range(size), sieve)]
+
+    @staticmethod
+    def sieve_segment(low: int, high: int, base_primes: [int]):
+        """Function for sieving the odd numbers of [low, high) by the odd primes up to sqrt(high).
+
+        :param low: (int) odd start of the segment
+        :param high: (int) end of the segment (not included)
+        :param base_primes: (list[int]) odd primes in ascending order, at least up to sqrt(high)
+        :return: (bytearray) segment[i] is 1 if low + 2 * i is prime
+        """
+        size = max(0, (high - low + 1) // 2)
+        segment = bytearray([1]) * size
+        for prime in base_primes:
+            first = prime * prime
+            if first >= high:
+                break
+            if first < low:
+                first = (low + prime - 1) // prime * prime
+                if first % 2 == 0:
+                    first += prime
+            index = (first - low) // 2
+            segment[index::prime] = bytes(len(range(index, size, prime)))
+        if low == 1 and size:
+            segment[0] = 0
+        return segment
+
+    @staticmethod
+    def primes_of_segment(low: int, high: int, base_primes: [int]):
+        """Function for listing the odd primes of [low, high), used by parallel sieving.
+
+        :param low: (int) odd start of the segment
+        :param high: (int) end of the segment (not included)
+        :param base_primes: (list[int]) odd primes in ascending order, at least up to sqrt(high)
+        :return: (list[int]) primes in ascending order
+        """
+        segment = PrimeDigit.sieve_segment(low, high, base_primes)
+        return [low + 2 * i for i in compress(range(len(segment)), segment)]
+
+    @staticmethod
+    def count_of_segment(low: int, high: int, base_primes: [int]):
+        """Function for counting the odd primes of [low, high), used by parallel sieving.
+
+        :param low: (int) odd start of the segment
+        :param high: (int) end of the segment (not included)
+        :param base_primes: (list[int]) odd primes in ascending order, at least up to sqrt(high)
+        :return: (int) number of primes
+        """
+        return PrimeDigit.sieve_segment(low, high, base_primes).count(1)
+
+    @staticmethod
+    def primes(start: int = 2, stop: int = None, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        """Lazy generator of primes from [start, stop) in ascending order by a segmented sieve.
+        Memory is one segment of segment_size bytes and the base primes up to sqrt of its end.
+
+        :param start: (int) optional, the smallest candidate
+        :param stop: (int) optional, the bound of primes (None - infinite generator)
+        :param segment_size: (int) optional, number of odd numbers per segment
+        :return: generator of (int) primes
+        """
+        if start <= 2 and (stop is None or stop > 2):
+            yield 2
+        low = max(start, 3) | 1
+        base_limit = 0
+        base_primes = []
+        while stop is None or low < stop:
+            high = low + 2 * segment_size if stop is None else min(low + 2 * segment_size, stop)
+            if math.isqrt(high) > base_limit:
+                base_limit = max(math.isqrt(high), 2 * base_limit)
+                base_primes = PrimeDigit.sieve_of_eratosthenes(base_limit)[1:]
+            segment = PrimeDigit.sieve_segment(low, high, base_primes)
+            for i in compress(range(len(segment)), segment):
+                yield low + 2 * i
+            low += 2 * segment_size
+
+    @staticmethod
+    def __map_segments(function, start: int, stop: int, workers: int, segment_size: int):
+        """Helper function applying a segment function to the disjoint segments of [start, stop).
+
+        :param function: PrimeDigit.primes_of_segment or PrimeDigit.count_of_segment
+        :param start: (int) the smallest candidate
+        :param stop: (int) the bound of primes
+        :param workers: (int) number of processes (None - the number of CPUs, 1 - in the calling process)
+        :param segment_size: (int) number of odd numbers per segment
+        :return: list of the results per segment in ascending order
+        """
+        low = max(start, 3) | 1
+        lows = list(range(low, stop, 2 * segment_size))
+        highs = [min(low + 2 * segment_size, stop) for low in lows]
+        base_primes = PrimeDigit.sieve_of_eratosthenes(math.isqrt(stop))[1:]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1 or len(lows) < 2:
+            return list(map(function, lows, highs, repeat(base_primes)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                function, lows, highs, repeat(base_primes, len(lows)),
+                chunksize=max(1, len(lows) // (4 * workers))
+            ))
 
-        list_all_numbers = list(range(n + 1))
-        list_all_numbers[1] = 0
-        primes_list = []
-        i = 2
-        while i <= n:
-            if list_all_numbers[i] != 0:
-                primes_list.append(list_all_numbers[i])
-                for j in range(i, n + 1, i):
-                    list_all_numbers[j] = 0
-            i += 1
+    @staticmethod
+    def primes_in_range(start: int, stop: int, workers: int = 1, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        """Function for listing the primes of [start, stop), disjoint segments may be sieved in parallel.
+
+        :param start: (int) the smallest candidate
+        :param stop: (int) the bound of primes
+        :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - in the calling process)
+        :param segment_size: (int) optional, number of odd numbers per segment
+        :return: (list[int]) primes in ascending order
+        """
+        primes_list = [2] if start <= 2 < stop else []
+        for segment_primes in PrimeDigit.__map_segments(
+                PrimeDigit.primes_of_segment, start, stop, workers, segment_size
+        ):
+            primes_list.extend(segment_primes)
         return primes_list
 
+    @staticmethod
+    def count_primes(stop: int, workers: int = 1, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        """Function for counting the primes below stop without keeping them, segments may be sieved in parallel.
+
+        :param stop: (int) the bound of primes
+        :param workers: (int) optional, number of processes (None - the number of CPUs, 1 - in the calling process)
+        :param segment_size: (int) optional, number of odd numbers per segment
+        :return: (int) number of primes less than stop
+        """
+        if stop <= 2:
+            return 0
+        return 1 + sum(PrimeDigit.__map_segments(PrimeDigit.count_of_segment, 3, stop, workers, segment_size))
+
     @staticmethod
     def segment_sieve_of_eratosthenes(n: int):
         """Function of finding all prime numbers up to some integer n by segments.
@@ -163,66 +423,20 @@ class PrimeDigit(object):
         Links:
             [1] - https://en.wikipedia.org/wiki/Sieve_of_Eratosthenes
         """
-
-        def create_next_segment_as_bool_list(_n: int, _down_limit: int, _delta: int):
-            """
-
-            :param _n: (int) as limit
-            :param _down_limit: (int)
-            :param _delta: the difference between the down_limit and up_limit
-            :return: (list[bool]) - boolean list for less memory
-            """
-            if (_down_limit + _delta) > _n:
-                up_limit = _n
-            else:
-                up_limit = _down_limit + _delta
-            return list(True for _ in range(_down_limit, up_limit))
-
-        delta = 100000
-        down_limit = delta
-
-        list_all_numbers = list(range(delta))
-        list_all_numbers[1] = 1
-        primes_list = []
-        i = 2
-        while i < delta:
-            if list_all_numbers[i] != 0:
-                primes_list.append(list_all_numbers[i])
-                for j in range(i, delta, i):
-                    list_all_numbers[j] = 0
-            i += 1
-
-        while down_limit < n:
-            segment = create_next_segment_as_bool_list(n, down_limit, delta)
-
-            if (down_limit + delta) >= n:
-                last_segment_element = n - 1
-            else:
-                last_segment_element = down_limit + delta - 1
-
-            for prime in primes_list:
-                if pow(prime, 2) < last_segment_element:
-                    for index_element in range(len(segment) - 1):
-                        true_index = down_limit + index_element
-                        if true_index % prime == 0:
-                            for to_false_index in range(true_index, last_segment_element, true_index):
-                                segment[true_index - down_limit] = False
-
-            for index_element in range(len(segment) - 1):
-                if segment[index_element]:
-                    true_index = down_limit + index_element
-                    primes_list.append(true_index)
-
-            down_limit += delta
-
-        return primes_list
+        return list(PrimeDigit.primes(2, n + 1))
 
     @staticmethod
     def gen_mutually(n: int):
+        """Function for generating a random number from [n // 2, n) coprime with n.
+
+        :param n: (int) as modulo
+        :return: (int) random number coprime with n
+        """
+        from py_paillier.backend import gcd
         digit = random.SystemRandom().randrange(
             n // 2, n
         )
-        if Euclid().greatest_common_divisor(digit, n) != 1:
+        while gcd(digit, n) != 1:
             digit = random.SystemRandom().randrange(
                 n // 2, n
             )
@@ -234,38 +448,162 @@ class PrimeDigit(object):
 
 
 def calc_reduced_system_deductions(n: int):
-    """Function for calculating the reduced system of residues modulo n.
+    """Function for calculating the reduced system of residues modulo n by gcd checks.
+    It keeps all residues in memory, for large n with a known factorization use ReducedResidueSystem.
 
     :param n: (int) as modulo
     :return: (list[int]) list of numbers of the reduced system of residues modulo n
     """
+    return [a for a in range(n) if math.gcd(a, n) == 1]
+
+
+class ReducedResidueSystem(object):
+    """Reduced residue system (the units) modulo n with a known factorization - see [1].
+    Nothing is materialized: the totient is calculated from the factorization, units are enumerated lazily,
+    indexed and sampled through the Chinese remainder theorem (CRT) and membership is one gcd.
+
+    Args:
+        :arg factorization (dict): prime -> exponent \n
+        :arg n (int): as modulo, product of prime ** exponent \n
+
+    Links:
+        [1] - https://en.wikipedia.org/wiki/Reduced_residue_system
+    """
+
+    def __init__(self, factorization: dict):
+        """
+        :param factorization: (dict) prime -> positive exponent, e.g. {p: 2, q: 2} for n ** 2 of a key
+        """
+        self.factorization = dict(sorted(factorization.items()))
+        self.n = math.prod(prime ** exponent for prime, exponent in self.factorization.items())
+
+        # CRT constants: moduli p ** e and the coefficients of the recombination
+        self.__moduli = [prime ** exponent for prime, exponent in self.factorization.items()]
+        self.__coefficients = [
+            (self.n // modulo) * pow(self.n // modulo, -1, modulo) % self.n for modulo in self.__moduli
+        ]
+
+    @classmethod
+    def for_private_key(cls, private_key, square: bool = False):
+        """Function for making the system of a key: the plaintext units Z*_n or the ciphertext space Z*_n^2.
+
+        :param private_key: PaillierPrivateKey with known p and q
+        :param square: (bool) optional, modulo n ** 2 instead of n
+        :return: (ReducedResidueSystem)
+        """
+        values = private_key.private_values(include_precomputed=False)
+        exponent = 2 if square else 1
+        return cls({values["p"]: exponent, values["q"]: exponent})
+
+    def __repr__(self):
+        factors = " * ".join(f"{prime} ** {exponent}" for prime, exponent in self.factorization.items())
+        return f"<{self.__class__.__name__} modulo {factors}>"
+
+    @property
+    def totient(self):
+        """Euler's totient function of n, the number of units.
+
+        :return: (int) phi(n)
+        """
+        return math.prod(prime ** (exponent - 1) * (prime - 1) for prime, exponent in self.factorization.items())
+
+    def __contains__(self, a):
+        return isinstance(a, Integral) and not isinstance(a, bool) and 0 <= a < self.n and math.gcd(a, self.n) == 1
+
+    def __iter__(self):
+        return self.units()
+
+    def units(self, start: int = 0, stop: int = None):
+        """Lazy generator of units from [start, stop) in ascending order.
+
+        :param start: (int) optional, the smallest candidate
+        :param stop: (int) optional, the bound (by default n)
+        :return: generator of (int)
+        """
+        primes = list(self.factorization)
+        stop = self.n if stop is None else min(stop, self.n)
+        for a in range(max(start, 0), stop):
+            if all(a % prime for prime in primes):
+                yield a
+
+    def unit(self, index: int):
+        """Function for getting a unit by its index in CRT order: the index is split into the indices
+        of units modulo every prime ** exponent, which are recombined by CRT.
+
+        :param index: (int) from [0, totient)
+        :return: (int) unit, different indices give different units
+        :raises IndexError: if the index is out of [0, totient)
+        """
+        if not 0 <= index < self.totient:
+            raise IndexError("Reduced residue system index out of range")
+        residues = []
+        for prime, exponent in self.factorization.items():
+            index, local_index = divmod(index, prime ** (exponent - 1) * (prime - 1))
+            # the local_index-th number from [1, prime ** exponent) not divisible by prime
+            residues.append(local_index + local_index // (prime - 1) + 1)
+        return self.__combine(residues)
+
+    def random_unit(self):
+        """Function for choosing a uniformly random unit without rejection, by random units modulo
+        every prime ** exponent recombined by CRT.
+
+        :return: (int) unit
+        """
+        residues = []
+        for prime, exponent in self.factorization.items():
+            local_index = random.SystemRandom().randrange(prime ** (exponent - 1) * (prime - 1))
+            residues.append(local_index + local_index // (prime - 1) + 1)
+        return self.__combine(residues)
+
+    def sample(self, count: int):
+        """Lazy generator of independent uniformly random units.
+
+        :param count: (int) number of units
+        :return: generator of (int)
+        """
+        for _ in range(count):
+            yield self.random_unit()
+
+    def __combine(self, residues: [int]):
+        """Helper function for the CRT recombination.
+
+        :param residues: (list[int]) residues modulo every prime ** exponent
+        :return: (int) number modulo n
+        """
+        return sum(residue * coefficient for residue, coefficient in zip(residues, self.__coefficients)) % self.n
 
-    multiplicative_group = PrimeDigit().sieve_of_eratosthenes(n)
 
-    return multiplicative_group
+class PlaintextError(ValueError):
+    """Exception raised when numbers of a plaintext do not belong to Z_n.
+
+    Args:
+        :arg indices (list[int]): positions of the unsuitable numbers \n
+        :arg digits (list[int]): the unsuitable numbers \n
+        :arg n (int): as modulo \n
+    """
+
+    def __init__(self, indices: [int], digits: [int], n: int):
+        self.indices = indices
+        self.digits = digits
+        self.n = n
+        super().__init__(
+            f"The numbers {digits} at positions {indices} do not belong to the set Z_{n}, "
+            f"re-generate keys for more bits"
+        )
 
 
 def check_plaintext(plaintext_as_digits_list: [int], n: int):
-    """Function of checking the text for the possibility of encryption.
+    """Function of checking the text for the possibility of encryption in a single pass.
 
     :param plaintext_as_digits_list: (list[int]) - list of unencrypted numbers
     :param n: (int) as limit
-    :return: (bool) suitable text (True) or not (False)
+    :return: (bool) True if the text is suitable
+    :raises PlaintextError: if some numbers do not belong to Z_n or are not integers
     """
-    currently = True
-
-    unique_digits = list(set(plaintext_as_digits_list))
-    digits_not_in_n = []
-
-    for digit in unique_digits:
-        if digit not in range(n):
-            digits_not_in_n.append(digit)
-            currently = False
-
-    if not currently:
-        print(f"\nThe given numbers {digits_not_in_n} do not belong to the set  Z_{n}")
-        print("Re-generate keys for more bits.")
-        return False
-    else:
-        print("\nThe entered text has been successfully verified.")
-        return True
+    indices = [
+        i for i, digit in enumerate(plaintext_as_digits_list)
+        if not isinstance(digit, Integral) or isinstance(digit, bool) or not 0 <= digit < n
+    ]
+    if indices:
+        raise PlaintextError(indices, [plaintext_as_digits_list[i] for i in indices], n)
+    return True
@@ -0,0 +1,239 @@
+"""Compact container of encrypted numbers for py_paillier.
+
+Ciphertexts are stored as fixed-width big-endian integers in one contiguous buffer.
+Serialized form: VECTOR_MAGIC, version (1 byte), width in bytes (4 bytes, big-endian), then the ciphertexts.
+
+A vector may be unobfuscated: encrypted without r (or computed homomorphically from such a vector) and
+holding the public key whose obfuscators r ** n are multiplied in once by obfuscate(), at the latest
+when the vector is serialized by to_bytes or write.
+"""
+
+import struct
+
+VECTOR_MAGIC = b"PEV"
+VECTOR_FORMAT_VERSION = 1
+VECTOR_HEADER = struct.Struct(">3sBI")
+
+
+class EncryptedVector(object):
+    """Sequence of encrypted numbers of width bytes each kept in one buffer.
+
+    A bytearray buffer can grow (append, extend); any other buffer (bytes, memoryview, mmap)
+    is used through a memoryview without copying. Slices of a bytearray-backed vector are copies,
+    slices of any other vector are views of its buffer.
+
+    Args:
+        :arg width (int): size of one ciphertext in bytes \n
+        :arg buffer (bytearray or memoryview): ciphertexts one after another \n
+        :arg obfuscator_key (PaillierPublicKey or None): key to obfuscate the ciphertexts with, None if obfuscated \n
+    """
+
+    def __init__(self, width: int, buffer=None, obfuscator_key=None):
+        if width < 1:
+            raise ValueError(f"The width of a ciphertext must be positive, got {width}")
+        if buffer is None:
+            buffer = bytearray()
+        elif not isinstance(buffer, bytearray):
+            buffer = memoryview(buffer).cast("B")
+        if len(buffer) % width != 0:
+            raise ValueError(f"The buffer length {len(buffer)} is not a multiple of the width {width}")
+        self.width = width
+        self.buffer = buffer
+        self.obfuscator_key = obfuscator_key
+
+    @staticmethod
+    def width_for_modulo(n_square: int):
+        """Function for calculating the width of ciphertexts modulo n_square.
+
+        :param n_square: (int) as modulo
+        :return: (int) width in bytes
+        """
+        return (n_square.bit_length() + 7) // 8
+
+    @classmethod
+    def from_iterable(cls, encrypt_digits, width: int, obfuscator_key=None):
+        """Function for packing encrypted numbers into a new vector.
+
+        :param encrypt_digits: iterable of (int) encrypted numbers
+        :param width: (int) size of one ciphertext in bytes
+        :param obfuscator_key: (PaillierPublicKey) optional, key of unobfuscated numbers
+        :return: (EncryptedVector)
+        """
+        vector = cls(width, obfuscator_key=obfuscator_key)
+        vector.extend(encrypt_digits)
+        return vector
+
+    @classmethod
+    def zeros(cls, count: int, width: int):
+        """Function for allocating a vector of count zero ciphertexts to be filled by index.
+
+        :param count: (int) number of ciphertexts
+        :param width: (int) size of one ciphertext in bytes
+        :return: (EncryptedVector)
+        """
+        return cls(width, bytearray(count * width))
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Function for reading a vector serialized by to_bytes without copying the ciphertexts.
+
+        :param buffer: bytes, bytearray, memoryview or mmap
+        :return: (EncryptedVector) referring to the buffer
+        :raises ValueError: if the buffer is not a serialized vector
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < VECTOR_HEADER.size:
+            raise ValueError("Buffer is too short for an encrypted vector")
+        magic, version, width = VECTOR_HEADER.unpack_from(view)
+        if magic != VECTOR_MAGIC:
+            raise ValueError("Buffer is not a serialized encrypted vector")
+        if version != VECTOR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported encrypted vector format version {version}")
+        return cls(width, view[VECTOR_HEADER.size:])
+
+    def header(self):
+        """Function for making the header of the serialized form.
+
+        :return: (bytes)
+        """
+        return VECTOR_HEADER.pack(VECTOR_MAGIC, VECTOR_FORMAT_VERSION, self.width)
+
+    def to_bytes(self):
+        """Function for serializing the vector, obfuscating it first if needed.
+
+        :return: (bytes) header and ciphertexts
+        """
+        self.obfuscate()
+        return self.header() + bytes(self.buffer)
+
+    def write(self, file):
+        """Function for writing the serialized vector to a binary file, e.g. to map it later by mmap.
+        The vector is obfuscated first if needed.
+
+        :param file: binary file-like object
+        :return: (int) number of written bytes
+        """
+        self.obfuscate()
+        return file.write(self.header()) + file.write(self.buffer)
+
+    @property
+    def obfuscated(self):
+        """True if the ciphertexts do not wait for obfuscators.
+
+        :return: (bool)
+        """
+        return self.obfuscator_key is None
+
+    def obfuscate(self, public_key=None):
+        """Function for multiplying every ciphertext by a fresh obfuscator r ** n in place.
+        Without public_key only an unobfuscated vector is changed (by its obfuscator_key);
+        with public_key the ciphertexts are re-randomized in any case.
+        A read-only buffer (bytes, mmap) is copied into a bytearray first.
+
+        :param public_key: (PaillierPublicKey) optional, key to re-randomize with
+        :return: (EncryptedVector) self
+        """
+        public_key = public_key or self.obfuscator_key
+        if public_key is None:
+            return self
+        if isinstance(self.buffer, memoryview) and self.buffer.readonly:
+            self.buffer = bytearray(self.buffer)
+        n_square = public_key.n_square
+        for i, encrypt_digit in enumerate(self):
+            self[i] = (encrypt_digit * public_key.next_obfuscator()) % n_square
+        self.obfuscator_key = None
+        return self
+
+    def __len__(self):
+        return len(self.buffer) // self.width
+
+    def __offset(self, index: int):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Encrypted vector index out of range")
+        return index * self.width
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                view = memoryview(self.buffer)[start * self.width:max(start, stop) * self.width]
+                if isinstance(self.buffer, bytearray):
+                    # an exported view would block resizing (append, extend) of the parent buffer
+                    view = bytearray(view)
+                return EncryptedVector(self.width, view, self.obfuscator_key)
+            return EncryptedVector.from_iterable(
+                (self[i] for i in range(start, stop, step)), self.width, self.obfuscator_key
+            )
+        offset = self.__offset(index)
+        return int.from_bytes(self.buffer[offset:offset + self.width], "big")
+
+    def __setitem__(self, index: int, encrypt_digit: int):
+        offset = self.__offset(index)
+        self.buffer[offset:offset + self.width] = encrypt_digit.to_bytes(self.width, "big")
+
+    def __iter__(self):
+        width = self.width
+        buffer = self.buffer
+        for offset in range(0, len(buffer), width):
+            yield int.from_bytes(buffer[offset:offset + width], "big")
+
+    def __eq__(self, other):
+        if not isinstance(other, EncryptedVector):
+            return NotImplemented
+        return self.width == other.width and self.buffer == other.buffer
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # views of mmap or memoryview are copied when pickled
+        return self.__class__, (self.width, bytearray(self.buffer), self.obfuscator_key)
+
+    def __repr__(self):
+        state = "" if self.obfuscated else ", unobfuscated"
+        return f"<{self.__class__.__name__} of {len(self)} ciphertexts, {self.width} bytes each{state}>"
+
+    def append(self, encrypt_digit: int):
+        """Function for appending one encrypted number (only for a bytearray buffer).
+
+        :param encrypt_digit: (int) encrypted number
+        :return: None
+        """
+        self.extend([encrypt_digit])
+
+    def extend(self, encrypt_digits):
+        """Function for appending encrypted numbers (only for a bytearray buffer).
+
+        :param encrypt_digits: iterable of (int) encrypted numbers
+        :return: None
+        """
+        if not isinstance(self.buffer, bytearray):
+            raise TypeError("Only an encrypted vector over a bytearray can grow")
+        width = self.width
+        buffer = self.buffer
+        for encrypt_digit in encrypt_digits:
+            buffer += encrypt_digit.to_bytes(width, "big")
+
+    def to_list(self):
+        """Function for converting the vector to a list of numbers.
+
+        :return: (list[int]) encrypted numbers
+        """
+        return list(self)
+
+
+def obfuscate_reduction(encrypt_text, encrypt_digit: int):
+    """Function for obfuscating a number reduced from an encrypted text, e.g. its encrypted sum.
+    The reduction of an unobfuscated vector is deterministic and a single number cannot wait for obfuscators,
+    so it is multiplied by one obfuscator of the vector key; other inputs give the number as it is.
+
+    :param encrypt_text: (list [int] or EncryptedVector) reduced encrypted text
+    :param encrypt_digit: (int) encrypted result of the reduction
+    :return: (int) encrypted result
+    """
+    if isinstance(encrypt_text, EncryptedVector) and not encrypt_text.obfuscated:
+        public_key = encrypt_text.obfuscator_key
+        return (encrypt_digit * public_key.next_obfuscator()) % public_key.n_square
+    return encrypt_digit
@@ -13,6 +13,10 @@ setup(
     long_description_content_type='text/markdown',
     url="https://github.com/homo-paillier-cryprosystem/py-paillier/",
     packages=find_packages(),
+    extras_require={
+        "gmpy2": ["gmpy2>=2.1"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3.8",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",